@@ -0,0 +1,146 @@
+"""Database aggregates for grid footers and group summaries.
+
+Views declare ``aggregation_fields`` as ``{field: 'sum'}`` or
+``{field: ['min', 'max', 'avg']}``. All of them are computed over the filtered
+queryset with a single ``aggregate()`` query; names that are not model fields or
+annotations of the queryset are skipped.
+"""
+
+import hashlib
+import logging
+
+from django.core.cache import caches
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Avg, Count, Max, Min, Sum
+
+from django_jqgrid.invalidation import get_queryset_generation
+from django_jqgrid.utils import get_performance_setting, get_queryset_signature
+
+logger = logging.getLogger(__name__)
+
+AGGREGATE_FUNCTIONS = {
+    'sum': Sum,
+    'avg': Avg,
+    'min': Min,
+    'max': Max,
+    'count': Count,
+}
+
+
+def normalize_aggregation_fields(aggregation_fields):
+    """
+    Flatten ``aggregation_fields`` into a list of ``(field, function)`` pairs.
+
+    Raises:
+        ValueError: For functions not in AGGREGATE_FUNCTIONS
+    """
+    pairs = []
+    for field, functions in (aggregation_fields or {}).items():
+        if isinstance(functions, str):
+            functions = [functions]
+        for function in functions:
+            function = function.lower()
+            if function not in AGGREGATE_FUNCTIONS:
+                raise ValueError(
+                    f"Unknown aggregate '{function}' for '{field}'. "
+                    f"Choose from: {', '.join(AGGREGATE_FUNCTIONS)}"
+                )
+            pairs.append((field, function))
+    return pairs
+
+
+def is_aggregatable(queryset, field):
+    """Return True if ``field`` is an annotation of ``queryset`` or a (related) model field path."""
+    if field in queryset.query.annotations:
+        return True
+    model = queryset.model
+    for name in field.split('__'):
+        if model is None:
+            return False
+        try:
+            model = model._meta.get_field(name).related_model
+        except FieldDoesNotExist:
+            return False
+    return True
+
+
+def get_valid_aggregation_fields(queryset, aggregation_fields):
+    """
+    Return the entries of ``aggregation_fields`` that ``queryset`` can aggregate.
+
+    Names that are neither model fields nor annotations are skipped and logged,
+    so a stale declaration does not fail every list request.
+    """
+    valid = {}
+    for field, functions in (aggregation_fields or {}).items():
+        if is_aggregatable(queryset, field):
+            valid[field] = functions
+        else:
+            logger.warning(
+                "Skipping aggregation of '%s': not a field or annotation of %s",
+                field, queryset.model._meta.label
+            )
+    return valid
+
+
+def build_aggregate_expressions(aggregation_fields):
+    """Return ``{'<field>_<function>': expression}`` for ``aggregate()``/``annotate()``."""
+    return {
+        f"{field}_{function}": AGGREGATE_FUNCTIONS[function](field)
+        for field, function in normalize_aggregation_fields(aggregation_fields)
+    }
+
+
+def to_userdata(values, aggregation_fields):
+    """
+    Shape aggregate results for jqGrid's ``userdata``.
+
+    Every ``<field>_<function>`` value is kept, and ``<field>`` holds the first
+    declared function so ``userDataOnFooter`` can place it under its column.
+    """
+    userdata = dict(values)
+    for field, function in normalize_aggregation_fields(aggregation_fields):
+        userdata.setdefault(field, values.get(f"{field}_{function}"))
+    return userdata
+
+
+def get_aggregates_cache_key(queryset, aggregation_fields):
+    spec = repr(normalize_aggregation_fields(aggregation_fields))
+    return (
+        f"django_jqgrid_aggregates:{queryset.model._meta.label_lower}:{get_queryset_generation(queryset)}:"
+        f"{get_queryset_signature(queryset)}:{hashlib.md5(spec.encode('utf-8')).hexdigest()}"
+    )
+
+
+def compute_aggregates(queryset, aggregation_fields, timeout=None, cache_alias='default'):
+    """
+    Aggregate the filtered queryset in one query, cached per filter signature
+    and cache generation of the models read.
+
+    Args:
+        queryset: Filtered queryset of the grid
+        aggregation_fields: The view's ``aggregation_fields``
+        timeout: Cache timeout; defaults to ``AGGREGATE_CACHE_TIMEOUT`` (0 disables caching)
+
+    Returns:
+        ``userdata`` dictionary (see ``to_userdata``)
+    """
+    aggregation_fields = get_valid_aggregation_fields(queryset, aggregation_fields)
+    expressions = build_aggregate_expressions(aggregation_fields)
+    if not expressions:
+        return {}
+
+    if timeout is None:
+        timeout = get_performance_setting('AGGREGATE_CACHE_TIMEOUT', 60)
+    use_cache = bool(timeout) and get_performance_setting('ENABLE_CACHING', True)
+
+    cache = caches[cache_alias]
+    cache_key = get_aggregates_cache_key(queryset, aggregation_fields) if use_cache else None
+    values = cache.get(cache_key) if use_cache else None
+
+    if values is None:
+        values = queryset.order_by().aggregate(**expressions)
+        if use_cache:
+            cache.set(cache_key, values, timeout)
+
+    return to_userdata(values, aggregation_fields)
@@ -0,0 +1,183 @@
+"""Compiled jqGrid configuration cache.
+
+Configs produced by ``JqGridConfigMixin.jqgrid_config`` only change when code,
+models or settings change, so they are compiled once per viewset and kept in a
+process-local store. When ``JQGRID_PERFORMANCE['CONFIG_CACHE_BACKEND']`` names a
+Django cache alias, compiled configs are shared between processes through that
+backend as well.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+
+from django.core.cache import caches
+from django.core.serializers.json import DjangoJSONEncoder
+
+from django_jqgrid import __version__
+from django_jqgrid.utils import get_performance_setting
+
+logger = logging.getLogger(__name__)
+
+CONFIG_CACHE_PREFIX = 'django_jqgrid_config'
+
+_local_configs = {}
+_local_generations = {}
+_lock = threading.Lock()
+
+
+def _class_path(klass):
+    return f"{klass.__module__}.{klass.__qualname__}" if klass is not None else ''
+
+
+def _get_backend():
+    """Return the shared cache backend, or None when only the local store is used."""
+    alias = get_performance_setting('CONFIG_CACHE_BACKEND')
+    if not alias:
+        return None
+    return caches[alias]
+
+
+def is_config_cache_enabled():
+    """Return True when compiled configs should be cached."""
+    return get_performance_setting('ENABLE_CACHING', True)
+
+
+def get_config_fingerprint(viewset_class, serializer_class):
+    """
+    Build a fingerprint of everything a compiled config depends on.
+
+    The fingerprint covers the package version, the ``CONFIG_VERSION`` setting,
+    the viewset's ``jqgrid_config_version`` attribute and the model schema of
+    the serializer, so a deploy that changes any of them gets fresh configs.
+    """
+    parts = [
+        __version__,
+        str(get_performance_setting('CONFIG_VERSION', '')),
+        str(getattr(viewset_class, 'jqgrid_config_version', '')),
+        _class_path(serializer_class),
+    ]
+
+    model = getattr(getattr(serializer_class, 'Meta', None), 'model', None)
+    if model is not None:
+        parts.extend(
+            f"{field.name}:{field.__class__.__name__}"
+            for field in model._meta.get_fields()
+        )
+
+    return hashlib.md5('|'.join(parts).encode('utf-8')).hexdigest()
+
+
+def get_config_version():
+    """
+    Return the config version announced to browsers, which drop configs they
+    stored under another version: the package version and ``CONFIG_VERSION``.
+    """
+    return f"{__version__}:{get_performance_setting('CONFIG_VERSION', '')}"
+
+
+def compute_config_etag(config):
+    """Return a strong ETag for a config payload."""
+    payload = json.dumps(config, sort_keys=True, cls=DjangoJSONEncoder)
+    return '"%s"' % hashlib.md5(payload.encode('utf-8')).hexdigest()
+
+
+def _config_key_prefix(viewset_class, serializer_class=None):
+    prefix = f"{CONFIG_CACHE_PREFIX}:{_class_path(viewset_class)}:"
+    if serializer_class is not None:
+        prefix += f"{_class_path(serializer_class)}:"
+    return prefix
+
+
+def _generation_keys(viewset_class):
+    return [
+        f"{CONFIG_CACHE_PREFIX}:gen",
+        f"{CONFIG_CACHE_PREFIX}:gen:{_class_path(viewset_class)}",
+    ]
+
+
+def _get_generation(viewset_class, backend):
+    """Return the invalidation generation for a viewset class."""
+    keys = _generation_keys(viewset_class)
+    if backend is not None:
+        values = backend.get_many(keys)
+    else:
+        values = _local_generations
+    return ':'.join(str(values.get(key, 0)) for key in keys)
+
+
+def get_config_cache_key(viewset_class, serializer_class, backend=None):
+    """Build the cache key for a compiled viewset config."""
+    return ':'.join([
+        _config_key_prefix(viewset_class, serializer_class),
+        get_config_fingerprint(viewset_class, serializer_class),
+        _get_generation(viewset_class, backend),
+    ])
+
+
+def get_or_build_config(viewset_class, serializer_class, builder):
+    """
+    Return ``(config, etag)`` for a viewset, compiling it with ``builder`` on a miss.
+
+    Args:
+        viewset_class: The viewset class owning the config
+        serializer_class: Serializer class used to build the columns
+        builder: Callable returning the config payload
+
+    Returns:
+        Tuple of the config payload and its ETag
+    """
+    backend = _get_backend()
+    cache_key = get_config_cache_key(viewset_class, serializer_class, backend)
+
+    entry = _local_configs.get(cache_key)
+    if entry is not None:
+        return entry
+
+    if backend is not None:
+        entry = backend.get(cache_key)
+
+    if entry is None:
+        config = builder()
+        entry = (config, compute_config_etag(config))
+        if backend is not None:
+            backend.set(cache_key, entry, get_performance_setting('CACHE_TIMEOUT', 300))
+
+    with _lock:
+        # Drop entries compiled for an older fingerprint or generation
+        stale_prefix = _config_key_prefix(viewset_class, serializer_class)
+        for key in [k for k in _local_configs if k.startswith(stale_prefix)]:
+            del _local_configs[key]
+        _local_configs[cache_key] = entry
+
+    return entry
+
+
+def invalidate_config_cache(viewset_class=None):
+    """
+    Invalidate compiled configs.
+
+    Args:
+        viewset_class: Only invalidate this viewset; all grids when omitted
+    """
+    keys = _generation_keys(viewset_class)
+    key = keys[1] if viewset_class is not None else keys[0]
+
+    with _lock:
+        _local_generations[key] = _local_generations.get(key, 0) + 1
+        if viewset_class is None:
+            _local_configs.clear()
+        else:
+            prefix = _config_key_prefix(viewset_class)
+            for cache_key in [k for k in _local_configs if k.startswith(prefix)]:
+                del _local_configs[cache_key]
+
+    backend = _get_backend()
+    if backend is not None:
+        try:
+            backend.incr(key)
+        except ValueError:
+            backend.set(key, 1, None)
+
+    logger.debug("Invalidated jqGrid config cache for %s", _class_path(viewset_class) or 'all grids')
@@ -0,0 +1,37 @@
+"""Cache helpers for dropdown option lists served by ``JqGridDropdownMixin``.
+
+Option pages are cached per model, view, field, search term and page. Every key
+embeds the model's cache generation (see django_jqgrid.invalidation), so edits
+are visible on the next request without scanning the cache for stale pages.
+"""
+
+import hashlib
+import json
+import logging
+
+from django.core.cache import caches
+from django.core.serializers.json import DjangoJSONEncoder
+
+from django_jqgrid.invalidation import get_generation, register_model
+from django_jqgrid.utils import get_performance_setting
+
+logger = logging.getLogger(__name__)
+
+DROPDOWN_CACHE_PREFIX = 'django_jqgrid_dropdown'
+
+
+def get_dropdown_cache():
+    return caches[get_performance_setting('DROPDOWN_CACHE_BACKEND', 'default')]
+
+
+def get_dropdown_cache_key(model, parts):
+    """
+    Build the cache key of one option page.
+
+    Args:
+        model: Model the options are read from
+        parts: JSON serializable values identifying the page (view, field, term, page, ...)
+    """
+    register_model(model)
+    digest = hashlib.md5(json.dumps(parts, cls=DjangoJSONEncoder).encode('utf-8')).hexdigest()
+    return f"{DROPDOWN_CACHE_PREFIX}:{model._meta.label_lower}:{get_generation(model)}:{digest}"
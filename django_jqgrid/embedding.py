@@ -0,0 +1,163 @@
+"""Server-side resolution of grid configs for embedding them in pages.
+
+``jqgrid-core.js`` loads the config of a grid from
+``/api/<app_name>/<model_name>/jqgrid_config/``. The helpers here resolve the
+viewset behind that URL, run it the way DRF dispatches the ``jqgrid_config``
+action (authentication and permissions included) and return its compiled
+config, so pages can ship it with the HTML instead of a second round trip, or
+fetch the configs of all grids on a page in one bundle.
+"""
+
+import hashlib
+import logging
+
+from django.urls import Resolver404, resolve
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+from rest_framework.exceptions import APIException
+
+from django_jqgrid.invalidation import get_generation
+from django_jqgrid.models import GridFilter
+from django_jqgrid.renderers import JqGridJSONRenderer
+from django_jqgrid.saved_filters import empty_template_filters, get_template_filters_many
+from django_jqgrid.utils import get_content_type_cached
+
+logger = logging.getLogger(__name__)
+
+# Characters escaped so the JSON cannot close the script block or open a comment
+_SCRIPT_ESCAPES = ((b'<', b'\\u003C'), (b'>', b'\\u003E'), (b'&', b'\\u0026'))
+
+
+def get_grid_url(app_name, model_name):
+    """Return the API root of a grid as used by jqgrid-core.js"""
+    return f"/api/{app_name}/{model_name}/"
+
+
+def resolve_grid_viewset(app_name, model_name, url=None):
+    """
+    Return the viewset class serving a grid and its initkwargs.
+
+    Args:
+        app_name: App name passed to the grid
+        model_name: Model name passed to the grid
+        url: API root of the grid; defaults to ``/api/<app_name>/<model_name>/``
+
+    Returns:
+        Tuple ``(viewset_class, initkwargs, match)`` or None when the URL is not
+        served by a ``JqGridConfigMixin`` viewset
+    """
+    from django_jqgrid.mixins import JqGridConfigMixin
+
+    try:
+        match = resolve(url or get_grid_url(app_name, model_name))
+    except Resolver404:
+        return None
+
+    viewset_class = getattr(match.func, 'cls', None)
+    if not (isinstance(viewset_class, type) and issubclass(viewset_class, JqGridConfigMixin)):
+        return None
+    return viewset_class, getattr(match.func, 'initkwargs', None) or {}, match
+
+
+def get_grid_config(request, app_name, model_name, url=None):
+    """
+    Return the ``jqgrid_config`` payload and ETag of a grid for ``request``.
+
+    The viewset is set up like DRF does for the ``jqgrid_config`` action, and the
+    config is only returned when the request passes its authentication and
+    permission checks; it comes from the compiled config cache like the action's.
+
+    Returns:
+        Tuple ``(config, etag)`` or None when the grid cannot be resolved or the
+        request may not read it
+    """
+    resolved = resolve_grid_viewset(app_name, model_name, url)
+    if resolved is None:
+        logger.debug("No jqGrid viewset found for %s.%s", app_name, model_name)
+        return None
+    viewset_class, initkwargs, match = resolved
+
+    # The viewset authenticates the underlying HttpRequest with its own classes
+    request = getattr(request, '_request', request)
+    view = viewset_class(**initkwargs)
+    view.action_map = {'get': 'jqgrid_config'}
+    view.args, view.kwargs = match.args, match.kwargs
+    view.format_kwarg = None
+    view.headers = {}
+    try:
+        view.request = view.initialize_request(request, *match.args, **match.kwargs)
+        view.action = 'jqgrid_config'
+        view.check_permissions(view.request)
+        return view.get_jqgrid_config()
+    except APIException as e:
+        logger.debug("Not embedding the config of %s: %s", viewset_class.__name__, e)
+        return None
+
+
+def render_json_script(data, element_id):
+    """
+    Render ``data`` as a ``<script type="application/json">`` block, encoded
+    like grid responses and safe to place in HTML.
+    """
+    content = JqGridJSONRenderer().render(data)
+    for raw, escaped in _SCRIPT_ESCAPES:
+        content = content.replace(raw, escaped)
+    return format_html(
+        '<script id="{}" type="application/json">{}</script>', element_id, mark_safe(content.decode('utf-8'))
+    )
+
+
+def get_grid_configs(request, grids):
+    """
+    Resolve the configs of several grids in the calling thread; compiled configs
+    are served from the config cache, and building a miss is plain Python work
+    that threads would not speed up.
+
+    Args:
+        request: Request the configs are built for
+        grids: List of ``(app_name, model_name)`` tuples
+
+    Returns:
+        List of ``get_grid_config`` results in the order of ``grids``
+    """
+    return [get_grid_config(request, app_name, model_name) for app_name, model_name in grids]
+
+
+def get_grid_bundle(request, grids):
+    """
+    Return the configs and saved search templates of several grids.
+
+    Args:
+        request: Request the bundle is built for
+        grids: List of ``(app_name, model_name)`` tuples
+
+    Returns:
+        Tuple ``(bundle, etag)``; grids that cannot be resolved or read are
+        listed under ``missing``
+    """
+    configs = get_grid_configs(request, grids)
+    user = getattr(request, 'user', None)
+
+    content_types = {}
+    for (app_name, model_name), resolved in zip(grids, configs):
+        if resolved is not None:
+            content_types[(app_name, model_name)] = get_content_type_cached(app_name, model_name)
+    templates = get_template_filters_many([ct for ct in content_types.values() if ct is not None], user)
+
+    bundle = {'grids': {}, 'missing': []}
+    etags = []
+    for (app_name, model_name), resolved in zip(grids, configs):
+        name = f"{app_name}.{model_name}"
+        if resolved is None:
+            bundle['missing'].append(name)
+            continue
+        config, etag = resolved
+        content_type = content_types[(app_name, model_name)]
+        saved_filters = templates[content_type.pk] if content_type is not None else empty_template_filters()
+        bundle['grids'][name] = {'config': config, 'etag': etag, 'saved_filters': saved_filters}
+        etags.append(f"{name}:{etag}")
+
+    # Saved filters are per user: the generation and user id vary the bundle ETag too
+    user_id = user.pk if user is not None and user.is_authenticated else 'anon'
+    etags.append(f"{user_id}:{get_generation(GridFilter)}:{','.join(bundle['missing'])}")
+    return bundle, f'"{hashlib.md5("|".join(etags).encode("utf-8")).hexdigest()}"'
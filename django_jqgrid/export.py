@@ -0,0 +1,236 @@
+"""Streaming grid exports.
+
+Exports read rows with ``values_list()`` and ``iterator(chunk_size=...)`` and
+hand them to a writer that yields the encoded file piece by piece, so memory
+stays flat regardless of the number of exported rows.
+"""
+
+import csv
+import datetime
+import decimal
+import json
+import logging
+import tempfile
+
+from django.core.exceptions import FieldDoesNotExist
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+
+from django_jqgrid.utils import format_value_for_export, get_performance_setting
+
+try:
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    HAS_OPENPYXL = True
+except ImportError:
+    HAS_OPENPYXL = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXPORT_CHUNK_SIZE = 2000
+
+
+def get_export_chunk_size():
+    """Return the number of rows fetched per database round trip during exports."""
+    return get_performance_setting('EXPORT_CHUNK_SIZE', DEFAULT_EXPORT_CHUNK_SIZE)
+
+
+class ExportColumn:
+    """A colModel column that can be read with ``values_list()``."""
+
+    def __init__(self, name, label, lookup, model_field=None, options=None):
+        self.name = name
+        self.label = label
+        self.lookup = lookup
+        self.model_field = model_field
+        self.options = options or {}
+
+    def __repr__(self):
+        return f"<ExportColumn {self.name} ({self.lookup})>"
+
+
+def resolve_model_path(model, path):
+    """
+    Resolve a ``__`` separated lookup to a concrete model field.
+
+    Returns:
+        The final model field, or None when the path does not point to a single
+        concrete value (unknown names, many-to-many and reverse relations)
+    """
+    field = None
+    for part in path.split('__'):
+        if model is None:
+            return None
+        try:
+            field = model._meta.get_field(part)
+        except FieldDoesNotExist:
+            return None
+        if not getattr(field, 'concrete', False) or field.many_to_many:
+            return None
+        model = field.related_model
+    return field
+
+
+def get_export_columns(model, colmodel, requested=None):
+    """
+    Build the export columns from a grid colModel.
+
+    Args:
+        model: Model the grid is built on
+        colmodel: colModel entries from the grid config
+        requested: Optional list of column names to keep, in colModel order
+
+    Returns:
+        List of ExportColumn; columns without a database value (actions,
+        serializer methods, many-to-many relations) are skipped
+    """
+    columns = []
+    for col in colmodel:
+        name = col.get('name')
+        if not name or name == 'actions':
+            continue
+        if requested and name not in requested:
+            continue
+
+        for lookup in (col.get('index'), name):
+            model_field = resolve_model_path(model, lookup) if lookup else None
+            if model_field is not None:
+                columns.append(ExportColumn(name, col.get('label', name), lookup, model_field, col))
+                break
+        else:
+            logger.debug("Skipping export column %s: not a model field", name)
+
+    return columns
+
+
+class Echo:
+    """File-like object whose ``write`` returns the value, for streaming ``csv.writer``."""
+
+    def write(self, value):
+        return value
+
+
+class ExportWriter:
+    """
+    Base class for export writers.
+
+    Subclasses implement ``stream(columns, rows)`` yielding chunks of the file.
+    """
+    extension = None
+    content_type = 'application/octet-stream'
+    # False when an optional dependency of the writer is not installed
+    available = True
+
+    def stream(self, columns, rows):
+        raise NotImplementedError
+
+
+class CSVExportWriter(ExportWriter):
+    extension = 'csv'
+    content_type = 'text/csv'
+
+    def stream(self, columns, rows):
+        writer = csv.writer(Echo())
+        yield writer.writerow([column.label for column in columns])
+        for row in rows:
+            yield writer.writerow([format_value_for_export(value) for value in row])
+
+
+class JSONExportWriter(ExportWriter):
+    extension = 'json'
+    content_type = 'application/json'
+
+    def stream(self, columns, rows):
+        names = [column.name for column in columns]
+        encoder = DjangoJSONEncoder()
+        separator = '['
+        for row in rows:
+            yield separator + encoder.encode(dict(zip(names, row)))
+            separator = ','
+        yield ']' if separator == ',' else '[]'
+
+
+class XLSXExportWriter(ExportWriter):
+    """
+    Excel writer built on openpyxl's write-only workbook.
+
+    Rows are written as they are read and the workbook is saved to a spooled
+    temporary file that is streamed out in chunks. Cells keep their native type
+    (numbers, decimals, dates) based on the column's model field and colModel.
+    """
+    extension = 'xlsx'
+    content_type = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    available = HAS_OPENPYXL
+
+    sheet_title = 'Export'
+    # Bytes kept in memory before the spooled file rolls over to disk
+    spool_max_size = 10 * 1024 * 1024
+    # Bytes per streamed response chunk
+    stream_chunk_size = 64 * 1024
+
+    def get_number_format(self, column):
+        """Return an Excel number format for decimal columns, from colModel formatoptions"""
+        decimal_places = column.options.get('formatoptions', {}).get('decimalPlaces')
+        if decimal_places is None:
+            decimal_places = getattr(column.model_field, 'decimal_places', None)
+        if decimal_places is None:
+            return None
+        return '0.' + '0' * decimal_places if decimal_places else '0'
+
+    def get_converter(self, sheet, column):
+        """Return a callable turning a database value into a cell value for the column"""
+        field = column.model_field
+
+        if isinstance(field, models.DateTimeField):
+            def convert(value):
+                # Excel has no time zones: write the local wall-clock time
+                if value is not None and timezone.is_aware(value):
+                    value = timezone.make_naive(value)
+                return value
+            return convert
+
+        if isinstance(field, models.DecimalField):
+            number_format = self.get_number_format(column)
+            if number_format:
+                def convert(value):
+                    cell = WriteOnlyCell(sheet, value=value)
+                    cell.number_format = number_format
+                    return cell
+                return convert
+
+        return self.convert_value
+
+    def convert_value(self, value):
+        """Keep types Excel understands natively and serialize the rest"""
+        if value is None or isinstance(value, (
+                bool, int, float, decimal.Decimal, str, datetime.date, datetime.time)):
+            return value
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, cls=DjangoJSONEncoder)
+        return str(value)
+
+    def stream(self, columns, rows):
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet(title=self.sheet_title)
+        sheet.append([column.label for column in columns])
+
+        converters = [self.get_converter(sheet, column) for column in columns]
+        for row in rows:
+            sheet.append([convert(value) for convert, value in zip(converters, row)])
+
+        with tempfile.SpooledTemporaryFile(max_size=self.spool_max_size) as buffer:
+            workbook.save(buffer)
+            buffer.seek(0)
+            while True:
+                chunk = buffer.read(self.stream_chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+
+EXPORT_WRITERS = {
+    'csv': CSVExportWriter,
+    'json': JSONExportWriter,
+    'xlsx': XLSXExportWriter,
+}
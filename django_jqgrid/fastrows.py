@@ -0,0 +1,247 @@
+"""Serializer-free rendering of grid rows from ``values()``.
+
+Rendering thousands of rows per page through a ``ModelSerializer`` costs more
+than the query itself: every row becomes a model instance and every cell goes
+through ``get_attribute()`` and ``to_representation()``. ``build_fast_renderer``
+compiles the serializer fields shown by the grid into ``values()`` lookups and
+one formatter per column, so rows are built straight from dictionaries with the
+same output as the serializer.
+
+Columns the renderer cannot reproduce (method fields, nested serializers, file
+fields, properties) are listed in ``FastRowRenderer.unsupported``; views fall
+back to the serializer for those grids.
+"""
+
+import datetime
+import decimal
+import logging
+
+from django.core.exceptions import FieldDoesNotExist
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.fields import empty
+from rest_framework.settings import api_settings
+
+logger = logging.getLogger(__name__)
+
+# Fields that need the model instance or other rows to render
+UNSUPPORTED_FIELDS = (
+    serializers.SerializerMethodField,
+    serializers.ModelField,
+    serializers.FileField,
+    serializers.HyperlinkedRelatedField,
+    serializers.ManyRelatedField,
+    serializers.BaseSerializer,
+)
+
+
+def _identity(value):
+    return value
+
+
+def date_formatter(field):
+    output_format = getattr(field, 'format', api_settings.DATE_FORMAT)
+    if output_format is None:
+        return _identity
+    if output_format.lower() == ISO_8601:
+        return datetime.date.isoformat
+    return lambda value: value.strftime(output_format)
+
+
+def datetime_formatter(field):
+    """Format like DateTimeField.to_representation(), resolving the timezone once"""
+    output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+    if output_format is None:
+        return _identity
+    field_timezone = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+    iso = output_format.lower() == ISO_8601
+
+    def format_datetime(value):
+        if isinstance(value, str):
+            return value
+        if timezone.is_aware(value):
+            if field_timezone is not None:
+                value = value.astimezone(field_timezone)
+            else:
+                value = timezone.make_naive(value, datetime.timezone.utc)
+        elif field_timezone is not None:
+            value = field.enforce_timezone(value)
+        if not iso:
+            return value.strftime(output_format)
+        value = value.isoformat()
+        return value[:-6] + 'Z' if value.endswith('+00:00') else value
+
+    return format_datetime
+
+
+def decimal_formatter(field):
+    coerce_to_string = getattr(field, 'coerce_to_string', api_settings.COERCE_DECIMAL_TO_STRING)
+    if not coerce_to_string or field.localize or field.normalize_output or field.decimal_places is None:
+        return field.to_representation
+
+    quantum = decimal.Decimal('.1') ** field.decimal_places
+    context = decimal.getcontext().copy()
+    if field.max_digits is not None:
+        context.prec = field.max_digits
+    rounding = field.rounding
+
+    def format_decimal(value):
+        if not isinstance(value, decimal.Decimal):
+            value = decimal.Decimal(str(value).strip())
+        return f'{value.quantize(quantum, rounding=rounding, context=context):f}'
+
+    return format_decimal
+
+
+def choice_formatter(field):
+    choices = field.choice_strings_to_values
+    return lambda value: choices.get(str(value), value)
+
+
+def get_formatter(field):
+    """Return the callable rendering non-null values of ``field``"""
+    if isinstance(field, serializers.ChoiceField):
+        return choice_formatter(field)
+    if isinstance(field, serializers.DateTimeField):
+        return datetime_formatter(field)
+    if isinstance(field, serializers.DateField):
+        return date_formatter(field)
+    if isinstance(field, serializers.DecimalField):
+        return decimal_formatter(field)
+    if isinstance(field, serializers.PrimaryKeyRelatedField):
+        # values() returns the primary key itself
+        return field.pk_field.to_representation if field.pk_field is not None else _identity
+    if isinstance(field, (serializers.ReadOnlyField, serializers.SlugRelatedField)):
+        return _identity
+    if isinstance(field, serializers.CharField):
+        return str
+    if isinstance(field, serializers.IntegerField):
+        return int
+    if isinstance(field, serializers.FloatField):
+        return float
+    return field.to_representation
+
+
+class FastColumn:
+    """A rendered column: its ``values()`` lookup and formatter."""
+
+    def __init__(self, name, lookup, field, guard=None):
+        self.name = name
+        self.lookup = lookup
+        self.field = field
+        # Foreign key whose NULL means the serializer omits or nulls this column
+        self.guard = guard
+
+
+class FastRowRenderer:
+    """Renders ``values()`` rows with precompiled per-column formatters."""
+
+    def __init__(self):
+        self.columns = []
+        self.unsupported = []
+
+    @property
+    def lookups(self):
+        lookups = []
+        for column in self.columns:
+            for lookup in (column.lookup, column.guard):
+                if lookup is not None and lookup not in lookups:
+                    lookups.append(lookup)
+        return lookups
+
+    def render(self, rows):
+        """Return serializer-equivalent dictionaries for ``values()`` rows"""
+        # Formatters are compiled per call so the active timezone is honoured
+        columns = [
+            (column.name, column.lookup, get_formatter(column.field), column.guard,
+             column.field.allow_null)
+            for column in self.columns
+        ]
+        data = []
+        for row in rows:
+            item = {}
+            for name, lookup, formatter, guard, allow_null in columns:
+                if guard is not None and row[guard] is None:
+                    # A missing related row: the serializer skips the field
+                    if allow_null:
+                        item[name] = None
+                    continue
+                value = row[lookup]
+                item[name] = None if value is None else formatter(value)
+            data.append(item)
+        return data
+
+
+def resolve_column(model, field):
+    """
+    Resolve a serializer field to its ``values()`` lookup.
+
+    Returns:
+        ``(lookup, guard)``, or None when the source is not a model column path
+    """
+    if isinstance(field, UNSUPPORTED_FIELDS) or field.source == '*':
+        return None
+    if isinstance(field, serializers.RelatedField) and not isinstance(
+            field, (serializers.PrimaryKeyRelatedField, serializers.SlugRelatedField)):
+        return None
+
+    current_model = model
+    parts = []
+    guard = None
+    attrs = field.source_attrs
+    for index, attr in enumerate(attrs):
+        try:
+            model_field = current_model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            return None
+        if not getattr(model_field, 'concrete', False) or model_field.many_to_many:
+            return None
+        parts.append(attr)
+
+        is_last = index == len(attrs) - 1
+        if is_last:
+            break
+        if not (model_field.many_to_one or model_field.one_to_one) or attr == model_field.attname:
+            return None
+        if model_field.null and guard is None:
+            guard = '__'.join(parts)
+        current_model = model_field.related_model
+
+    is_relation = model_field.is_relation and attr != model_field.attname
+    if isinstance(field, serializers.PrimaryKeyRelatedField):
+        if not is_relation:
+            return None
+    elif isinstance(field, serializers.SlugRelatedField):
+        if not is_relation:
+            return None
+        parts.append(field.slug_field)
+    elif is_relation:
+        return None
+
+    if guard is not None and field.default is not empty:
+        return None
+    return '__'.join(parts), guard
+
+
+def build_fast_renderer(model, serializer, field_names=None):
+    """
+    Build the FastRowRenderer for rendering ``serializer`` over ``model`` rows.
+
+    Args:
+        model: Model of the listed queryset
+        serializer: Serializer instance whose output is reproduced
+        field_names: Serializer fields to render; defaults to all of them
+    """
+    renderer = FastRowRenderer()
+    for name, field in serializer.fields.items():
+        if field.write_only or (field_names is not None and name not in field_names):
+            continue
+        resolved = resolve_column(model, field)
+        if resolved is None:
+            renderer.unsupported.append(f"{name}: {type(field).__name__} does not read a model column")
+            continue
+        lookup, guard = resolved
+        renderer.columns.append(FastColumn(name, lookup, field, guard))
+
+    logger.debug("jqGrid fast rows for %s: %s", model._meta.label, renderer.lookups)
+    return renderer
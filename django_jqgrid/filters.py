@@ -1,19 +1,200 @@
 import json
 import logging
+import threading
+from collections import OrderedDict
 
 from django.core.exceptions import FieldDoesNotExist
-from django.db.models import Q
+from django.db.models import BooleanField, DateField, DateTimeField, FloatField, IntegerField, Q
+from django.utils.dateparse import parse_date, parse_datetime
 from rest_framework.filters import BaseFilterBackend
 
+from django_jqgrid.utils import get_performance_setting
+
 logger = logging.getLogger(__name__)
 
 
+def _cast_boolean(value):
+    return value.lower() in ['true', '1', 'yes', 'on']
+
+
+def _cast_date(value):
+    return parse_datetime(value) or parse_date(value)
+
+
+def _safe_caster(caster):
+    """Wrap a caster so values that cannot be cast are passed through unchanged."""
+    def cast(value):
+        try:
+            return caster(value)
+        except Exception:
+            # Return the original value if casting fails
+            return value
+    return cast
+
+
+def _identity(value):
+    return value
+
+
+class FieldResolver:
+    """
+    Resolves filter field names of one model to (model field, caster) pairs.
+
+    Each name is resolved once; the result is reused by every later request.
+    """
+
+    def __init__(self, backend, model):
+        self.backend = backend
+        self.model = model
+        self._resolved = {}
+
+    def resolve(self, field):
+        """Return (model field, caster) for a filter field name, or None if unknown."""
+        try:
+            return self._resolved[field]
+        except KeyError:
+            pass
+
+        try:
+            # Get the field object for type casting
+            field_obj = self.model._meta.get_field(field.split('__')[0])
+            resolved = (field_obj, self.backend.get_caster(field_obj))
+        except FieldDoesNotExist:
+            resolved = None
+
+        self._resolved[field] = resolved
+        return resolved
+
+
+class FilterPlan:
+    """
+    Compiled filter plan for one (model, allowed_filters, filter_mappings) combination:
+    the set of filterable fields plus the model's field resolver.
+    """
+
+    def __init__(self, resolver, allowed_fields, filter_mappings):
+        self.resolver = resolver
+        self.model = resolver.model
+        self.filter_mappings = filter_mappings
+        self.allowed = frozenset(allowed_fields) | frozenset(filter_mappings)
+
+    def is_allowed(self, field):
+        return field in self.allowed
+
+    def resolve(self, field):
+        return self.resolver.resolve(field)
+
+
+class LRUCache:
+    """Small thread-safe least-recently-used mapping."""
+
+    _missing = object()
+
+    def __init__(self, maxsize=512):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._data.get(key, self._missing)
+            if value is self._missing:
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
 class JqGridFilterBackend(BaseFilterBackend):
     """
     Custom filter backend for handling jqGrid filter requests.
     This enables advanced filtering directly from jqGrid filter toolbar and search dialog.
+
+    Filter plans (field resolvers and casters) are compiled once per grid and the
+    translation of a raw `filters` string into a Q object is memoized in a
+    bounded LRU cache (size set by JQGRID_PERFORMANCE['FILTER_CACHE_SIZE']).
     """
 
+    # Standard operator mappings
+    OPERATOR_SUFFIXES = {
+        "eq": "__exact",  # equals - fixed to use __exact
+        "ne": "__exact",  # not equals - fixed to use __exact
+        "lt": "__lt",  # less than
+        "le": "__lte",  # less than or equal
+        "gt": "__gt",  # greater than
+        "ge": "__gte",  # greater than or equal
+        "cn": "__icontains",  # contains
+        "nc": "__icontains",  # not contains
+        "bw": "__istartswith",  # begins with
+        "bn": "__istartswith",  # not begins with
+        "ew": "__iendswith",  # ends with
+        "en": "__iendswith",  # not ends with
+        "in": "__in",  # is in
+        "ni": "__in",  # is not in
+        "nu": "__isnull",  # is null
+        "nn": "__isnull"  # is not null
+    }
+    NEGATED_OPERATORS = frozenset(['ne', 'nc', 'bn', 'en', 'ni', 'nn'])
+
+    _plans = {}
+    _resolvers = {}
+    _plans_lock = threading.Lock()
+    _query_cache = None
+
+    @classmethod
+    def get_query_cache(cls):
+        if cls._query_cache is None:
+            cls._query_cache = LRUCache(get_performance_setting('FILTER_CACHE_SIZE', 512))
+        return cls._query_cache
+
+    @classmethod
+    def clear_caches(cls):
+        """Drop compiled filter plans and memoized Q objects."""
+        with cls._plans_lock:
+            cls._plans.clear()
+            cls._resolvers.clear()
+        cls.get_query_cache().clear()
+
+    def get_plan_key(self, model, allowed_fields, filter_mappings):
+        return (
+            type(self),
+            model,
+            tuple(sorted(allowed_fields)),
+            tuple(sorted((str(k), str(v)) for k, v in filter_mappings.items())),
+        )
+
+    def get_field_resolver(self, model):
+        """Return the shared FieldResolver for a model."""
+        key = (type(self), model)
+        resolver = self._resolvers.get(key)
+        if resolver is None:
+            with self._plans_lock:
+                resolver = self._resolvers.setdefault(key, FieldResolver(self, model))
+        return resolver
+
+    def get_filter_plan(self, model, allowed_fields, filter_mappings):
+        """Return the compiled FilterPlan for a grid, building it on first use."""
+        key = self.get_plan_key(model, allowed_fields, filter_mappings)
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = FilterPlan(self.get_field_resolver(model), allowed_fields, filter_mappings)
+            with self._plans_lock:
+                plan = self._plans.setdefault(key, plan)
+        return plan
+
     def filter_queryset(self, request, queryset, view):
         # Get filter parameters from request
         filters = request.query_params.get('filters', None)
@@ -24,15 +205,7 @@ class JqGridFilterBackend(BaseFilterBackend):
             return queryset
 
         try:
-            # Parse the filters string into JSON
-            filters_dict = json.loads(filters)
-            allowed_fields = getattr(view, 'allowed_filters', [])
-
-            # Build the filter Q object
-            filter_q = self.build_filter_query(filters_dict, view, queryset.model, allowed_fields)
-            if filter_q:
-                queryset = queryset.filter(filter_q)
-
+            queryset = self.apply_filters(queryset, view, filters)
         except json.JSONDecodeError:
             logger.warning("Invalid JSON in jqGrid filter")
         except Exception as e:
@@ -40,22 +213,56 @@ class JqGridFilterBackend(BaseFilterBackend):
 
         return queryset
 
-    def build_filter_query(self, filters_dict, view, model, allowed_fields):
+    def apply_filters(self, queryset, view, filters, strict=False):
+        """
+        Filter a queryset with a raw jqGrid `filters` string. Unlike
+        `filter_queryset`, invalid filters raise instead of being ignored.
+        """
+        filter_q = self.get_filter_q(queryset.model, view, filters, strict)
+        if filter_q:
+            queryset = queryset.filter(filter_q)
+        return queryset
+
+    def get_filter_q(self, model, view, filters, strict=False):
+        """
+        Return the Q object of a raw jqGrid `filters` string; empty when it has no
+        usable rules. With `strict`, rules that would be skipped (unknown or
+        disallowed field, unknown operator) raise ValueError instead.
+        """
+        allowed_fields = getattr(view, 'allowed_filters', [])
+        filter_mappings = getattr(view, 'filter_mappings', {})
+        plan_key = self.get_plan_key(model, allowed_fields, filter_mappings)
+
+        # Reuse the Q object compiled for an identical filter string
+        cache = self.get_query_cache()
+        cache_key = (plan_key, filters, strict)
+        filter_q = cache.get(cache_key)
+        if filter_q is None:
+            # Parse the filters string into JSON
+            filters_dict = json.loads(filters)
+            if not isinstance(filters_dict, dict):
+                raise json.JSONDecodeError("Filters must be a JSON object", filters, 0)
+
+            # Build the filter Q object
+            filter_q = self.build_filter_query(filters_dict, view, model, allowed_fields, strict)
+            cache.set(cache_key, filter_q)
+        return filter_q
+
+    def build_filter_query(self, filters_dict, view, model, allowed_fields, strict=False):
         """
         Build a Q object from filter dictionary.
         Supports both simple filters and complex grouping operations.
+        Skipped rules raise ValueError when `strict` is set.
         """
         filter_q = Q()
         filter_mappings = getattr(view, 'filter_mappings', {})
-
-        def is_allowed(field):
-            return field in allowed_fields or field in filter_mappings
+        plan = self.get_filter_plan(model, allowed_fields, filter_mappings)
 
         group_op = filters_dict.get('groupOp', 'AND').upper()
 
         # Handle complex grouping operations
         for group in filters_dict.get('groups', []):
-            group_q = self.build_filter_query(group, view, model, allowed_fields)
+            group_q = self.build_filter_query(group, view, model, allowed_fields, strict)
             if group_op == 'AND':
                 filter_q &= group_q
             else:  # OR
@@ -67,18 +274,22 @@ class JqGridFilterBackend(BaseFilterBackend):
             data = rule.get('data', '')
             op = rule.get('op', '')
 
-            if not field or not op or not is_allowed(field):
+            if not field or not op or not plan.is_allowed(field):
+                if strict:
+                    raise ValueError(f"Filtering on field '{field}' is not allowed.")
                 continue
 
             # Map jqGrid operator to Django filter
             filter_expr = self.map_operator(field, op, data, filter_mappings, model)
             if not filter_expr:
+                if strict:
+                    raise ValueError(f"Unsupported filter '{op}' on field '{field}'.")
                 continue
 
             field_name, field_value = filter_expr
 
             # Check if operator is negated
-            rule_q = ~Q(**{field_name: field_value}) if op in ['ne', 'nc', 'bn', 'en', 'ni', 'nn'] else Q(
+            rule_q = ~Q(**{field_name: field_value}) if op in self.NEGATED_OPERATORS else Q(
                 **{field_name: field_value})
 
             # Combine with existing query based on group operator
@@ -99,68 +310,54 @@ class JqGridFilterBackend(BaseFilterBackend):
         if custom_key in filter_mappings:
             return (filter_mappings[custom_key], data)
 
-        # Standard operator mappings
-        ops = {
-            "eq": "__exact",  # equals - fixed to use __exact
-            "ne": "__exact",  # not equals - fixed to use __exact
-            "lt": "__lt",  # less than
-            "le": "__lte",  # less than or equal
-            "gt": "__gt",  # greater than
-            "ge": "__gte",  # greater than or equal
-            "cn": "__icontains",  # contains
-            "nc": "__icontains",  # not contains
-            "bw": "__istartswith",  # begins with
-            "bn": "__istartswith",  # not begins with
-            "ew": "__iendswith",  # ends with
-            "en": "__iendswith",  # not ends with
-            "in": "__in",  # is in
-            "ni": "__in",  # is not in
-            "nu": "__isnull",  # is null
-            "nn": "__isnull"  # is not null
-        }
-
-        suffix = ops.get(op)
+        suffix = self.OPERATOR_SUFFIXES.get(op)
         if suffix is None:  # Check for None instead of falsy value
             return None
 
-        field_lookup = f"{field}{suffix}"
-
-        try:
-            # Get the field object for type casting
-            field_obj = model._meta.get_field(field.split('__')[0])
-        except FieldDoesNotExist:
+        resolved = self.get_field_resolver(model).resolve(field)
+        if resolved is None:
             return None
 
+        field_obj, caster = resolved
+        field_lookup = f"{field}{suffix}"
+
         # Special handling for different operators
         if op in ['nu', 'nn']:
             return (field_lookup, op == 'nu')
         elif op in ['in', 'ni']:
-            values = [self.cast_value(field_obj, v.strip()) for v in data.split(',')]
+            values = [caster(v.strip()) for v in data.split(',')]
             return (field_lookup, values)
         else:
-            return (field_lookup, self.cast_value(field_obj, data))
+            return (field_lookup, caster(data))
+
+    def get_caster(self, field):
+        """
+        Return a function casting string values to the Python type of `field`.
+        Resolved once per field by the filter plan.
+        """
+        if type(self).cast_value is not JqGridFilterBackend.cast_value:
+            # Honour subclasses that customise cast_value()
+            return lambda value: self.cast_value(field, value)
+        return self.get_default_caster(field)
+
+    def get_default_caster(self, field):
+        """Return the built-in caster for a model field type."""
+        if isinstance(field, IntegerField):
+            return _safe_caster(int)
+        if isinstance(field, FloatField):
+            return _safe_caster(float)
+        if isinstance(field, BooleanField):
+            return _safe_caster(_cast_boolean)
+        if isinstance(field, (DateField, DateTimeField)):
+            return _safe_caster(_cast_date)
+        # Additional handling for JSONField could be added here
+        return _identity
 
     def cast_value(self, field, value):
         """
         Cast string values to appropriate Python types based on field type.
         """
-        from django.db.models import IntegerField, BooleanField, FloatField, DateField, DateTimeField, JSONField
-
-        try:
-            if isinstance(field, IntegerField):
-                return int(value)
-            if isinstance(field, FloatField):
-                return float(value)
-            if isinstance(field, BooleanField):
-                return value.lower() in ['true', '1', 'yes', 'on']
-            if isinstance(field, (DateField, DateTimeField)):
-                from django.utils.dateparse import parse_date, parse_datetime
-                return parse_datetime(value) or parse_date(value)
-            # Additional handling for JSONField could be added here
-            return value
-        except Exception:
-            # Return the original value if casting fails
-            return value
+        return self.get_default_caster(field)(value)
 
 
 class JqGridSortBackend(BaseFilterBackend):
@@ -169,14 +366,18 @@ class JqGridSortBackend(BaseFilterBackend):
     Supports multi-column sorting.
     """
 
-    def filter_queryset(self, request, queryset, view):
+    def get_ordering(self, request, view):
+        """
+        Return the ordering requested through `sidx`/`sord` as a list of
+        Django order_by() terms (e.g. ['name', '-created_at']).
+        """
         # Get sorting parameters
         sidx = request.query_params.get('sidx', '')
         sord = request.query_params.get('sord', 'asc')
 
         # Check if we need to sort
         if not sidx:
-            return queryset
+            return []
 
         allowed_fields = getattr(view, 'allowed_sort_fields', [])
 
@@ -207,15 +408,20 @@ class JqGridSortBackend(BaseFilterBackend):
 
             # Skip if not in allowed list
             if allowed_fields and field not in allowed_fields:
-                return queryset
+                return []
 
             if sord.lower() == 'desc':
                 sort_fields.append(f"-{field}")
             else:
                 sort_fields.append(field)
 
+        return sort_fields
+
+    def filter_queryset(self, request, queryset, view):
+        sort_fields = self.get_ordering(request, view)
+
         # Apply ordering if we have valid sort fields
         if sort_fields:
             return queryset.order_by(*sort_fields)
 
-        return queryset
\ No newline at end of file
+        return queryset
@@ -0,0 +1,119 @@
+"""Streaming readers and batch helpers for grid imports.
+
+Uploads are read row by row instead of being loaded into memory, and foreign
+keys are resolved with one query per batch through ``ForeignKeyResolver``.
+"""
+
+import csv
+import io
+import logging
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+
+try:
+    from openpyxl import load_workbook
+    HAS_OPENPYXL = True
+except ImportError:
+    HAS_OPENPYXL = False
+
+logger = logging.getLogger(__name__)
+
+
+def iter_csv_rows(upload, encoding='utf-8-sig'):
+    """
+    Yield the rows of a CSV upload as dictionaries keyed by header.
+
+    The upload is decoded incrementally, so only the current row is held in memory.
+    """
+    upload.seek(0)
+    text = io.TextIOWrapper(upload.file, encoding=encoding, newline='')
+    try:
+        yield from csv.DictReader(text)
+    finally:
+        # Leave the uploaded file open for Django to clean up
+        text.detach()
+
+
+def iter_xlsx_rows(upload):
+    """Yield the rows of the first sheet of an XLSX upload as dictionaries keyed by header."""
+    if not HAS_OPENPYXL:
+        raise ImportError("openpyxl is required to import XLSX files")
+    return _iter_xlsx_rows(upload)
+
+
+def _iter_xlsx_rows(upload):
+    upload.seek(0)
+    workbook = load_workbook(upload, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        header = [str(name).strip() if name is not None else '' for name in header]
+        for values in rows:
+            if any(value is not None for value in values):
+                yield dict(zip(header, values))
+    finally:
+        workbook.close()
+
+
+IMPORT_READERS = {
+    'csv': iter_csv_rows,
+    'xlsx': iter_xlsx_rows,
+}
+
+
+class ForeignKeyResolver:
+    """
+    Resolve foreign key values of an import batch with one query per field.
+
+    Args:
+        model: Model being imported
+        lookup_fields: Mapping of foreign key field name to the related model
+            field used to match imported values (defaults to the primary key)
+    """
+
+    def __init__(self, model, lookup_fields=None):
+        self.model = model
+        self.lookup_fields = lookup_fields or {}
+
+    def get_foreign_keys(self, field_names):
+        """Return the model foreign key fields among ``field_names``."""
+        foreign_keys = {}
+        for name in field_names:
+            try:
+                field = self.model._meta.get_field(name)
+            except FieldDoesNotExist:
+                continue
+            if isinstance(field, models.ForeignKey):
+                foreign_keys[name] = field
+        return foreign_keys
+
+    @staticmethod
+    def normalize_value(value):
+        """
+        Return the form of an imported value used for matching. XLSX cells hold
+        numbers as floats, so integral floats (``5.0``) are matched as ``5``.
+        """
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        return value
+
+    def build_lookup(self, field, values):
+        """
+        Fetch the related objects matching ``values`` in a single query.
+
+        Returns:
+            Dict mapping the string form of each matched value to its instance
+        """
+        if not values:
+            return {}
+        lookup = self.lookup_fields.get(field.name, 'pk')
+        values = {self.normalize_value(value) for value in values}
+        queryset = field.related_model._default_manager.filter(**{f"{lookup}__in": values})
+        return {str(getattr(obj, lookup)): obj for obj in queryset}
+
+    def match(self, lookup, value):
+        """Return the instance of a ``build_lookup()`` result matching ``value``, or None."""
+        return lookup.get(str(self.normalize_value(value)))
@@ -0,0 +1,158 @@
+"""Per-model generation counters keying every grid data cache.
+
+Each model shown in a grid is registered with ``register_model``. Saves,
+deletes and many-to-many changes of its rows (and bulk actions, which bypass
+signals) bump the model's generation counter in the cache. Record counts,
+footer aggregates and dropdown pages embed the generations of the models they
+read in their cache keys, so entries written before a change are never served
+after it; they simply expire.
+
+Generations live in the cache named by
+``JQGRID_PERFORMANCE['INVALIDATION_CACHE_BACKEND']`` (``'default'``), which
+must be shared by all processes.
+"""
+
+import logging
+import threading
+
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from django_jqgrid.utils import get_performance_setting
+
+logger = logging.getLogger(__name__)
+
+GENERATION_CACHE_PREFIX = 'django_jqgrid_gen'
+
+# Concrete models whose generations are tracked, and the classes connected to signals
+_registered_models = set()
+_connected_senders = set()
+_lock = threading.Lock()
+
+
+def get_generation_cache():
+    return caches[get_performance_setting('INVALIDATION_CACHE_BACKEND', 'default')]
+
+
+def _generation_key(model):
+    return f"{GENERATION_CACHE_PREFIX}:{model._meta.label_lower}"
+
+
+def get_generations(models):
+    """
+    Return the generation tokens of ``models`` as one string.
+
+    Args:
+        models: Iterable of model classes
+    """
+    models = sorted(set(models), key=lambda model: model._meta.label_lower)
+    keys = [_generation_key(model) for model in models]
+    values = get_generation_cache().get_many(keys)
+    return '.'.join(str(values.get(key, 0)) for key in keys)
+
+
+def get_generation(model):
+    return get_generations([model])
+
+
+def get_queryset_generation(queryset):
+    """
+    Return the generations of the models a queryset reads: its model (registered
+    on first use) and the registered models of the tables it joins.
+    """
+    register_model(queryset.model)
+    models = [queryset.model._meta.concrete_model]
+    tables = {model._meta.db_table: model for model in list(_registered_models)}
+    for join in queryset.query.alias_map.values():
+        model = tables.get(join.table_name)
+        if model is not None:
+            models.append(model)
+    return get_generations(models)
+
+
+def _incr(model):
+    cache = get_generation_cache()
+    key = _generation_key(model)
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Evicted between add() and incr()
+        cache.set(key, 1, None)
+
+
+def bump_generation(model, using=None):
+    """
+    Invalidate every cache entry keyed on the generation of ``model``.
+
+    Inside a transaction the generation is bumped again on commit, dropping
+    entries other requests cached from the data visible before the commit.
+    """
+    model = model._meta.concrete_model
+    _incr(model)
+    connection = transaction.get_connection(using)
+    if connection.in_atomic_block:
+        transaction.on_commit(lambda: _incr(model), using=using)
+    logger.debug("Bumped jqGrid cache generation of %s", model._meta.label)
+
+
+def _on_save_or_delete(sender, using=None, **kwargs):
+    bump_generation(sender, using)
+
+
+def _on_m2m_changed(sender, instance, action, model, using=None, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        bump_generation(type(instance), using)
+        bump_generation(model, using)
+
+
+def has_other_listeners(signal, sender):
+    """
+    Return whether ``signal`` has receivers for ``sender`` besides the
+    invalidation handlers, e.g. to keep signal-less bulk writes available for
+    models only registered here.
+    """
+    if not signal.has_listeners(sender):
+        return False
+    if sender not in _connected_senders:
+        return True
+    # Receivers are stored under (dispatch uid or receiver id, sender id) keys;
+    # ours are connected with dispatch uids under GENERATION_CACHE_PREFIX
+    sender_ids = {id(sender), id(None)}
+    return any(
+        key[1] in sender_ids and not str(key[0]).startswith(f"{GENERATION_CACHE_PREFIX}:")
+        for key, *_ in list(signal.receivers)
+    )
+
+
+def register_model(model):
+    """
+    Track changes to ``model`` through ``post_save``, ``post_delete`` and
+    ``m2m_changed``. Registering a model twice is a no-op.
+    """
+    if model in _connected_senders:
+        return
+    with _lock:
+        if model in _connected_senders:
+            return
+        # Proxy instances send signals as the proxy class
+        uid = f"{GENERATION_CACHE_PREFIX}:{model._meta.label_lower}"
+        post_save.connect(_on_save_or_delete, sender=model, weak=False, dispatch_uid=f"{uid}:save")
+        post_delete.connect(_on_save_or_delete, sender=model, weak=False, dispatch_uid=f"{uid}:delete")
+        for field in model._meta.get_fields():
+            if not field.many_to_many:
+                continue
+            through = getattr(field, 'through', None) or field.remote_field.through
+            if through is not None and not isinstance(through, str):
+                m2m_changed.connect(_on_m2m_changed, sender=through, weak=False,
+                                    dispatch_uid=f"{GENERATION_CACHE_PREFIX}:m2m:{through._meta.label_lower}")
+        _connected_senders.add(model)
+        _registered_models.add(model._meta.concrete_model)
+    logger.debug("Registered %s for jqGrid cache invalidation", model._meta.label)
+    if model._meta.proxy:
+        register_model(model._meta.concrete_model)
+
+
+def is_registered(model):
+    return model._meta.concrete_model in _registered_models
@@ -0,0 +1,261 @@
+"""Background jobs for long running imports and exports.
+
+A job is a dotted task path plus JSON-serializable keyword arguments, so it can
+run in a thread of the web process or be handed to a task queue. Job state is
+kept in the Django cache and result files in ``default_storage``.
+
+The runner is chosen with ``JQGRID_PERFORMANCE['JOB_RUNNER']`` (a dotted path
+to a ``JobRunner`` subclass). A task queue adapter only has to implement
+``submit``; for example with Celery::
+
+    @shared_task
+    def run_jqgrid_job(job_id, task_path, kwargs):
+        execute_job(job_id, task_path, kwargs)
+
+    class CeleryJobRunner(JobRunner):
+        def submit(self, job_id, task_path, kwargs):
+            run_jqgrid_job.delay(job_id, task_path, kwargs)
+"""
+
+import logging
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db import close_old_connections, connection
+from django.http import HttpRequest, QueryDict
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from rest_framework.request import Request
+
+from django_jqgrid.utils import get_performance_setting
+
+logger = logging.getLogger(__name__)
+
+JOB_CACHE_PREFIX = 'django_jqgrid_job'
+JOB_STORAGE_DIR = 'jqgrid_jobs'
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+# Rows processed between two progress updates
+PROGRESS_INTERVAL = 1000
+
+
+def _get_cache():
+    return caches[get_performance_setting('JOB_CACHE_BACKEND', 'default')]
+
+
+def _job_timeout():
+    return get_performance_setting('JOB_TIMEOUT', 86400)
+
+
+def _class_path(klass):
+    return f"{klass.__module__}.{klass.__qualname__}"
+
+
+def get_job(job_id):
+    """Return the job record for ``job_id``, or None when unknown or expired."""
+    return _get_cache().get(f"{JOB_CACHE_PREFIX}:{job_id}")
+
+
+def save_job(job):
+    job['updated_at'] = timezone.now().isoformat()
+    _get_cache().set(f"{JOB_CACHE_PREFIX}:{job['id']}", job, _job_timeout())
+    return job
+
+
+def update_job(job_id, **fields):
+    """Merge ``fields`` into a job record."""
+    job = get_job(job_id)
+    if job is None:
+        logger.warning("jqGrid job %s expired while running", job_id)
+        return None
+    job.update(fields)
+    return save_job(job)
+
+
+def create_job(kind, view_class, user=None):
+    """Create a queued job record."""
+    return save_job({
+        'id': uuid.uuid4().hex,
+        'kind': kind,
+        'view': _class_path(view_class),
+        'owner': user.pk if user is not None and user.is_authenticated else None,
+        'state': QUEUED,
+        'processed': 0,
+        'error_count': 0,
+        'errors': [],
+        'message': '',
+        'result': None,
+        'file': None,
+        'filename': None,
+        'content_type': None,
+        'created_at': timezone.now().isoformat(),
+    })
+
+
+def get_job_storage_path(job_id, filename):
+    return f"{JOB_STORAGE_DIR}/{job_id}/{filename}"
+
+
+class JobRunner:
+    """
+    Interface for job runners.
+
+    ``submit`` must arrange for ``execute_job(job_id, task_path, kwargs)`` to run,
+    now or later, in this process or another one.
+    """
+
+    def submit(self, job_id, task_path, kwargs):
+        raise NotImplementedError
+
+
+class LocalJobRunner(JobRunner):
+    """Run jobs synchronously in the calling thread (tests and development)."""
+
+    def submit(self, job_id, task_path, kwargs):
+        execute_job(job_id, task_path, kwargs)
+
+
+class ThreadPoolJobRunner(JobRunner):
+    """Run jobs in a thread pool of the web process (``JOB_WORKERS`` threads)."""
+
+    def __init__(self, max_workers=None):
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or get_performance_setting('JOB_WORKERS', 2),
+            thread_name_prefix='jqgrid-job'
+        )
+
+    def submit(self, job_id, task_path, kwargs):
+        self.executor.submit(self._run, job_id, task_path, kwargs)
+
+    def _run(self, job_id, task_path, kwargs):
+        close_old_connections()
+        try:
+            execute_job(job_id, task_path, kwargs)
+        finally:
+            connection.close()
+
+
+_runners = {}
+_runners_lock = threading.Lock()
+
+
+def get_job_runner():
+    """Return the configured job runner instance."""
+    path = get_performance_setting('JOB_RUNNER', 'django_jqgrid.jobs.ThreadPoolJobRunner')
+    with _runners_lock:
+        if path not in _runners:
+            _runners[path] = import_string(path)()
+        return _runners[path]
+
+
+def enqueue_job(job, task_path, kwargs):
+    """Hand a created job to the configured runner."""
+    get_job_runner().submit(job['id'], task_path, kwargs)
+    return get_job(job['id']) or job
+
+
+def execute_job(job_id, task_path, kwargs):
+    """Run a job task, recording its state and any failure on the job record."""
+    update_job(job_id, state=RUNNING)
+    try:
+        import_string(task_path)(job_id, **kwargs)
+    except Exception as e:
+        logger.exception("jqGrid job %s failed", job_id)
+        update_job(job_id, state=FAILED, message=str(e))
+
+
+class JobProgress:
+    """Callable updating a job's progress every ``PROGRESS_INTERVAL`` rows."""
+
+    def __init__(self, job_id):
+        self.job_id = job_id
+        self.reported = 0
+
+    def __call__(self, processed, error_count=0):
+        if processed - self.reported >= PROGRESS_INTERVAL:
+            self.reported = processed
+            update_job(self.job_id, processed=processed, error_count=error_count)
+
+
+def build_job_view(view_path, action, query_string='', user_id=None):
+    """
+    Recreate a viewset instance outside of the request that queued the job.
+
+    The view gets a GET request carrying the original query string and user, so
+    filter backends and ``get_queryset()`` behave as they did in the request.
+    """
+    http_request = HttpRequest()
+    http_request.method = 'GET'
+    http_request.GET = QueryDict(query_string)
+    request = Request(http_request)
+
+    if user_id is not None:
+        request.user = get_user_model()._default_manager.get(pk=user_id)
+    else:
+        from django.contrib.auth.models import AnonymousUser
+        request.user = AnonymousUser()
+
+    view = import_string(view_path)()
+    view.request = request
+    view.args = ()
+    view.kwargs = {}
+    view.format_kwarg = None
+    view.action = action
+    return view
+
+
+def run_export_job(job_id, view_path, query_string, ext, user_id=None):
+    """Write an export to storage using the view's export methods."""
+    view = build_job_view(view_path, 'export_data', query_string, user_id)
+    request = view.request
+    writer = view.export_writers[ext]()
+    columns = view.get_export_columns(request)
+    rows = view.get_export_rows(view.get_export_queryset(request), columns)
+
+    progress = JobProgress(job_id)
+    counter = {'rows': 0}
+
+    def counted(rows):
+        for row in rows:
+            counter['rows'] += 1
+            progress(counter['rows'])
+            yield row
+
+    filename = view.get_export_filename(writer)
+    with tempfile.TemporaryFile() as output:
+        for chunk in writer.stream(columns, counted(rows)):
+            output.write(chunk.encode('utf-8') if isinstance(chunk, str) else chunk)
+        output.seek(0)
+        path = default_storage.save(get_job_storage_path(job_id, filename), File(output))
+
+    update_job(
+        job_id, state=DONE, processed=counter['rows'], file=path, filename=filename,
+        content_type=writer.content_type, message=f"Exported {counter['rows']} records.",
+    )
+
+
+def run_import_job(job_id, view_path, upload_path, mapped_columns, default_values, user_id=None):
+    """Import a stored upload using the view's import methods."""
+    view = build_job_view(view_path, 'import_data', user_id=user_id)
+    try:
+        with default_storage.open(upload_path, 'rb') as upload:
+            result = view.run_import(
+                view.get_import_rows(upload), mapped_columns, default_values, progress=JobProgress(job_id))
+    finally:
+        default_storage.delete(upload_path)
+
+    update_job(
+        job_id, state=DONE, processed=result['imported_count'] + result['error_count'],
+        error_count=result['error_count'], errors=result['errors'],
+        message=result['message'], result=result,
+    )
@@ -0,0 +1,32 @@
+"""
+Management command to invalidate compiled jqGrid configs, e.g. after a deploy.
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.module_loading import import_string
+
+from django_jqgrid.cache import invalidate_config_cache
+
+
+class Command(BaseCommand):
+    help = 'Invalidate cached jqGrid configurations'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'viewsets',
+            nargs='*',
+            help='Dotted paths of viewsets to invalidate (all grids when omitted)',
+        )
+
+    def handle(self, *args, **options):
+        if not options['viewsets']:
+            invalidate_config_cache()
+            self.stdout.write(self.style.SUCCESS('Invalidated jqGrid configs for all grids'))
+            return
+
+        for path in options['viewsets']:
+            try:
+                viewset_class = import_string(path)
+            except ImportError as e:
+                raise CommandError(f"Cannot import viewset '{path}': {e}")
+            invalidate_config_cache(viewset_class)
+            self.stdout.write(self.style.SUCCESS(f'Invalidated jqGrid config for {path}'))
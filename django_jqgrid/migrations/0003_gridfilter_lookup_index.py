@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_jqgrid', '0002_alter_gridfilter_value'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='gridfilter',
+            index=models.Index(fields=['table', 'key', 'is_global', 'created_by'], name='jqgrid_filter_lookup_idx'),
+        ),
+    ]
@@ -1,8 +1,38 @@
+import csv
+
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.db import IntegrityError
+from django.http import FileResponse, StreamingHttpResponse
+from django.utils.http import parse_etags
 from rest_framework.decorators import action
-from django_jqgrid.utils import get_content_type_cached
+from rest_framework.renderers import JSONRenderer
+from django.db.models import BooleanField, CharField, Count, Q
+from django_jqgrid import jobs
+from django_jqgrid.aggregates import build_aggregate_expressions, compute_aggregates, get_valid_aggregation_fields, to_userdata
+from django_jqgrid.cache import compute_config_etag, get_config_version, get_or_build_config, is_config_cache_enabled
+from django_jqgrid.dropdowns import get_dropdown_cache, get_dropdown_cache_key
+from django_jqgrid.export import EXPORT_WRITERS, get_export_chunk_size, get_export_columns, resolve_model_path
+from django_jqgrid.fastrows import build_fast_renderer
+from django_jqgrid.filters import JqGridFilterBackend, JqGridSortBackend, LRUCache
+from django_jqgrid.importer import IMPORT_READERS, ForeignKeyResolver
+from django_jqgrid.invalidation import bump_generation, has_other_listeners, register_model
+from django_jqgrid.jobs import create_job, enqueue_job, get_job_storage_path
+from django_jqgrid.pagination import JqGridPagination
+from django_jqgrid.queryplan import build_query_plan
+from django_jqgrid.renderers import JqGridJSONRenderer
+from django_jqgrid.singleflight import list_flights
+from django_jqgrid.utils import InstanceDefault, deep_merge, freeze, get_content_type_cached, get_performance_setting
+
+
+# Compiled query plans shared by all viewsets, keyed by viewset, serializer and
+# requested fields; bounded as the requested columns come from the client
+query_plans = LRUCache(get_performance_setting('PLAN_CACHE_SIZE', 256))
+# Compiled fast row renderers (None when the serializer is needed), keyed likewise
+fast_renderers = LRUCache(get_performance_setting('PLAN_CACHE_SIZE', 256))
+_NOT_BUILT = object()
 
 
 def get_setting(key, default=None):
@@ -16,7 +46,8 @@ class JqGridConfigMixin:
     while maintaining output compatibility with legacy format and supporting settings-based configuration
     """
     key_field = "id"
-    additional_data = {}
+    # Mutable defaults are InstanceDefaults: every instance works on its own copy
+    additional_data = InstanceDefault({})
 
     # Get configuration from settings or use defaults
     JQGRID_DEFAULT_FIELD_CONFIG = {
@@ -65,7 +96,7 @@ class JqGridConfigMixin:
         },
         'ForeignKey': {'stype': 'text', 'formatter': 'select', 'search_ops': ["eq", "ne"], 'sortable': True}
     }
-    FIELD_TYPE_CONFIGS = JQGRID_DEFAULT_FIELD_CONFIG  # Replace with get_setting() if needed
+    FIELD_TYPE_CONFIGS = InstanceDefault(JQGRID_DEFAULT_FIELD_CONFIG)  # Replace with get_setting() if needed
 
     # Default grid options
     JQGRID_DEFAULT_GRID_OPTIONS = {
@@ -111,7 +142,7 @@ class JqGridConfigMixin:
             "repeatitems": False
         }
     }
-    DEFAULT_GRID_OPTIONS = JQGRID_DEFAULT_GRID_OPTIONS  # Replace with get_setting() if needed
+    DEFAULT_GRID_OPTIONS = InstanceDefault(JQGRID_DEFAULT_GRID_OPTIONS)  # Replace with get_setting() if needed
 
     # Default method options
     JQGRID_DEFAULT_METHOD_OPTIONS = {
@@ -178,7 +209,9 @@ class JqGridConfigMixin:
                 "defaultSearch": "cn",
                 "searchOperators": True,
                 "autosearch": True,
-                "searchOnEnter": False
+                "searchOnEnter": False,
+                # Milliseconds of typing pause before a toolbar search is sent
+                "autosearchDelay": 500
             }
         },
         "inlineNav": {
@@ -217,10 +250,61 @@ class JqGridConfigMixin:
             }
         ]
     }
-    DEFAULT_METHOD_OPTIONS = JQGRID_DEFAULT_METHOD_OPTIONS  # Replace with get_setting() if needed
+    DEFAULT_METHOD_OPTIONS = InstanceDefault(JQGRID_DEFAULT_METHOD_OPTIONS)  # Replace with get_setting() if needed
 
     # Override field configuration in viewset
-    jqgrid_field_overrides = {}
+    jqgrid_field_overrides = InstanceDefault({})
+
+    # Serve jqgrid_config from the compiled config cache (see django_jqgrid.cache).
+    # Cached configs are shared by every request of the viewset: only enable it
+    # when the config does not depend on the request or user
+    jqgrid_config_cache = False
+    # Bump to invalidate cached configs of this viewset on the next deploy
+    jqgrid_config_version = ''
+
+    # Server-side grouping: list requests with `group_by` return group headers,
+    # adding `group_value` returns the rows of one group
+    group_by_param = 'group_by'
+    group_value_param = 'group_value'
+    # Value of `group_value` selecting the group of NULL values
+    group_null_value = '__null__'
+    # Maximum number of group headers returned
+    grouping_max_groups = 1000
+
+    # Derive select_related/prefetch_related from the serializer (see django_jqgrid.queryplan)
+    jqgrid_query_plan = True
+    # Actions whose queryset gets the query plan applied
+    jqgrid_query_plan_actions = ('list', 'retrieve')
+
+    # Request parameter listing the columns to load and serialize on list requests
+    columns_param = 'columns'
+    # Make the grid send its visible columns with every data request
+    jqgrid_column_projection = False
+
+    # Build list rows from values() with precompiled formatters instead of the
+    # serializer (see django_jqgrid.fastrows); meant for read-only grids
+    jqgrid_fast_rows = False
+
+    # Row format of list responses (see JqGridPagination.get_row_format): 'cells'
+    # sends each row as an array in colModel order; None uses the pagination default
+    jqgrid_row_format = None
+
+    # Render JSON with orjson/ujson when installed (see django_jqgrid.renderers);
+    # applies to viewsets paginated by JqGridPagination
+    jqgrid_json_renderer = True
+
+    # Let identical concurrent list requests of a user share one execution
+    # (see django_jqgrid.singleflight); waiters give up after SINGLE_FLIGHT_TIMEOUT
+    jqgrid_single_flight = False
+    # Cache-busting parameters ignored when matching requests (jqGrid's `nd`, jQuery's `_`)
+    single_flight_ignored_params = ('nd', '_')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Track writes to the grid's model so its caches are invalidated
+        queryset = getattr(cls, 'queryset', None)
+        if queryset is not None:
+            register_model(queryset.model)
 
     def initgrid(self):
         """Initialize the grid configuration"""
@@ -280,6 +364,19 @@ class JqGridConfigMixin:
         # Add key_field to additional_data
         self.additional_data.update({'key_field': self.key_field})
 
+        # Let the client group rows on the server and load groups when expanded
+        if self.groupable_fields:
+            self.additional_data['server_grouping'] = {
+                'fields': list(self.groupable_fields),
+                'group_by_param': self.group_by_param,
+                'group_value_param': self.group_value_param,
+                'null_value': self.group_null_value,
+            }
+
+        # Let the client request only its visible columns
+        if self.jqgrid_column_projection:
+            self.additional_data['column_projection'] = {'param': self.columns_param}
+
         # Add bulk_action_config to additional_data
         if hasattr(self, 'bulk_action_config'):
             self.additional_data.update({'bulk_action_config': self.bulk_action_config})
@@ -293,9 +390,10 @@ class JqGridConfigMixin:
         serializer = serializer_class()
 
         # Get field lists from viewset or use defaults
-        self.visible_columns = getattr(self, 'visible_columns', list(serializer.get_fields().keys()))
-        self.search_fields = getattr(self, 'search_fields', list(serializer.get_fields().keys()))
-        self.ordering_fields = getattr(self, 'ordering_fields', list(serializer.get_fields().keys()))
+        serializer_field_names = list(serializer.get_fields().keys())
+        self.visible_columns = list(getattr(self, 'visible_columns', serializer_field_names))
+        self.search_fields = getattr(self, 'search_fields', serializer_field_names)
+        self.ordering_fields = getattr(self, 'ordering_fields', serializer_field_names)
         self.groupable_fields = getattr(self, 'groupable_fields', [])
         self.aggregation_fields = getattr(self, 'aggregation_fields', {})
         self.frozen_columns = getattr(self, 'frozen_columns', [])
@@ -405,7 +503,7 @@ class JqGridConfigMixin:
 
             # Apply any field overrides from viewset
             if field_name in self.jqgrid_field_overrides:
-                col_config.update(self.jqgrid_field_overrides[field_name])
+                col_config = deep_merge(col_config, self.jqgrid_field_overrides[field_name])
 
             # Add to column names list
             self.colnames.append(col_config.get("label", field_name.replace('_', ' ').title()))
@@ -423,7 +521,7 @@ class JqGridConfigMixin:
 
     def _apply_field_type_config(self, col_config, model_field, field_type):
         """Apply configuration based on field type"""
-        type_config = self.FIELD_TYPE_CONFIGS[field_type].copy()
+        type_config = self.FIELD_TYPE_CONFIGS[field_type]
 
         # Add search operations
         if 'search_ops' in type_config:
@@ -442,8 +540,8 @@ class JqGridConfigMixin:
         # Special handling for decimal fields
         if type_config.get('needs_decimal_places', False):
             decimal_places = getattr(model_field, "decimal_places", 2)
-            col_config["formatoptions"] = col_config.get("formatoptions", {})
-            col_config["formatoptions"]["decimalPlaces"] = decimal_places
+            col_config["formatoptions"] = deep_merge(col_config.get("formatoptions", {}),
+                                                     {"decimalPlaces": decimal_places})
 
         # Add search options if field is searchable
         if col_config.get('search') and 'search_ops' in col_config:
@@ -472,12 +570,12 @@ class JqGridConfigMixin:
                 "formatter": "select",
                 "edittype": "select",
                 "editoptions": {
-                    "dataUrl": f"/api/{related_app}/{related_name}/dropdown/?field_name={field_name}&format=json",
+                    "dataUrl": f"/api/{related_app}/{related_name}/dropdown/?field_name={field_name}&all=true&format=json",
                     "dataUrlTemp": f"/api/{related_app}/{related_name}/<id>/dropdown_pk/?field_name={field_name}&all=true&format=json",
                     "dataType": "application/json"
                 },
                 "addoptions": {
-                    "dataUrl": f"/api/{related_app}/{related_name}/dropdown/?field_name={field_name}&format=json",
+                    "dataUrl": f"/api/{related_app}/{related_name}/dropdown/?field_name={field_name}&all=true&format=json",
                     "dataUrlTemp": f"/api/{related_app}/{related_name}/<id>/dropdown_pk/?field_name={field_name}&all=true&format=json",
                     "dataType": "application/json"
                 }
@@ -485,9 +583,8 @@ class JqGridConfigMixin:
 
             # Add search options if searchable
             if col_config.get("search", False):
-                col_config["searchoptions"] = col_config.get("searchoptions", {})
-                col_config["searchoptions"].update({
-                    "dataUrl": f"/api/{related_app}/{related_name}/dropdown/?field_name={field_name}&format=json",
+                col_config["searchoptions"] = deep_merge(col_config.get("searchoptions", {}), {
+                    "dataUrl": f"/api/{related_app}/{related_name}/dropdown/?field_name={field_name}&all=true&format=json",
                     "dataUrlTemp": f"/api/{related_app}/{related_name}/<id>/dropdown-pk/?field_name={field_name}&all=true&format=json",
                     "dataType": "application/json"
                 })
@@ -513,8 +610,7 @@ class JqGridConfigMixin:
 
         # Add search options if searchable
         if col_config.get("search", False):
-            col_config["searchoptions"] = col_config.get("searchoptions", {})
-            col_config["searchoptions"].update({
+            col_config["searchoptions"] = deep_merge(col_config.get("searchoptions", {}), {
                 "value": choice_values,
                 "sopt": ["eq", "ne"]
             })
@@ -599,6 +695,15 @@ class JqGridConfigMixin:
             "repeatitems": False
         }
 
+        # Rows sent as arrays in colModel order, with the key read by position
+        if self.get_row_format() == 'cells':
+            names = [column['name'] for column in self.colmodel]
+            self.jqgrid_options["jsonReader"].update({
+                "repeatitems": True,
+                "cell": "",
+                "id": str(names.index(self.key_field)) if self.key_field in names else "0",
+            })
+
         # Add rowList values to match first code
         self.jqgrid_options["rowList"] = [25, 50, 100, 500, 1000, 2000, 5000]
 
@@ -608,34 +713,30 @@ class JqGridConfigMixin:
 
     def configure_method_options(self):
         """Configure method options for jqGrid"""
-        # Start with default method options from settings
-        self.method_options = self.DEFAULT_METHOD_OPTIONS.copy()
-
-        # Update navGrid options to match first code
-        self.method_options['navGrid']['options'].update({
-            "edit": False,
-            "add": False,
-            "del": False,
-            "search": True,
-            "refresh": True,
-            "view": False
-        })
+        # Overlay request-specific values on the defaults without mutating them
+        overlay = {
+            # Update navGrid options to match first code
+            'navGrid': {
+                'options': {
+                    "edit": False,
+                    "add": False,
+                    "del": False,
+                    "search": True,
+                    "refresh": True,
+                    "view": False
+                }
+            }
+        }
 
         # Customize edit caption if needed
-        if 'navGrid' in self.method_options and 'editOptions' in self.method_options['navGrid']:
-            self.method_options['navGrid']['editOptions']['editCaption'] = f"Edit {self.model_name.title()}"
+        if 'editOptions' in self.DEFAULT_METHOD_OPTIONS.get('navGrid', {}):
+            overlay['navGrid']['editOptions'] = {'editCaption': f"Edit {self.model_name.title()}"}
+
+        self.method_options = deep_merge(self.DEFAULT_METHOD_OPTIONS, overlay)
 
         # Apply any custom overrides defined in the viewset
         if hasattr(self, 'method_options_override'):
-            self._deep_update(self.method_options, self.method_options_override)
-
-    def _deep_update(self, original, update):
-        """Recursively update nested dictionaries"""
-        for key, value in update.items():
-            if key in original and isinstance(original[key], dict) and isinstance(value, dict):
-                self._deep_update(original[key], value)
-            else:
-                original[key] = value
+            self.method_options = deep_merge(self.method_options, self.method_options_override)
 
     def _configure_frozen_columns(self):
         """Configure frozen columns"""
@@ -643,9 +744,10 @@ class JqGridConfigMixin:
         self.frozen_columns_enabled = bool(self.frozen_columns)
 
         if self.frozen_columns:
-            for col in self.colmodel:
-                if col.get('name') in self.frozen_columns:
-                    col['frozen'] = True
+            self.colmodel[:] = [
+                deep_merge(col, {'frozen': True}) if col.get('name') in self.frozen_columns else col
+                for col in self.colmodel
+            ]
 
     def _configure_grouping(self):
         """Configure grouping options"""
@@ -680,7 +782,7 @@ class JqGridConfigMixin:
         serializer_class = self.serializer_class or self.get_serializer_class()
         model = getattr(serializer_class.Meta, "model", None)
         serializer_fields = serializer_class().get_fields()
-        self.bulk_updateable_fields = getattr(self, 'bulk_updateable_fields', [])
+        self.bulk_updateable_fields = list(getattr(self, 'bulk_updateable_fields', []))
 
         # If no specific fields are defined, auto-generate from column model
         if not self.bulk_updateable_fields:
@@ -724,51 +826,25 @@ class JqGridConfigMixin:
 
     def get_tmplgilters(self):
         """Get template filters for search options"""
-        from django_jqgrid.models import GridFilter
+        from django_jqgrid.saved_filters import empty_template_filters, get_template_filters
         try:
             # Get content type with caching
             content_type = get_content_type_cached(
                 self.queryset.model._meta.app_label,
                 self.queryset.model._meta.model_name
             )
-            
+
             if not content_type:
-                return {"tmplNames": [], "tmplFilters": [], "tmplIds": []}
-            
-            # Get user-specific filters
-            user_filters = GridFilter.objects.filter(
-                key='tmplFilters',
-                table=content_type,
-                created_by=self.request.user,
-                is_global=False
-            ).values('id', 'name', 'value')
-
-            # Get global filters
-            global_filters = GridFilter.objects.filter(
-                key='tmplFilters',
-                table=content_type,
-                is_global=True
-            ).values('id', 'name', 'value')
-
-            # Combine user and global filters
-            data = list(user_filters) + list(global_filters)
-
-            tmplNames = []
-            tmplIds = []
-            tmplFilters = []
-            for i in data:
-                tmplIds.append(i['id'])
-                tmplNames.append(i['name'])
-                tmplFilters.append(i['value'])
-            return {"tmplNames": tmplNames, "tmplFilters": tmplFilters, "tmplIds": tmplIds}
+                return empty_template_filters()
+
+            # User and global filters in one cached query
+            return get_template_filters(content_type, getattr(self.request, 'user', None))
         except Exception as e:
-            import logging
-            logging.error(f"Error getting template filters: {e}")
-            return {"tmplNames": [], "tmplFilters": [], "tmplIds": []}
+            logger.error(f"Error getting template filters: {e}")
+            return empty_template_filters()
 
-    @action(methods=['get'], detail=False)
-    def jqgrid_config(self, request, *args, **kwargs):
-        """Return jqGrid configuration in compatible format"""
+    def build_jqgrid_config(self):
+        """Build the jqgrid_config payload from scratch"""
         self.initgrid()
 
         response_data = {
@@ -805,7 +881,318 @@ class JqGridConfigMixin:
                 if key not in response_data:
                     response_data[key] = value
 
-        return Response(response_data)
+        # Frozen so the payload can be shared between requests and cached
+        return freeze(response_data)
+
+    def get_jqgrid_config(self):
+        """
+        Return the jqgrid_config payload and its ETag, served from the
+        compiled config cache unless `jqgrid_config_cache` is disabled
+        """
+        if not (self.jqgrid_config_cache and is_config_cache_enabled()):
+            config = self.build_jqgrid_config()
+            return config, compute_config_etag(config)
+
+        serializer_class = self.serializer_class or self.get_serializer_class()
+        return get_or_build_config(type(self), serializer_class, self.build_jqgrid_config)
+
+    @action(methods=['get'], detail=False)
+    def jqgrid_config(self, request, *args, **kwargs):
+        """Return jqGrid configuration in compatible format"""
+        config, etag = self.get_jqgrid_config()
+
+        # Let browsers revalidate with If-None-Match and get a 304
+        if etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(config)
+
+        response['ETag'] = etag
+        response['X-JqGrid-Config-Version'] = get_config_version()
+        response['Cache-Control'] = 'private, no-cache'
+        return response
+
+    def get_renderers(self):
+        """Swap DRF's JSONRenderer for JqGridJSONRenderer on jqGrid-paginated viewsets"""
+        renderers = super().get_renderers()
+        pagination_class = getattr(self, 'pagination_class', None)
+        if not (self.jqgrid_json_renderer and isinstance(pagination_class, type)
+                and issubclass(pagination_class, JqGridPagination)):
+            return renderers
+        # Subclasses of JSONRenderer are project renderers and are kept
+        return [JqGridJSONRenderer() if type(renderer) is JSONRenderer else renderer for renderer in renderers]
+
+    def get_requested_columns(self):
+        """
+        Return the serializer fields named by the `columns` parameter of a list
+        request (always including `key_field`), or None to render all fields
+        """
+        if getattr(self, 'action', None) != 'list' or getattr(self, 'request', None) is None:
+            return None
+        if not hasattr(self, '_requested_columns'):
+            self._requested_columns = None
+            requested = self.request.query_params.get(self.columns_param, '')
+            if requested and requested != 'all':
+                available = self.get_serializer_class()().fields
+                names = [name.strip() for name in requested.split(',')]
+                columns = [name for name in names if name in available]
+                if self.key_field in available and self.key_field not in columns:
+                    columns.insert(0, self.key_field)
+                self._requested_columns = columns or None
+        return self._requested_columns
+
+    def get_query_plan_fields(self):
+        """Return the serializer fields rendered per row, or None for all of them"""
+        return self.get_requested_columns()
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        columns = self.get_requested_columns()
+        if columns is not None:
+            # Drop the fields of columns the grid does not display
+            target = getattr(serializer, 'child', serializer)
+            for name in list(target.fields):
+                if name not in columns:
+                    target.fields.pop(name)
+        return serializer
+
+    def get_query_plan(self, model):
+        """Return the compiled QueryPlan for this viewset's serializer"""
+        serializer_class = self.get_serializer_class()
+        fields = self.get_query_plan_fields()
+        key = (type(self), serializer_class, model, frozenset(fields) if fields is not None else None)
+
+        plan = query_plans.get(key)
+        if plan is None:
+            plan = build_query_plan(model, serializer_class(), fields)
+            query_plans.set(key, plan)
+        return plan
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        register_model(queryset.model)
+        plan = None
+        if self.jqgrid_query_plan and getattr(self, 'action', None) in self.jqgrid_query_plan_actions:
+            self.query_plan = plan = self.get_query_plan(queryset.model)
+            queryset = plan.apply(queryset)
+
+        # Column projection: only load the model columns the requested fields read.
+        # The plan resolves those columns even when it is not applied
+        if self.get_requested_columns() is not None:
+            plan = plan or self.get_query_plan(queryset.model)
+            if plan.columns is not None:
+                queryset = queryset.only(*sorted(plan.columns))
+        return queryset
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        # Debug report of the relations loaded for this request
+        plan = getattr(self, 'query_plan', None)
+        if plan is not None and settings.DEBUG:
+            response['X-JqGrid-Query-Plan'] = plan.report()
+        return response
+
+    def get_row_format(self):
+        """Return the row format of list responses, 'objects' or 'cells'"""
+        pagination_class = getattr(self, 'pagination_class', None)
+        return self.jqgrid_row_format or getattr(pagination_class, 'row_format', None) or 'objects'
+
+    def get_cell_columns(self):
+        """Return the column order of `cells` rows: every colModel column"""
+        config, _ = self.get_jqgrid_config()
+        return [column['name'] for column in config['jqgrid_options']['colModel']]
+
+    def get_fast_row_fields(self):
+        """Return the serializer fields rendered by the fast row path: the colModel columns"""
+        config, _ = self.get_jqgrid_config()
+        names = [column['name'] for column in config['jqgrid_options']['colModel']]
+        requested = self.get_requested_columns()
+        if requested is not None:
+            names = [name for name in names if name in requested]
+        return names
+
+    def get_fast_renderer(self):
+        """
+        Return the compiled FastRowRenderer for this viewset, or None when the
+        fast row path is off or a column needs the serializer
+        """
+        if not self.jqgrid_fast_rows:
+            return None
+
+        serializer_class = self.get_serializer_class()
+        model = getattr(serializer_class.Meta, 'model', None)
+        requested = self.get_requested_columns()
+        key = (type(self), serializer_class, model, frozenset(requested) if requested is not None else None)
+
+        renderer = fast_renderers.get(key, _NOT_BUILT)
+        if renderer is _NOT_BUILT:
+            renderer = None
+            if model is not None:
+                renderer = build_fast_renderer(model, serializer_class(), self.get_fast_row_fields())
+                if renderer.unsupported:
+                    logger.warning(
+                        "%s renders rows with its serializer: %s",
+                        type(self).__name__, '; '.join(renderer.unsupported)
+                    )
+                    renderer = None
+            fast_renderers.set(key, renderer)
+        return renderer
+
+    def list_fast_rows(self, renderer):
+        """List rows from `values()` through the fast row renderer"""
+        queryset = self.filter_queryset(self.get_queryset())
+        lookups = renderer.lookups
+        get_ordering = getattr(self.paginator, 'get_ordering', None)
+        if get_ordering is not None:
+            # Keyset cursors are read from the sort and key fields of the last row;
+            # render() only outputs the columns, dropping these extra lookups
+            ordering = [term.lstrip('-') for term in get_ordering(self.request, queryset, self)]
+            lookups = lookups + [lookup for lookup in ordering if lookup not in lookups]
+        rows = queryset.prefetch_related(None).values(*lookups)
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(renderer.render(page))
+        return Response(renderer.render(rows))
+
+    def get_group_field(self, request):
+        """
+        Return the model field named by the `group_by` parameter, or None.
+        Only fields listed in `groupable_fields` can be grouped.
+        """
+        group_by = request.query_params.get(self.group_by_param)
+        if not group_by:
+            return None
+        if group_by not in getattr(self, 'groupable_fields', []):
+            raise ValidationError(f"`{group_by}` is not a groupable field.")
+
+        model_field = resolve_model_path(self.get_queryset().model, group_by)
+        if model_field is None:
+            raise ValidationError(f"`{group_by}` is not a groupable field.")
+        return group_by, model_field
+
+    def get_group_filter(self, group_by, model_field, value):
+        """Build the lookup selecting the rows of one group"""
+        if value == self.group_null_value:
+            return {f"{group_by}__isnull": True}
+        if isinstance(model_field, BooleanField):
+            return {group_by: value.lower() in ('true', '1', 't', 'yes')}
+        return {group_by: model_field.to_python(value)}
+
+    def get_group_labels(self, model_field, values):
+        """Return display labels for group values (choices and foreign keys)"""
+        if model_field.choices:
+            choices = dict(model_field.flatchoices)
+            return {value: str(choices.get(value, value)) for value in values}
+        if model_field.is_relation and model_field.related_model is not None:
+            related = model_field.related_model._default_manager.in_bulk(
+                [value for value in values if value is not None])
+            return {value: str(related[value]) for value in values if value in related}
+        return {}
+
+    def get_group_headers(self, queryset, group_by, model_field):
+        """
+        Compute group headers with row counts and `aggregation_fields` summaries
+        in one `values().annotate()` query.
+        """
+        aggregation_fields = get_valid_aggregation_fields(queryset, getattr(self, 'aggregation_fields', {}))
+        expressions = build_aggregate_expressions(aggregation_fields)
+        descending = self.request.query_params.get('sord', 'asc').lower() == 'desc'
+
+        groups = list(
+            queryset.order_by().prefetch_related(None)
+            .values(group_by)
+            .annotate(_group_count=Count('pk'), **expressions)
+            .order_by(f"-{group_by}" if descending else group_by)[:self.grouping_max_groups + 1]
+        )
+        truncated = len(groups) > self.grouping_max_groups
+        groups = groups[:self.grouping_max_groups]
+
+        labels = self.get_group_labels(model_field, [group[group_by] for group in groups])
+        headers = []
+        for group in groups:
+            value = group[group_by]
+            headers.append({
+                'value': value,
+                'label': labels.get(value, '' if value is None else str(value)),
+                'count': group['_group_count'],
+                'summary': to_userdata({key: group[key] for key in expressions}, aggregation_fields),
+            })
+        return headers, truncated
+
+    def list(self, request, *args, **kwargs):
+        """
+        List rows; identical requests in flight together share one execution
+        when `jqgrid_single_flight` is enabled
+        """
+        key = self.get_single_flight_key(request)
+        if key is None:
+            return self.list_rows(request, *args, **kwargs)
+
+        response, shared = list_flights.do(
+            key, lambda: self.list_rows(request, *args, **kwargs),
+            timeout=get_performance_setting('SINGLE_FLIGHT_TIMEOUT', 30)
+        )
+        if not shared:
+            return response
+        # Same data, own response object: rendering is per request
+        headers = {name: value for name, value in response.items() if name.lower() != 'content-type'}
+        return Response(response.data, status=response.status_code, headers=headers)
+
+    def get_single_flight_key(self, request):
+        """
+        Return the key identical list requests share, or None to run the request
+        on its own. Requests match on viewset, user, path and query parameters
+        other than `single_flight_ignored_params`, in any order.
+        """
+        if not self.jqgrid_single_flight or request.method != 'GET':
+            return None
+        user = getattr(request, 'user', None)
+        user_id = user.pk if user is not None and user.is_authenticated else 'anon'
+        params = tuple(sorted(
+            (name, tuple(values)) for name, values in request.query_params.lists()
+            if name not in self.single_flight_ignored_params
+        ))
+        return (f"{type(self).__module__}.{type(self).__qualname__}", user_id, request.path, params)
+
+    def list_rows(self, request, *args, **kwargs):
+        """
+        List rows; with `group_by` return group headers, and with `group_by`
+        plus `group_value` list the rows of that group only.
+        """
+        try:
+            group = self.get_group_field(request)
+            if group is not None and self.group_value_param in request.query_params:
+                self.group_filter = self.get_group_filter(
+                    *group, request.query_params[self.group_value_param])
+        except ValidationError as e:
+            return Response({"status": "error", "message": e.messages[0]}, status=status.HTTP_400_BAD_REQUEST)
+
+        if group is None or getattr(self, 'group_filter', None) is not None:
+            renderer = self.get_fast_renderer()
+            if renderer is not None:
+                return self.list_fast_rows(renderer)
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        headers, truncated = self.get_group_headers(queryset, *group)
+        aggregation_fields = getattr(self, 'aggregation_fields', {})
+        return Response({
+            'page': 1,
+            'total_pages': 1,
+            'records': len(headers),
+            'userdata': compute_aggregates(queryset, aggregation_fields) if aggregation_fields else {},
+            'group_by': group[0],
+            'truncated': truncated,
+            'data': headers,
+        })
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        group_filter = getattr(self, 'group_filter', None)
+        if group_filter:
+            queryset = queryset.filter(**group_filter)
+        return queryset
 
     @action(methods=['post'], detail=False, url_path='crud')
     def crud(self, request, *args, **kwargs):
@@ -848,8 +1235,13 @@ class JqGridConfigMixin:
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status
-from django.core.exceptions import ValidationError
+from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.db import transaction
+from django.db.models import DateField, DateTimeField, QuerySet, TimeField
+from django.db.models.signals import post_save, pre_save
+from django.utils import timezone
+import datetime
+import json
 import logging
 
 logger = logging.getLogger(__name__)
@@ -864,6 +1256,25 @@ class JqGridBulkActionMixin:
     # Optional per-view override: limit fields that can be bulk updated
     allowed_bulk_fields = []
 
+    # How updates are written: 'auto', 'update', 'bulk_update' or 'save'.
+    # 'auto' issues a single UPDATE unless the model has pre_save/post_save
+    # receivers, in which case every row is saved so the receivers still run.
+    # 'update' and 'bulk_update' send no signals.
+    bulk_update_strategy = 'auto'
+    # Rows loaded per batch by the 'save' and 'bulk_update' strategies
+    bulk_update_batch_size = 500
+    # IDs per `IN` list; longer ID selections are processed in chunks, staying
+    # below SQLite's variable limit and keeping PostgreSQL plans cheap
+    bulk_id_chunk_size = 900
+    # Accept `"scope": "all"` selections: every row matching the grid filters
+    bulk_select_all = True
+    # Most `excluded_ids` an "all" selection may carry; they go into one
+    # `NOT IN` list, which must stay below the backend's parameter limit
+    bulk_max_excluded_ids = 900
+
+    BULK_UPDATE_STRATEGIES = ('auto', 'update', 'bulk_update', 'save')
+    BULK_SCOPES = ('specific', 'all')
+
     def get_bulk_queryset(self, ids):
         """
         Return queryset filtered by IDs (safe lookup)
@@ -874,6 +1285,47 @@ class JqGridBulkActionMixin:
             logger.error(f"Error filtering bulk queryset: {e}")
             return self.get_queryset().none()
 
+    def get_bulk_filter_queryset(self, filters, search=True, excluded_ids=None, confirm_all=False):
+        """
+        Return the rows an `"all"` selection covers: the queryset filtered with
+        the grid's `filters` through JqGridFilterBackend, minus `excluded_ids`.
+
+        Every filter rule must apply; without any, the selection covers the
+        whole queryset and needs `confirm_all`.
+        """
+        queryset = self.get_queryset()
+        filter_q = None
+        if filters and search:
+            if not isinstance(filters, str):
+                filters = json.dumps(filters)
+            try:
+                filter_q = JqGridFilterBackend().get_filter_q(queryset.model, self, filters, strict=True)
+            except json.JSONDecodeError:
+                raise ValidationError("Invalid `filters` JSON.")
+            except ValueError as e:
+                raise ValidationError(str(e))
+        if filter_q:
+            queryset = queryset.filter(filter_q)
+        elif not confirm_all:
+            raise ValidationError("No filters apply; pass `confirm_all: true` to act on every row.")
+        if excluded_ids:
+            queryset = queryset.exclude(pk__in=excluded_ids)
+        return queryset
+
+    def get_bulk_querysets(self, data, ids):
+        """
+        Return the querysets a bulk action runs on: one for an `"all"` selection,
+        one per `bulk_id_chunk_size` IDs otherwise.
+        """
+        if data.get("scope") == "all":
+            search = data.get("_search", True) not in (False, "false")
+            return [self.get_bulk_filter_queryset(
+                data.get("filters"), search, data.get("excluded_ids"), data.get("confirm_all") is True
+            )]
+
+        size = self.bulk_id_chunk_size or len(ids)
+        return [self.get_bulk_queryset(ids[start:start + size]) for start in range(0, len(ids), size)]
+
     def get_bulk_editable_fields(self):
         """
         Get allowed fields for bulk update from serializer (or override via `allowed_bulk_fields`)
@@ -896,10 +1348,26 @@ class JqGridBulkActionMixin:
         if not isinstance(data, dict):
             raise ValidationError("Invalid payload format.")
 
-        ids = data.get("ids", [])
+        scope = data.get("scope") or "specific"
+        ids = data.get("ids", []) if scope == "specific" else []
         action_data = data.get("action", {})
 
-        if not isinstance(ids, list) or not ids:
+        if scope not in self.BULK_SCOPES:
+            raise ValidationError(f"`scope` must be one of: {', '.join(self.BULK_SCOPES)}.")
+
+        if scope == "all":
+            if not self.bulk_select_all:
+                raise ValidationError("Bulk actions on all matching rows are disabled.")
+            excluded_ids = data.get("excluded_ids") or []
+            if not isinstance(excluded_ids, list):
+                raise ValidationError("`excluded_ids` must be a list.")
+            if len(excluded_ids) > self.bulk_max_excluded_ids:
+                raise ValidationError(
+                    f"At most {self.bulk_max_excluded_ids} rows can be excluded from an \"all\" selection."
+                )
+            if not isinstance(data.get("filters") or "", (str, dict)):
+                raise ValidationError("`filters` must be a jqGrid filters object.")
+        elif not isinstance(ids, list) or not ids:
             raise ValidationError("No valid IDs provided.")
 
         if not isinstance(action_data, dict):
@@ -911,18 +1379,120 @@ class JqGridBulkActionMixin:
 
         return ids, action_data
 
+    def get_bulk_update_strategy(self, model):
+        """
+        Resolve the strategy used to write a bulk update for ``model``.
+        """
+        strategy = self.bulk_update_strategy
+        if strategy not in self.BULK_UPDATE_STRATEGIES:
+            raise ValueError(
+                f"Unknown bulk_update_strategy '{strategy}'. "
+                f"Choose from: {', '.join(self.BULK_UPDATE_STRATEGIES)}"
+            )
+
+        if strategy == 'auto':
+            # The cache invalidation receivers are covered by bump_generation()
+            if has_other_listeners(pre_save, model) or has_other_listeners(post_save, model):
+                return 'save'
+            return 'update'
+
+        return strategy
+
+    def prepare_bulk_updates(self, model, updates):
+        """
+        Convert submitted values with the model fields and add ``auto_now`` fields,
+        which neither ``update()`` nor ``bulk_update()`` set on their own.
+
+        Returns:
+            Dict mapping model fields to their new values
+        """
+        prepared = {}
+        for name, value in updates.items():
+            try:
+                field = model._meta.get_field(name)
+            except FieldDoesNotExist:
+                raise ValidationError(f"`{name}` is not a model field and cannot be bulk updated.")
+            prepared[field] = field.to_python(value)
+
+        now = timezone.now()
+        for field in model._meta.concrete_fields:
+            if not getattr(field, 'auto_now', False) or field in prepared:
+                continue
+            if isinstance(field, DateTimeField):
+                prepared[field] = now
+            elif isinstance(field, DateField):
+                prepared[field] = datetime.date.today()
+            elif isinstance(field, TimeField):
+                prepared[field] = datetime.datetime.now().time()
+
+        return prepared
+
+    def apply_bulk_updates(self, obj, updates):
+        """
+        Apply prepared updates to a single instance — override for per-instance logic
+        in the 'bulk_update' and 'save' strategies.
+        """
+        for field, value in updates.items():
+            setattr(obj, field.attname, value)
+
     def process_bulk_update(self, objs, updates):
         """
-        Process bulk update (default version) — override for custom logic.
+        Process bulk update using the configured ``bulk_update_strategy``.
+
+        Args:
+            objs: Queryset (or iterable of instances) to update
+            updates: Mapping of field names to submitted values
+
+        Returns:
+            Dict with the number of updated rows under ``updated``
         """
+        if not isinstance(objs, QuerySet):
+            objs = list(objs)
+            if not objs:
+                return {"updated": 0}
+        model = objs.model if isinstance(objs, QuerySet) else type(objs[0])
+
+        prepared = self.prepare_bulk_updates(model, updates)
+        strategy = self.get_bulk_update_strategy(model)
+
+        if strategy == 'update' and isinstance(objs, QuerySet):
+            updated_count = objs.order_by().update(
+                **{field.name: value for field, value in prepared.items()}
+            )
+            return {"updated": updated_count}
+
+        if isinstance(objs, QuerySet):
+            objs = objs.iterator(chunk_size=self.bulk_update_batch_size)
+
         updated_count = 0
+        if strategy == 'save':
+            for obj in objs:
+                self.apply_bulk_updates(obj, prepared)
+                obj.save()
+                updated_count += 1
+            return {"updated": updated_count}
+
+        field_names = [field.name for field in prepared]
+        batch = []
         for obj in objs:
-            for key, val in updates.items():
-                setattr(obj, key, val)
-            obj.save()
-            updated_count += 1
+            self.apply_bulk_updates(obj, prepared)
+            batch.append(obj)
+            if len(batch) >= self.bulk_update_batch_size:
+                model._base_manager.bulk_update(batch, field_names)
+                updated_count += len(batch)
+                batch = []
+        if batch:
+            model._base_manager.bulk_update(batch, field_names)
+            updated_count += len(batch)
+
         return {"updated": updated_count}
 
+    def bulk_not_found_response(self):
+        return Response({
+            "status": "error",
+            "message": "No matching records found."
+        }, status=status.HTTP_404_NOT_FOUND)
+
     @action(methods=['post'], detail=False)
     def bulk_action(self, request):
         """
@@ -945,25 +1515,33 @@ class JqGridBulkActionMixin:
                 "_delete": true
             }
         }
+
+        For every row matching the grid filters, except some:
+        {
+            "scope": "all",
+            "filters": "{\"groupOp\": \"AND\", \"rules\": [...]}",
+            "excluded_ids": [4, 5],
+            "action": {...}
+        }
         """
         try:
             ids, action_data = self.validate_bulk_data(request.data)
 
             is_delete = action_data.get("_delete", False)
-            queryset = self.get_bulk_queryset(ids)
-
-            if not queryset.exists():
-                return Response({
-                    "status": "error",
-                    "message": "No matching records found."
-                }, status=status.HTTP_404_NOT_FOUND)
+            querysets = self.get_bulk_querysets(request.data, ids)
+            model, using = querysets[0].model, querysets[0].db
 
             if is_delete:
-                deleted_count = queryset.delete()[0]
+                with transaction.atomic(using=using):
+                    deleted_count = sum(queryset.delete()[0] for queryset in querysets)
+                if not deleted_count:
+                    return self.bulk_not_found_response()
+                bump_generation(model, using)
                 return Response({
                     "status": "success",
                     "message": f"Deleted {deleted_count} records.",
-                    "deleted_ids": ids
+                    "deleted_ids": ids,
+                    "scope": request.data.get("scope") or "specific"
                 })
 
             # Validate editable fields
@@ -976,14 +1554,22 @@ class JqGridBulkActionMixin:
                 }, status=status.HTTP_400_BAD_REQUEST)
 
             # Proceed with update
-            with transaction.atomic():
-                result = self.process_bulk_update(queryset, action_data)
+            with transaction.atomic(using=using):
+                result = {"updated": 0}
+                for queryset in querysets:
+                    result["updated"] += self.process_bulk_update(queryset, action_data)["updated"]
+
+            if not result.get("updated"):
+                return self.bulk_not_found_response()
+            # update() and bulk_update() send no signals
+            bump_generation(model, using)
 
             return Response({
                 "status": "success",
-                "message": f"Updated {queryset.count()} records.",
+                "message": f"Updated {result['updated']} records.",
                 "results": result,
-                "updated_ids": ids
+                "updated_ids": ids,
+                "scope": request.data.get("scope") or "specific"
             })
 
         except ValidationError as e:
@@ -995,3 +1581,571 @@ class JqGridBulkActionMixin:
                 "status": "error",
                 "message": "An unexpected error occurred."
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class JqGridJobMixin:
+    """
+    Background job support shared by the import and export mixins: requests
+    sent with `async=true` are queued (see django_jqgrid.jobs) and the `jobs`
+    action reports their progress and serves the result file.
+    """
+
+    # Request parameter that switches import/export to a background job
+    job_param = 'async'
+    # Always run imports/exports as background jobs
+    jqgrid_background_jobs = False
+
+    def wants_background_job(self, request):
+        if self.jqgrid_background_jobs:
+            return True
+        value = request.query_params.get(self.job_param) or request.data.get(self.job_param)
+        return str(value).lower() in ('1', 'true', 'yes')
+
+    def job_accepted_response(self, request, job):
+        return Response({
+            "status": True,
+            "job_id": job['id'],
+            "state": job['state'],
+            "status_url": request.build_absolute_uri(f"../jobs/{job['id']}/"),
+        }, status=status.HTTP_202_ACCEPTED)
+
+    def get_job_for_request(self, request, job_id):
+        """Return the job if it belongs to this viewset and to the requesting user"""
+        job = jobs.get_job(job_id)
+        if job is None or job['view'] != f"{type(self).__module__}.{type(self).__qualname__}":
+            return None
+        user_id = request.user.pk if request.user.is_authenticated else None
+        if job['owner'] != user_id:
+            return None
+        return job
+
+    @action(methods=['get'], detail=False, url_path=r'jobs/(?P<job_id>[0-9a-f]{32})')
+    def job_status(self, request, job_id=None, *args, **kwargs):
+        """
+        Report the state of a background job; `?download=1` returns the result
+        file of a finished export.
+        """
+        job = self.get_job_for_request(request, job_id)
+        if job is None:
+            return Response({"status": False, "message": "Job not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        if request.query_params.get('download'):
+            if job['state'] != jobs.DONE or not job['file']:
+                return Response({"status": False, "message": "Job has no result file yet."},
+                                status=status.HTTP_409_CONFLICT)
+            return FileResponse(default_storage.open(job['file'], 'rb'), as_attachment=True,
+                                filename=job['filename'], content_type=job['content_type'])
+
+        data = {key: value for key, value in job.items() if key not in ('file', 'owner', 'view')}
+        if job['file']:
+            data['download_url'] = request.build_absolute_uri('?download=1')
+        return Response(data)
+
+
+class JqGridExportMixin(JqGridJobMixin):
+    """
+    Mixin adding a streaming `export_data` action that exports the rows of the
+    grid with the same `filters`/`sidx`/`sord` parameters and colModel columns.
+    """
+
+    # Writers available through the `ext` parameter (see django_jqgrid.export)
+    export_writers = EXPORT_WRITERS
+    # Rows fetched per database round trip; defaults to JQGRID_PERFORMANCE['EXPORT_CHUNK_SIZE']
+    export_chunk_size = None
+    # Download file name without extension; defaults to the model name
+    export_filename = None
+    # Backends applied to the export queryset, in order
+    export_filter_backends = (JqGridFilterBackend, JqGridSortBackend)
+
+    def get_export_model(self):
+        """Return the model being exported"""
+        return self.get_queryset().model
+
+    def get_export_colmodel(self):
+        """Return the colModel entries the export columns are taken from"""
+        if hasattr(self, 'get_jqgrid_config'):
+            config, _ = self.get_jqgrid_config()
+            return config['jqgrid_options']['colModel']
+
+        serializer_class = self.serializer_class or self.get_serializer_class()
+        return [
+            {'name': name, 'label': field.label or name.replace('_', ' ').title()}
+            for name, field in serializer_class().get_fields().items()
+        ]
+
+    def get_export_columns(self, request):
+        """
+        Return the columns to export, optionally narrowed by the comma separated
+        `columns` parameter
+        """
+        requested = request.query_params.get('columns', 'all')
+        requested = None if requested in ('', 'all') else [c.strip() for c in requested.split(',')]
+        return get_export_columns(self.get_export_model(), self.get_export_colmodel(), requested)
+
+    def get_export_queryset(self, request):
+        """Return the queryset filtered and sorted like the grid"""
+        queryset = self.get_queryset()
+        for backend in self.export_filter_backends:
+            queryset = backend().filter_queryset(request, queryset, self)
+
+        ids = request.query_params.get('ids')
+        if ids:
+            queryset = queryset.filter(pk__in=[pk for pk in ids.split(',') if pk])
+
+        return queryset
+
+    def get_export_rows(self, queryset, columns):
+        """Yield export rows as tuples, reading the database in chunks"""
+        chunk_size = self.export_chunk_size or get_export_chunk_size()
+        lookups = [column.lookup for column in columns]
+        return queryset.values_list(*lookups).iterator(chunk_size=chunk_size)
+
+    def get_export_filename(self, writer):
+        name = self.export_filename or self.get_export_model()._meta.model_name
+        return f"{name}.{writer.extension}"
+
+    @action(methods=['get'], detail=False)
+    def export_data(self, request, *args, **kwargs):
+        """
+        Stream the grid rows as a file.
+
+        Query parameters:
+            ext: Export format (csv, json, xlsx, ...)
+            columns: Comma separated column names or `all`
+            ids: Optional comma separated primary keys to export
+            filters, _search, sidx, sord: Same as the grid data request
+            async: `true` to run the export as a background job
+        """
+        ext = request.query_params.get('ext', 'csv')
+        writer_class = self.export_writers.get(ext)
+        if writer_class is None:
+            return Response({
+                "status": "error",
+                "message": f"Unsupported export format: {ext}"
+            }, status=status.HTTP_400_BAD_REQUEST)
+        if not writer_class.available:
+            return Response({
+                "status": "error",
+                "message": f"{ext} export is not available on this server."
+            }, status=status.HTTP_501_NOT_IMPLEMENTED)
+
+        columns = self.get_export_columns(request)
+        if not columns:
+            return Response({
+                "status": "error",
+                "message": "No exportable columns selected."
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        if self.wants_background_job(request):
+            job = create_job('export', type(self), request.user)
+            job = enqueue_job(job, 'django_jqgrid.jobs.run_export_job', {
+                'view_path': job['view'],
+                'query_string': request.META.get('QUERY_STRING', ''),
+                'ext': ext,
+                'user_id': job['owner'],
+            })
+            return self.job_accepted_response(request, job)
+
+        writer = writer_class()
+        rows = self.get_export_rows(self.get_export_queryset(request), columns)
+
+        response = StreamingHttpResponse(writer.stream(columns, rows), content_type=writer.content_type)
+        response['Content-Disposition'] = f'attachment; filename="{self.get_export_filename(writer)}"'
+        return response
+
+
+class JqGridImportMixin(JqGridJobMixin):
+    """
+    Mixin adding a batched `import_data` action compatible with jqgrid-import-export.js.
+
+    Rows are streamed from the upload, validated one batch at a time through the
+    viewset serializer (`many=True`), and inserted with `bulk_create()` one batch at a time. Foreign keys are
+    resolved with one query per batch and invalid rows are reported without
+    aborting the rest of the file.
+    """
+
+    # Readers available by file extension (see django_jqgrid.importer)
+    import_readers = IMPORT_READERS
+    # Rows validated and inserted per batch
+    import_batch_size = 500
+    # Foreign key field -> related model field used to match imported values (default pk)
+    import_lookup_fields = {}
+    # Maximum number of row errors returned in the response
+    import_max_errors = 100
+
+    def get_import_rows(self, import_file):
+        """Return an iterator over the upload rows as dictionaries"""
+        extension = import_file.name.rsplit('.', 1)[-1].lower()
+        reader = self.import_readers.get(extension)
+        if reader is None:
+            raise ValidationError(f"Unsupported import format: {extension}")
+        return reader(import_file)
+
+    def map_import_row(self, row, mapped_columns, default_values):
+        """
+        Build serializer input from a file row. Blank cells are treated as missing
+        so that `default_values` and serializer defaults apply.
+        """
+        if mapped_columns:
+            data = {field: row.get(header) for field, header in mapped_columns.items() if header}
+        else:
+            data = dict(row)
+
+        data = {
+            field: value.strip() if isinstance(value, str) else value
+            for field, value in data.items()
+            if value is not None and not (isinstance(value, str) and not value.strip())
+        }
+        for field, value in default_values.items():
+            if value not in (None, '') and field not in data:
+                data[field] = value
+        return data
+
+    def get_import_resolver(self, model):
+        return ForeignKeyResolver(model, self.import_lookup_fields)
+
+    def build_import_instance(self, model, validated_data):
+        """Build an unsaved instance from validated data — override for custom logic"""
+        return model(**{
+            name: value for name, value in validated_data.items()
+            if not model._meta.get_field(name).many_to_many
+        })
+
+    def validate_import_batch(self, model, batch):
+        """
+        Validate a batch of (row number, data) pairs.
+
+        Returns:
+            Tuple of (list of (row number, instance), list of row errors)
+        """
+        resolver = self.get_import_resolver(model)
+        field_names = {name for _, data in batch for name in data}
+        foreign_keys = resolver.get_foreign_keys(field_names)
+        lookups = {
+            name: resolver.build_lookup(field, [data[name] for _, data in batch if name in data])
+            for name, field in foreign_keys.items()
+        }
+
+        # Foreign keys are resolved from the batch lookups, not by the serializer
+        row_errors, related, rows = [], [], []
+        for _, data in batch:
+            row_error, resolved = {}, {}
+            for name, field in foreign_keys.items():
+                if name not in data:
+                    if not (field.null or field.has_default()):
+                        row_error[name] = ["This field is required."]
+                    continue
+                obj = resolver.match(lookups[name], data[name])
+                if obj is None:
+                    row_error[name] = [f"No match for '{data[name]}'."]
+                else:
+                    resolved[name] = obj
+            row_errors.append(row_error)
+            related.append(resolved)
+            rows.append({name: value for name, value in data.items() if name not in foreign_keys})
+
+        serializer = self.get_serializer(data=rows, many=True)
+        for name in foreign_keys:
+            serializer.child.fields.pop(name, None)
+
+        if serializer.is_valid():
+            validated = serializer.validated_data
+        else:
+            # A failing batch reports errors per row; the valid rows are
+            # validated again on their own to get their data
+            validated = []
+            for data, row_error, serializer_errors in zip(rows, row_errors, serializer.errors):
+                row_error.update(serializer_errors)
+                validated.append(None if row_error else serializer.child.run_validation(data))
+
+        instances, errors = [], []
+        for (row_number, _), resolved, validated_data, row_error in zip(batch, related, validated, row_errors):
+            if row_error:
+                errors.append({"row": row_number, "errors": row_error})
+                continue
+            instances.append((row_number, self.build_import_instance(model, {**validated_data, **resolved})))
+
+        return instances, errors
+
+    def save_import_batch(self, model, instances):
+        """
+        Insert a batch with `bulk_create()`. When the batch violates a constraint,
+        rows are retried one by one to report the failing rows.
+
+        Returns:
+            Tuple of (number of inserted rows, list of row errors)
+        """
+        if not instances:
+            return 0, []
+
+        try:
+            with transaction.atomic():
+                model._default_manager.bulk_create(
+                    [instance for _, instance in instances], batch_size=self.import_batch_size)
+            return len(instances), []
+        except IntegrityError:
+            logger.info("Import batch failed a constraint; retrying rows individually")
+
+        inserted, errors = 0, []
+        for row_number, instance in instances:
+            try:
+                with transaction.atomic():
+                    model._default_manager.bulk_create([instance])
+                inserted += 1
+            except IntegrityError as e:
+                errors.append({"row": row_number, "errors": {"non_field_errors": [str(e)]}})
+        return inserted, errors
+
+    @action(methods=['post'], detail=False)
+    def import_data(self, request, *args, **kwargs):
+        """
+        Import rows from an uploaded CSV or XLSX file.
+
+        Form data:
+            import_file: The uploaded file
+            mapped_columns: JSON object mapping model fields to file headers
+            default_values: JSON object of values used for missing cells
+            async: `true` to run the import as a background job
+        """
+        import_file = request.FILES.get('import_file')
+        if not import_file:
+            return Response({"status": False, "message": "No file provided."},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            mapped_columns = json.loads(request.data.get('mapped_columns') or '{}')
+            default_values = json.loads(request.data.get('default_values') or '{}')
+        except json.JSONDecodeError:
+            return Response({"status": False, "message": "Invalid mapping configuration."},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            rows = self.get_import_rows(import_file)
+        except ValidationError as e:
+            return Response({"status": False, "message": e.messages[0]}, status=status.HTTP_400_BAD_REQUEST)
+        except ImportError as e:
+            return Response({"status": False, "message": str(e)}, status=status.HTTP_501_NOT_IMPLEMENTED)
+
+        if self.wants_background_job(request):
+            job = create_job('import', type(self), request.user)
+            upload_path = default_storage.save(get_job_storage_path(job['id'], import_file.name), import_file)
+            job = enqueue_job(job, 'django_jqgrid.jobs.run_import_job', {
+                'view_path': job['view'],
+                'upload_path': upload_path,
+                'mapped_columns': mapped_columns,
+                'default_values': default_values,
+                'user_id': job['owner'],
+            })
+            return self.job_accepted_response(request, job)
+
+        return Response(self.run_import(rows, mapped_columns, default_values))
+
+    def run_import(self, rows, mapped_columns, default_values, progress=None):
+        """
+        Import file rows in batches.
+
+        Args:
+            rows: Iterator of row dictionaries from `get_import_rows()`
+            mapped_columns: Mapping of model fields to file headers
+            default_values: Values used for missing cells
+            progress: Optional callable receiving (rows processed, error count)
+
+        Returns:
+            Result dict with `imported_count`, `error_count` and `errors`
+        """
+        model = self.get_queryset().model
+        imported, errors, error_count = 0, [], 0
+
+        def flush(batch):
+            nonlocal imported, error_count
+            instances, batch_errors = self.validate_import_batch(model, batch)
+            inserted, insert_errors = self.save_import_batch(model, instances)
+            imported += inserted
+            for error in batch_errors + insert_errors:
+                error_count += 1
+                if len(errors) < self.import_max_errors:
+                    errors.append(error)
+            if progress is not None:
+                progress(imported + error_count, error_count)
+
+        batch = []
+        # Row 1 is the header
+        row_number = 1
+        try:
+            for row_number, row in enumerate(rows, start=2):
+                batch.append((row_number, self.map_import_row(row, mapped_columns, default_values)))
+                if len(batch) >= self.import_batch_size:
+                    flush(batch)
+                    batch = []
+        except (UnicodeDecodeError, csv.Error) as e:
+            # Keep the rows read so far and report where the file became unreadable
+            error_count += 1
+            errors.append({"row": row_number + 1, "errors": {"non_field_errors": [f"Unreadable file: {e}"]}})
+        if batch:
+            flush(batch)
+        if imported:
+            # bulk_create() sends no signals
+            bump_generation(model)
+
+        return {
+            "status": True,
+            "message": f"Imported {imported} records." + (f" {error_count} rows failed." if error_count else ""),
+            "imported_count": imported,
+            "error_count": error_count,
+            "errors": sorted(errors, key=lambda error: error["row"]),
+        }
+
+
+class JqGridDropdownMixin:
+    """
+    Mixin serving option lists for select editors, search selects and select2.
+
+    Options are read with `values_list()` as `{"id": value, "text": label}`
+    items, filtered by a search term and paged. Pages are cached per model,
+    field, term and page until a row of the model is saved or deleted, and are
+    sent with an ETag so unchanged lists revalidate with a 304.
+
+    Cached pages are shared by all users: when `get_dropdown_queryset()` depends
+    on the user, add it in `get_dropdown_cache_parts()`.
+    """
+
+    # Column sent as the option value
+    dropdown_value_field = 'pk'
+    # Column sent as the option label; defaults to the first CharField of the model
+    dropdown_text_field = None
+    # Columns matched against the search term; defaults to the text field
+    dropdown_search_fields = None
+    dropdown_search_lookup = 'icontains'
+    # select2 sends `search` (or `term`) and `page`
+    dropdown_search_param = 'search'
+    dropdown_page_size = 30
+    # Upper bound of unpaged lists (`all=true`, used by jqGrid select editors)
+    dropdown_max_results = 1000
+    # Seconds option pages are cached; None uses DROPDOWN_CACHE_TIMEOUT, 0 disables
+    dropdown_cache_timeout = None
+
+    def get_dropdown_queryset(self):
+        """Return the rows offered in the dropdown (e.g. only active ones)"""
+        return self.get_queryset()
+
+    def get_dropdown_text_field(self, model):
+        if self.dropdown_text_field:
+            return self.dropdown_text_field
+        for field in model._meta.concrete_fields:
+            if isinstance(field, CharField):
+                return field.name
+        return self.dropdown_value_field
+
+    def get_dropdown_search_fields(self, model):
+        return self.dropdown_search_fields or [self.get_dropdown_text_field(model)]
+
+    def get_dropdown_term(self, request):
+        return (request.query_params.get(self.dropdown_search_param)
+                or request.query_params.get('term') or '').strip()
+
+    def get_dropdown_page(self, request):
+        try:
+            return max(int(request.query_params.get('page', 1)), 1)
+        except (TypeError, ValueError):
+            return 1
+
+    def get_dropdown_cache_parts(self, request, selected=None):
+        """Return the values identifying an option page in the cache"""
+        return [
+            f"{type(self).__module__}.{type(self).__qualname__}",
+            request.query_params.get('field_name', ''),
+            self.get_dropdown_term(request),
+            self.get_dropdown_page(request),
+            request.query_params.get('all') == 'true',
+            selected,
+        ]
+
+    def get_dropdown_options(self, request, selected=None):
+        """
+        Build one page of options.
+
+        Returns:
+            `{"data": [{"id", "text"}], "page": n, "more": bool}`; with `selected`
+            the matching option is flagged and always included. Unpaged lists
+            (`all=true`) add `truncated`, true when `dropdown_max_results` cut them
+        """
+        queryset = self.get_dropdown_queryset()
+        model = queryset.model
+        value_field = self.dropdown_value_field
+        text_field = self.get_dropdown_text_field(model)
+
+        term = self.get_dropdown_term(request)
+        if term:
+            condition = Q()
+            for field in self.get_dropdown_search_fields(model):
+                condition |= Q(**{f"{field}__{self.dropdown_search_lookup}": term})
+            queryset = queryset.filter(condition)
+
+        page = self.get_dropdown_page(request)
+        unpaged = request.query_params.get('all') == 'true'
+        if unpaged:
+            page, size = 1, self.dropdown_max_results
+        else:
+            size = self.dropdown_page_size
+        offset = (page - 1) * size
+
+        options = queryset.order_by(text_field, value_field).values_list(value_field, text_field)
+        rows = list(options[offset:offset + size + 1])
+        more = len(rows) > size
+        rows = rows[:size]
+
+        if selected is not None and page == 1 and not any(str(value) == str(selected) for value, _ in rows):
+            rows = list(self.get_dropdown_queryset().filter(**{value_field: selected})
+                        .values_list(value_field, text_field)[:1]) + rows
+
+        data = []
+        for value, text in rows:
+            item = {"id": value, "text": '' if text is None else str(text)}
+            if selected is not None and str(value) == str(selected):
+                item["selected"] = True
+            data.append(item)
+        if unpaged:
+            if more:
+                logger.warning("%s dropdown truncated to %s options", type(self).__name__, size)
+            return {"data": data, "page": page, "more": more, "truncated": more}
+        return {"data": data, "page": page, "more": more}
+
+    def dropdown_response(self, request, selected=None):
+        """Serve an option page from the cache, answering If-None-Match with a 304"""
+        timeout = self.dropdown_cache_timeout
+        if timeout is None:
+            timeout = get_performance_setting('DROPDOWN_CACHE_TIMEOUT', 300)
+        use_cache = bool(timeout) and get_performance_setting('ENABLE_CACHING', True)
+
+        entry = None
+        if use_cache:
+            model = self.get_dropdown_queryset().model
+            dropdown_cache = get_dropdown_cache()
+            cache_key = get_dropdown_cache_key(model, self.get_dropdown_cache_parts(request, selected))
+            entry = dropdown_cache.get(cache_key)
+
+        if entry is None:
+            payload = self.get_dropdown_options(request, selected)
+            entry = (payload, compute_config_etag(payload))
+            if use_cache:
+                dropdown_cache.set(cache_key, entry, timeout)
+
+        payload, etag = entry
+        if etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(payload)
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, no-cache'
+        return response
+
+    @action(methods=['get'], detail=False)
+    def dropdown(self, request, *args, **kwargs):
+        """Return a page of options; `search` filters, `page` pages, `all=true` lists all"""
+        return self.dropdown_response(request)
+
+    @action(methods=['get'], detail=True, url_path='dropdown_pk')
+    def dropdown_pk(self, request, *args, **kwargs):
+        """Return the first page of options with the current value selected"""
+        selected = kwargs.get(self.lookup_url_kwarg or self.lookup_field)
+        return self.dropdown_response(request, selected=selected)
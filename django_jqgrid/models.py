@@ -24,6 +24,10 @@ class GridFilter(models.Model):
         verbose_name = "Grid Filter"
         verbose_name_plural = "Grid Filters"
         ordering = ['-created_at']
+        indexes = [
+            # Saved filters of a table: the user's own, then the global ones
+            models.Index(fields=['table', 'key', 'is_global', 'created_by'], name='jqgrid_filter_lookup_idx'),
+        ]
 
     # def __str__(self):
     #     return f"{self.name}"
@@ -1,17 +1,186 @@
-from django.core.paginator import Paginator
+import base64
+import binascii
+import datetime
+import json
+import logging
+import math
+from functools import reduce
+
+from django.core.cache import caches
+from django.core.exceptions import FieldDoesNotExist
+from django.core.paginator import InvalidPage, Page, Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import F, Q
 from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 
+from django_jqgrid.filters import JqGridSortBackend
+from django_jqgrid.aggregates import compute_aggregates
+from django_jqgrid.invalidation import get_queryset_generation
+from django_jqgrid.utils import get_performance_setting, get_queryset_signature
+
+logger = logging.getLogger(__name__)
+
+
+class CountStrategy:
+    """
+    Base class for the record count strategies used by JqGridPagination.
+
+    Subclasses implement `count()`; `format_records()` turns the count into the
+    value sent to jqGrid as `records`.
+    """
+
+    def count(self, queryset):
+        raise NotImplementedError('count() must be implemented.')
+
+    def format_records(self, count):
+        return count
+
+    def is_lower_bound(self, count):
+        """Return whether more rows than `count` may exist."""
+        return False
+
+
+class ExactCount(CountStrategy):
+    """Plain `SELECT COUNT(*)` over the filtered queryset."""
+
+    def count(self, queryset):
+        return queryset.count()
+
+
+class CachedCount(CountStrategy):
+    """
+    Exact count cached per filter signature (the SQL of the filtered queryset)
+    and the cache generation of the models it reads (see django_jqgrid.invalidation).
+    """
+
+    def __init__(self, timeout=None, cache_alias='default'):
+        self.timeout = timeout
+        self.cache_alias = cache_alias
+
+    def get_cache_key(self, queryset):
+        # Ordering never changes the count, so it is not part of the signature;
+        # the generation changes whenever rows of the models read are written
+        return (
+            f"django_jqgrid_count:{queryset.model._meta.label_lower}:"
+            f"{get_queryset_generation(queryset)}:{get_queryset_signature(queryset)}"
+        )
+
+    def count(self, queryset):
+        cache = caches[self.cache_alias]
+        cache_key = self.get_cache_key(queryset)
+
+        count = cache.get(cache_key)
+        if count is None:
+            count = queryset.count()
+            timeout = self.timeout
+            if timeout is None:
+                timeout = get_performance_setting('COUNT_CACHE_TIMEOUT', 60)
+            cache.set(cache_key, count, timeout)
+        return count
+
+
+class EstimatedCount(CountStrategy):
+    """
+    Planner estimate on PostgreSQL, exact count everywhere else.
+
+    Unfiltered querysets use `pg_class.reltuples`; filtered querysets use the
+    row estimate from `EXPLAIN` when `use_explain` is set. Estimates below
+    `threshold` are replaced by an exact count, which is cheap at that size.
+    """
+
+    def __init__(self, threshold=100000, use_explain=False):
+        self.threshold = threshold
+        self.use_explain = use_explain
+
+    def count(self, queryset):
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return queryset.count()
+
+        try:
+            if not queryset.query.where:
+                estimate = self._estimate_table(queryset, connection)
+            elif self.use_explain:
+                estimate = self._estimate_query(queryset, connection)
+            else:
+                estimate = None
+        except Exception as e:
+            logger.warning(f"Count estimate failed, falling back to exact count: {e}")
+            estimate = None
+
+        if estimate is None or estimate < self.threshold:
+            return queryset.count()
+        return estimate
+
+    def _estimate_table(self, queryset, connection):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table]
+            )
+            row = cursor.fetchone()
+        # reltuples is -1 for tables that were never analyzed
+        return row[0] if row and row[0] >= 0 else None
+
+    def _estimate_query(self, queryset, connection):
+        sql, params = queryset.order_by().query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+
+
+class CappedCount(CountStrategy):
+    """Stop counting after `cap` rows and report `records` as "N+"."""
+
+    def __init__(self, cap=10000):
+        self.cap = cap
+
+    def count(self, queryset):
+        # COUNT over a LIMITed subquery stops scanning at cap + 1 rows
+        return queryset.order_by()[:self.cap + 1].count()
+
+    def format_records(self, count):
+        if count > self.cap:
+            return f"{self.cap}+"
+        return count
+
+    def is_lower_bound(self, count):
+        return count > self.cap
+
+
+# Row formats of the `data` entry: dictionaries, or arrays in column order
+# (jqGrid `jsonReader.repeatitems`) with the column names sent once
+ROW_FORMATS = ('objects', 'cells')
+
+COUNT_STRATEGIES = {
+    'exact': ExactCount,
+    'cached': CachedCount,
+    'estimate': EstimatedCount,
+    'capped': CappedCount,
+}
+
 
 class OptimizedPaginator(Paginator):
     """Optimized paginator that avoids unnecessary count queries."""
-    
+
+    def __init__(self, object_list, per_page, count_strategy=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_strategy = count_strategy
+
     @cached_property
     def count(self):
         """Override count to use cached value if available."""
         if hasattr(self.object_list, '_result_cache') and self.object_list._result_cache is not None:
             return len(self.object_list._result_cache)
+        if self.count_strategy is not None and hasattr(self.object_list, 'query'):
+            return self.count_strategy.count(self.object_list)
         return super().count
 
 
@@ -21,6 +190,139 @@ class JqGridPagination(PageNumberPagination):
     page_size = 25
     max_page_size = 5000
     django_paginator_class = OptimizedPaginator
+    # Default count strategy; views override it with `jqgrid_count_strategy`
+    count_strategy = 'exact'
+    # Default row format; views override it with `jqgrid_row_format`
+    row_format = 'objects'
+
+    def get_count_strategy(self, view=None):
+        """
+        Resolve the count strategy for a view.
+
+        `jqgrid_count_strategy` on the view (or `count_strategy` on the
+        pagination class) may be a CountStrategy instance or one of the names
+        in COUNT_STRATEGIES: 'exact', 'cached', 'estimate' or 'capped'.
+        """
+        strategy = getattr(view, 'jqgrid_count_strategy', None) or self.count_strategy
+        if isinstance(strategy, str):
+            try:
+                strategy = COUNT_STRATEGIES[strategy]()
+            except KeyError:
+                raise ValueError(f"Unknown jqGrid count strategy '{strategy}'")
+        return strategy
+
+    def get_row_format(self, view=None):
+        """
+        Resolve the row format for a view: `jqgrid_row_format` on the view (or
+        `row_format` on the pagination class), one of ROW_FORMATS.
+        """
+        row_format = getattr(view, 'jqgrid_row_format', None) or self.row_format
+        if row_format not in ROW_FORMATS:
+            raise ValueError(f"Unknown jqGrid row format '{row_format}'")
+        return row_format
+
+    def get_cell_columns(self, data, view=None):
+        """Return the column order of `cells` rows: the view's colModel, or the row keys"""
+        if hasattr(view, 'get_cell_columns'):
+            return view.get_cell_columns()
+        return list(data[0]) if data else []
+
+    def get_rows_payload(self, data):
+        """
+        Return the response entries holding the rows. The `cells` format sends
+        `columns` once and every row as an array of values in that order.
+        """
+        view = getattr(self, 'view', None)
+        if self.get_row_format(view) != 'cells':
+            return {'data': data}
+
+        columns = self.get_cell_columns(data, view)
+        return {
+            'columns': columns,
+            'data': [[row.get(name) for name in columns] for row in data],
+        }
+
+    def get_userdata(self, queryset, view=None):
+        """
+        Return `userdata` for the response: any `userdata` already set on the
+        paginator, updated with the view's `aggregation_fields` computed over the
+        full filtered queryset (see django_jqgrid.aggregates).
+        """
+        userdata = dict(getattr(self, 'userdata', None) or {})
+        aggregation_fields = getattr(view, 'aggregation_fields', None)
+        if aggregation_fields:
+            userdata.update(compute_aggregates(queryset, aggregation_fields))
+        return userdata
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.view = view
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        self.userdata = self.get_userdata(queryset, view)
+
+        self.count_strategy_instance = self.get_count_strategy(view)
+        if issubclass(self.django_paginator_class, OptimizedPaginator):
+            paginator = self.django_paginator_class(
+                queryset, page_size, count_strategy=self.count_strategy_instance
+            )
+        else:
+            paginator = self.django_paginator_class(queryset, page_size)
+        page_number = self.get_page_number(request, paginator)
+
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            self.page = self.get_page_past_count(paginator, page_number)
+            if self.page is None:
+                msg = self.invalid_page_message.format(
+                    page_number=page_number, message=str(exc)
+                )
+                raise NotFound(msg)
+
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+
+        return list(self.page)
+
+    def get_page_past_count(self, paginator, page_number):
+        """
+        Return a page beyond the counted rows when the count strategy only gives
+        a lower bound (e.g. CappedCount), or None when the page has no rows.
+        """
+        strategy = getattr(self, 'count_strategy_instance', None)
+        if strategy is None or not strategy.is_lower_bound(paginator.count):
+            return None
+        try:
+            number = int(page_number)
+        except (TypeError, ValueError):
+            return None
+        if number < 1:
+            return None
+        offset = (number - 1) * paginator.per_page
+        rows = list(paginator.object_list[offset:offset + paginator.per_page])
+        return Page(rows, number, paginator) if rows else None
+
+    def get_total_pages(self):
+        """
+        Return `total_pages`; past a lower-bound count, at least one page more
+        than the current one while pages are full.
+        """
+        paginator = self.page.paginator
+        total_pages = paginator.num_pages
+        strategy = getattr(self, 'count_strategy_instance', None)
+        if strategy is not None and strategy.is_lower_bound(paginator.count):
+            full = len(self.page.object_list) == paginator.per_page
+            total_pages = max(total_pages, self.page.number + (1 if full else 0))
+        return total_pages
+
+    def get_records(self):
+        """Return the `records` value, formatted by the active count strategy."""
+        count = self.page.paginator.count
+        strategy = getattr(self, 'count_strategy_instance', None)
+        return strategy.format_records(count) if strategy else count
 
     def get_paginated_response(self, data):
         # Allow views to optionally add footer/summary data
@@ -28,10 +330,10 @@ class JqGridPagination(PageNumberPagination):
 
         return Response({
             'page': self.page.number,
-            'total_pages': self.page.paginator.num_pages,
-            'records': self.page.paginator.count,  # Renamed for jqGrid compatibility
+            'total_pages': self.get_total_pages(),
+            'records': self.get_records(),  # Renamed for jqGrid compatibility
             'userdata': userdata,
-            'data': data
+            **self.get_rows_payload(data)
         })
 
     def get_paginated_response_schema(self, schema):
@@ -40,11 +342,223 @@ class JqGridPagination(PageNumberPagination):
             'properties': {
                 'page': {'type': 'integer', 'example': 1},
                 'total_pages': {'type': 'integer', 'example': 10},
-                'records': {'type': 'integer', 'example': 250},
+                'records': {
+                    'oneOf': [{'type': 'integer'}, {'type': 'string'}],
+                    'example': 250
+                },
                 'userdata': {'type': 'object'},
+                'columns': {
+                    'type': 'array',
+                    'items': {'type': 'string'},
+                    'description': "Column order of the rows (`cells` row format only)"
+                },
                 'data': {
                     'type': 'array',
                     'items': schema
                 }
             }
         }
+
+
+class CursorJSONEncoder(DjangoJSONEncoder):
+    """DjangoJSONEncoder keeping the microseconds DjangoJSONEncoder drops, so
+    datetime cursor values compare equal to the stored values."""
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+class JqGridKeysetPagination(JqGridPagination):
+    """
+    Keyset (seek) pagination for jqGrid virtual scrolling (`scroll: 1`).
+
+    Rows are ordered by the active `sidx`/`sord` (see JqGridSortBackend) plus the
+    view's `key_field` as a tie-breaker. Every page returns an opaque
+    `next_cursor`; sending it back as `cursor` fetches the following rows with a
+    `WHERE (sort keys) > (last row)` condition instead of a growing OFFSET.
+    Requests for a page without a cursor (e.g. jumping to the last page) fall
+    back to OFFSET paging, so the regular jqGrid pager keeps working.
+    """
+    cursor_query_param = 'cursor'
+    sort_backend_class = JqGridSortBackend
+
+    def get_ordering(self, request, queryset, view):
+        """Return the order_by() terms, always ending with the key field."""
+        ordering = self.sort_backend_class().get_ordering(request, view)
+        if not ordering:
+            ordering = [term for term in queryset.query.order_by if isinstance(term, str)]
+        if not ordering:
+            ordering = [term for term in queryset.model._meta.ordering if isinstance(term, str)]
+
+        key_field = getattr(view, 'key_field', None) or 'pk'
+        if key_field not in [term.lstrip('-') for term in ordering]:
+            ordering.append(key_field)
+        return ordering
+
+    def encode_cursor(self, values, page):
+        payload = json.dumps({'v': values, 'p': page}, cls=CursorJSONEncoder)
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')).decode('utf-8'))
+            values, page = payload['v'], int(payload['p'])
+            if not isinstance(values, list) or not all(
+                    value is None or isinstance(value, (str, int, float, bool)) for value in values):
+                raise ValueError('Cursor values must be a list of scalars')
+            if page < 1:
+                raise ValueError('Cursor page must be positive')
+            return values, page
+        except (TypeError, ValueError, KeyError, binascii.Error, UnicodeDecodeError):
+            raise NotFound('Invalid cursor')
+
+    def get_nullable_fields(self, model, ordering):
+        """
+        Return the ordering fields that may be NULL: nullable fields and fields
+        reached through nullable relations. Unresolvable paths count as nullable.
+        """
+        nullable = set()
+        for term in ordering:
+            path = term.lstrip('-')
+            current = model
+            for name in path.split('__'):
+                try:
+                    field = current._meta.get_field(name)
+                except (AttributeError, FieldDoesNotExist):
+                    nullable.add(path)
+                    break
+                if field.null:
+                    nullable.add(path)
+                    break
+                current = field.related_model
+        return nullable
+
+    def get_order_by(self, ordering, nullable):
+        """
+        Return the order_by() terms. NULLs of nullable fields are placed
+        explicitly, last ascending and first descending (PostgreSQL's default),
+        so the seek filter matches the order on every database.
+        """
+        order_by = []
+        for term in ordering:
+            field = term.lstrip('-')
+            if field not in nullable:
+                order_by.append(term)
+            elif term.startswith('-'):
+                order_by.append(F(field).desc(nulls_first=True))
+            else:
+                order_by.append(F(field).asc(nulls_last=True))
+        return order_by
+
+    def get_seek_filter(self, ordering, values, nullable=()):
+        """
+        Build `(a, b, c) > (va, vb, vc)` honouring each term's direction and the
+        NULL placement of get_order_by().
+        """
+        conditions = []
+        for index, term in enumerate(ordering):
+            field = term.lstrip('-')
+            value = values[index]
+            descending = term.startswith('-')
+            if value is None:
+                # NULLs sort last ascending (nothing follows) and first descending
+                if not descending:
+                    continue
+                after = Q(**{f"{field}__isnull": False})
+            else:
+                after = Q(**{f"{field}__{'lt' if descending else 'gt'}": value})
+                if field in nullable and not descending:
+                    after |= Q(**{f"{field}__isnull": True})
+
+            for previous, previous_value in zip(ordering[:index], values[:index]):
+                previous = previous.lstrip('-')
+                if previous_value is None:
+                    after &= Q(**{f"{previous}__isnull": True})
+                else:
+                    after &= Q(**{previous: previous_value})
+            conditions.append(after)
+        if not conditions:
+            return Q(pk__in=[])
+        return reduce(lambda left, right: left | right, conditions)
+
+    def get_row_values(self, obj, ordering):
+        values = []
+        for term in ordering:
+            if isinstance(obj, dict):
+                # values() rows from the fast row path
+                values.append(obj.get(term.lstrip('-')))
+                continue
+            value = obj
+            for attr in term.lstrip('-').split('__'):
+                value = getattr(value, attr, None) if value is not None else None
+            values.append(value.pk if hasattr(value, '_meta') else value)
+        return values
+
+    def get_page_number(self, request, paginator=None):
+        try:
+            page_number = int(request.query_params.get(self.page_query_param, 1))
+        except (TypeError, ValueError):
+            return 1
+        return max(page_number, 1)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.view = view
+        self.rows_per_page = self.get_page_size(request)
+        ordering = self.get_ordering(request, queryset, view)
+        self.ordering = ordering
+
+        self.count_strategy_instance = self.get_count_strategy(view)
+        self.count = self.count_strategy_instance.count(queryset)
+        self.userdata = self.get_userdata(queryset, view)
+
+        nullable = self.get_nullable_fields(queryset.model, ordering)
+        queryset = queryset.order_by(*self.get_order_by(ordering, nullable))
+        cursor = self.decode_cursor(request)
+
+        # Seek past the last row of the previous page
+        if cursor is not None and len(cursor[0]) == len(ordering):
+            values, self.page_number = cursor
+            seek_filter = self.get_seek_filter(ordering, values, nullable)
+            rows = list(queryset.filter(seek_filter)[:self.rows_per_page + 1])
+        else:
+            self.page_number = cursor[1] if cursor else self.get_page_number(request)
+            offset = (self.page_number - 1) * self.rows_per_page
+            rows = list(queryset[offset:offset + self.rows_per_page + 1])
+
+        self.has_next = len(rows) > self.rows_per_page
+        rows = rows[:self.rows_per_page]
+        self.next_cursor = None
+        if self.has_next and rows:
+            self.next_cursor = self.encode_cursor(
+                self.get_row_values(rows[-1], ordering), self.page_number + 1
+            )
+        return rows
+
+    def get_total_pages(self):
+        count = self.count
+        if self.has_next and isinstance(count, int):
+            count = max(count, self.page_number * self.rows_per_page + 1)
+        return max(1, math.ceil(count / self.rows_per_page)) if isinstance(count, int) else self.page_number
+
+    def get_paginated_response(self, data):
+        userdata = getattr(self, 'userdata', {})
+
+        return Response({
+            'page': self.page_number,
+            'total_pages': self.get_total_pages(),
+            'records': self.count_strategy_instance.format_records(self.count),
+            'userdata': userdata,
+            'next_cursor': self.next_cursor,
+            **self.get_rows_payload(data)
+        })
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema['properties']['next_cursor'] = {'type': 'string', 'nullable': True}
+        return response_schema
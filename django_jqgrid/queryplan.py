@@ -0,0 +1,235 @@
+"""Relation loading plans derived from the grid serializer.
+
+``build_query_plan`` walks the serializer fields rendered for each row and
+records which relations they traverse: forward foreign keys and one-to-one
+relations become ``select_related`` paths, reverse foreign keys and
+many-to-many relations become ``Prefetch`` lookups restricted to the columns the
+nested serializer reads. Applying the plan removes the per-row queries a page
+would otherwise trigger while rendering.
+"""
+
+import logging
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework import serializers
+
+logger = logging.getLogger(__name__)
+
+
+class PrefetchSpec:
+    """A prefetch lookup and the columns and relations its queryset needs."""
+
+    def __init__(self, model, only=None):
+        self.model = model
+        self.only = set(only) if only is not None else None
+        self.select_related = set()
+
+    def build(self, path):
+        queryset = self.model._default_manager.all()
+        if self.select_related:
+            queryset = queryset.select_related(*sorted(self.select_related))
+        if self.only is not None:
+            queryset = queryset.only(*sorted(self.only | self.select_related_roots()))
+        return Prefetch(path, queryset=queryset)
+
+    def select_related_roots(self):
+        return {path.split('__')[0] for path in self.select_related}
+
+
+class QueryPlan:
+    """
+    ``select_related`` paths and prefetch lookups for a queryset, plus notes
+    describing how each serializer field was planned.
+    """
+
+    def __init__(self):
+        self.select_related = set()
+        self.prefetches = {}
+        self.notes = []
+        # Model columns read by the serializer, None when they cannot be determined
+        self.columns = None
+
+    def __bool__(self):
+        return bool(self.select_related or self.prefetches)
+
+    def apply(self, queryset):
+        if self.select_related:
+            queryset = queryset.select_related(*sorted(self.select_related))
+
+        # Lookups the view already prefetches keep their own querysets
+        existing = {
+            lookup if isinstance(lookup, str) else lookup.prefetch_to
+            for lookup in queryset._prefetch_related_lookups
+        }
+        lookups = []
+        for path in sorted(self.prefetches):
+            if path in existing:
+                continue
+            spec = self.prefetches[path]
+            lookups.append(spec.build(path) if spec is not None else path)
+        if lookups:
+            queryset = queryset.prefetch_related(*lookups)
+        return queryset
+
+    def report(self):
+        """Return a one-line summary of the plan."""
+        parts = []
+        if self.select_related:
+            parts.append(f"select_related({', '.join(sorted(self.select_related))})")
+        for path in sorted(self.prefetches):
+            spec = self.prefetches[path]
+            only = f" only({', '.join(sorted(spec.only))})" if spec is not None and spec.only else ''
+            parts.append(f"prefetch_related({path}{only})")
+        return '; '.join(parts) or 'no relations'
+
+
+def _join(prefix, name):
+    return f"{prefix}__{name}" if prefix else name
+
+
+def _nested_serializer(field):
+    """Return the serializer rendering a relation, unwrapping ``many=True``."""
+    if isinstance(field, serializers.ListSerializer):
+        field = field.child
+    return field if isinstance(field, serializers.BaseSerializer) else None
+
+
+def _renders_pk_only(field):
+    if isinstance(field, serializers.ManyRelatedField):
+        field = field.child_relation
+    return isinstance(field, serializers.PrimaryKeyRelatedField)
+
+
+def plan_serializer(plan, model, serializer, prefix='', field_names=None):
+    """
+    Add the relations read by ``serializer`` to ``plan``.
+
+    Args:
+        plan: QueryPlan (or sub-plan of a prefetch) to extend
+        model: Model the serializer renders
+        serializer: Serializer instance
+        prefix: Lookup path from the planned queryset to ``model``
+        field_names: Restrict planning to these serializer fields
+
+    Returns:
+        Set of ``model`` field names read directly by the serializer, or None
+        when some field reads an arbitrary attribute (method fields, properties)
+    """
+    columns = {model._meta.pk.name}
+    unresolved = False
+    for name, field in serializer.fields.items():
+        if field.write_only or (field_names is not None and name not in field_names):
+            continue
+        if not plan_field(plan, model, field, prefix, columns):
+            unresolved = True
+            plan.notes.append(f"{_join(prefix, name)}: not a model path, left unplanned")
+    return None if unresolved else columns
+
+
+def plan_field(plan, model, field, prefix, columns):
+    """
+    Plan a single serializer field. Adds the model columns it reads to ``columns``.
+
+    Returns:
+        False when the field source cannot be resolved on the model
+    """
+    if isinstance(field, serializers.SerializerMethodField):
+        return False
+
+    if field.source == '*':
+        nested = _nested_serializer(field)
+        if nested is None:
+            return False
+        nested_columns = plan_serializer(plan, model, nested, prefix)
+        if nested_columns is None:
+            return False
+        columns.update(nested_columns)
+        return True
+
+    current_model = model
+    path = prefix
+    attrs = field.source_attrs
+    for index, attr in enumerate(attrs):
+        try:
+            model_field = current_model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            return False
+
+        is_last = index == len(attrs) - 1
+        if index == 0 and getattr(model_field, 'concrete', False):
+            columns.add(model_field.name)
+
+        if not model_field.is_relation:
+            return is_last
+
+        relation_path = _join(path, model_field.name)
+
+        if model_field.related_model is None:
+            # Generic foreign keys can only be prefetched
+            plan.prefetches.setdefault(relation_path, None)
+            plan.notes.append(f"{relation_path}: prefetch_related (generic relation)")
+            return is_last
+
+        if model_field.many_to_one or model_field.one_to_one:
+            if is_last and _nested_serializer(field) is None and _renders_pk_only(field):
+                # The foreign key value is on the row already
+                return True
+            plan.select_related.add(relation_path)
+            current_model = model_field.related_model
+            path = relation_path
+            if is_last:
+                nested = _nested_serializer(field)
+                if nested is not None:
+                    plan_serializer(plan, current_model, nested, path)
+            continue
+
+        # Reverse foreign keys and many-to-many relations
+        if not is_last:
+            plan.prefetches.setdefault(relation_path, None)
+            return True
+        plan_many(plan, model_field, field, relation_path)
+        return True
+
+    return True
+
+
+def plan_many(plan, model_field, field, path):
+    """Plan a reverse foreign key or many-to-many relation as a Prefetch."""
+    related_model = model_field.related_model
+    nested = _nested_serializer(field)
+
+    if nested is not None:
+        sub_plan = QueryPlan()
+        only = plan_serializer(sub_plan, related_model, nested)
+        spec = PrefetchSpec(related_model, only)
+        spec.select_related = sub_plan.select_related
+        for sub_path, sub_spec in sub_plan.prefetches.items():
+            plan.prefetches[_join(path, sub_path)] = sub_spec
+        plan.notes.extend(f"{path}: {note}" for note in sub_plan.notes)
+    elif _renders_pk_only(field):
+        spec = PrefetchSpec(related_model, [related_model._meta.pk.name])
+    else:
+        # String/slug related fields may read any column
+        spec = PrefetchSpec(related_model)
+
+    if spec.only is not None and model_field.one_to_many:
+        # The reverse foreign key is needed to attach rows to their parent
+        spec.only.add(model_field.field.name)
+
+    plan.prefetches[path] = spec
+
+
+def build_query_plan(model, serializer, field_names=None):
+    """
+    Build the QueryPlan for rendering ``serializer`` over ``model`` rows.
+
+    Args:
+        model: Model of the listed queryset
+        serializer: Serializer instance used to render rows
+        field_names: Optional subset of serializer fields that are rendered
+    """
+    plan = QueryPlan()
+    plan.columns = plan_serializer(plan, model, serializer, field_names=field_names)
+    logger.debug("jqGrid query plan for %s: %s", model._meta.label, plan.report())
+    return plan
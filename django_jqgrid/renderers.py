@@ -0,0 +1,116 @@
+"""JSON renderer for grid responses backed by a fast encoder.
+
+``JqGridJSONRenderer`` encodes with ``orjson`` or ``ujson`` when one of them is
+installed and falls back to DRF's ``JSONRenderer`` otherwise. Datetimes and
+UUIDs are encoded natively by orjson; Decimals become numbers like with DRF's
+encoder. Viewsets using ``JqGridConfigMixin`` with ``JqGridPagination`` get the
+renderer in place of ``JSONRenderer`` automatically.
+
+The encoder is chosen with ``JQGRID_PERFORMANCE['JSON_BACKEND']``: ``'auto'``
+(default), ``'orjson'``, ``'ujson'`` or ``'json'``.
+"""
+
+import decimal
+import logging
+import uuid
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from django_jqgrid.utils import get_performance_setting
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import ujson
+    HAS_UJSON = True
+except ImportError:
+    HAS_UJSON = False
+
+logger = logging.getLogger(__name__)
+
+_encoder = JSONEncoder()
+
+# Line and paragraph separators are escaped like DRF does, keeping the output a
+# strict JavaScript subset
+_JS_ESCAPES = (('\u2028'.encode(), b'\\u2028'), ('\u2029'.encode(), b'\\u2029'))
+
+
+def encode_default(obj):
+    """Encode the types the fast encoders do not handle themselves"""
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    # Dates, lazy translations, querysets, ... as DRF's encoder does
+    return _encoder.default(obj)
+
+
+def _dumps_orjson(data):
+    return orjson.dumps(data, default=encode_default, option=orjson.OPT_UTC_Z)
+
+
+def _dumps_ujson(data):
+    return ujson.dumps(
+        data, default=encode_default, ensure_ascii=False, escape_forward_slashes=False
+    ).encode('utf-8')
+
+
+JSON_BACKENDS = {
+    'orjson': (HAS_ORJSON, _dumps_orjson),
+    'ujson': (HAS_UJSON, _dumps_ujson),
+}
+
+
+def get_json_backend():
+    """
+    Return the name of the fast encoder in use, or None for the stdlib encoder.
+
+    Returns:
+        'orjson', 'ujson' or None
+    """
+    backend = get_performance_setting('JSON_BACKEND', 'auto')
+    if backend == 'auto':
+        return 'orjson' if HAS_ORJSON else 'ujson' if HAS_UJSON else None
+    if backend == 'json':
+        return None
+    if backend not in JSON_BACKENDS:
+        raise ValueError(f"Unknown JSON backend '{backend}'. Choose from: auto, orjson, ujson, json")
+    if not JSON_BACKENDS[backend][0]:
+        logger.warning("JSON backend '%s' is not installed, using the standard library", backend)
+        return None
+    return backend
+
+
+class JqGridJSONRenderer(JSONRenderer):
+    """
+    ``JSONRenderer`` using orjson or ujson when installed.
+
+    Indented output (browsable API, ``; indent=`` media type parameters) and
+    ``UNICODE_JSON = False`` are rendered by DRF's encoder.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        backend = get_json_backend()
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if backend is None or indent is not None or self.ensure_ascii:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = JSON_BACKENDS[backend][1](data)
+        except (TypeError, ValueError, OverflowError) as e:
+            # Values the fast encoder rejects (e.g. integers beyond 64 bits)
+            logger.debug("%s could not encode the response, using the standard library: %s", backend, e)
+            return super().render(data, accepted_media_type, renderer_context)
+
+        for raw, escaped in _JS_ESCAPES:
+            if raw in ret:
+                ret = ret.replace(raw, escaped)
+        return ret
@@ -0,0 +1,94 @@
+"""Loading of saved search filters (jqGrid ``tmplFilters``) for a grid.
+
+A user sees their own filters followed by the global ones, read in one query
+served by the ``(table, key, is_global, created_by)`` index. The search
+template lists are cached per content type and user and keyed on the
+``GridFilter`` cache generation (see django_jqgrid.invalidation), so saving or
+deleting a filter is visible on the next request.
+"""
+
+import logging
+
+from django.core.cache import cache
+from django.db.models import Q
+
+from django_jqgrid.invalidation import get_generation, register_model
+from django_jqgrid.models import GridFilter
+from django_jqgrid.utils import get_performance_setting
+
+logger = logging.getLogger(__name__)
+
+SAVED_FILTER_CACHE_PREFIX = 'django_jqgrid_tmplfilters'
+TMPL_FILTERS_KEY = 'tmplFilters'
+
+
+def empty_template_filters():
+    return {"tmplNames": [], "tmplFilters": [], "tmplIds": []}
+
+
+def get_saved_filters(content_type, user, key=TMPL_FILTERS_KEY):
+    """
+    Return the filters of a table visible to ``user``: their own filters, then
+    the global ones, newest first within each group.
+
+    Args:
+        content_type: ContentType of the grid model, or a list of content type ids
+        user: Requesting user; anonymous users only see global filters
+        key: GridFilter key (default 'tmplFilters'); None returns every key
+    """
+    visible = Q(is_global=True)
+    if user is not None and user.is_authenticated:
+        visible |= Q(created_by=user, is_global=False)
+    if isinstance(content_type, (list, tuple)):
+        queryset = GridFilter.objects.filter(visible, table__in=content_type)
+    else:
+        queryset = GridFilter.objects.filter(visible, table=content_type)
+    if key is not None:
+        queryset = queryset.filter(key=key)
+    return queryset.order_by('is_global', '-created_at', '-pk')
+
+
+def get_template_filters(content_type, user):
+    """
+    Return the ``tmplNames``, ``tmplFilters`` and ``tmplIds`` search options of
+    a table for ``user``, cached for ``SAVED_FILTER_CACHE_TIMEOUT`` seconds.
+    """
+    return get_template_filters_many([content_type], user)[content_type.pk]
+
+
+def get_template_filters_many(content_types, user):
+    """
+    Return the search templates of several tables for ``user``, reading the
+    tables missing from the cache in one query.
+
+    Returns:
+        Dict mapping content type ids to ``get_template_filters`` results
+    """
+    register_model(GridFilter)
+    timeout = get_performance_setting('SAVED_FILTER_CACHE_TIMEOUT', 300)
+    use_cache = bool(timeout) and get_performance_setting('ENABLE_CACHING', True)
+
+    user_id = user.pk if user is not None and user.is_authenticated else 'anon'
+    generation = get_generation(GridFilter)
+    keys = {
+        content_type.pk: f"{SAVED_FILTER_CACHE_PREFIX}:{content_type.pk}:{user_id}:{generation}"
+        for content_type in content_types
+    }
+    cached = cache.get_many(list(keys.values())) if use_cache else {}
+
+    templates = {pk: cached[key] for pk, key in keys.items() if key in cached}
+    missing = [pk for pk in keys if pk not in templates]
+    if not missing:
+        return templates
+
+    for pk in missing:
+        templates[pk] = empty_template_filters()
+    rows = get_saved_filters(missing, user).values_list('table_id', 'pk', 'name', 'value')
+    for table_id, pk, name, value in rows:
+        templates[table_id]["tmplIds"].append(pk)
+        templates[table_id]["tmplNames"].append(name)
+        templates[table_id]["tmplFilters"].append(value)
+
+    if use_cache:
+        cache.set_many({keys[pk]: templates[pk] for pk in missing}, timeout)
+    return templates
@@ -0,0 +1,84 @@
+"""Single-flight execution of identical concurrent grid requests.
+
+When several threads of a process ask for the same result at the same time,
+``SingleFlight.do`` runs the computation once and hands its result to every
+caller waiting for it. ``JqGridConfigMixin`` uses it for list requests when
+``jqgrid_single_flight`` is enabled, so a burst of identical grid reloads of
+one user (e.g. several tabs of a dashboard, or repeated toolbar searches)
+shares one database execution. Requests of different users never share a
+result, and results are only shared between requests in flight together;
+nothing is cached afterwards.
+"""
+
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.failed = False
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent calls per key within a process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn, timeout=None):
+        """
+        Return ``fn()``, or the result of the identical call already running.
+
+        Callers waiting longer than ``timeout`` seconds, or whose leader failed,
+        run ``fn`` themselves.
+
+        Returns:
+            Tuple ``(result, shared)``; ``shared`` is True when the result was
+            computed by another caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+
+        if not leader:
+            if call.done.wait(timeout) and not call.failed:
+                return call.result, True
+            logger.debug("Single-flight leader for %s failed or timed out, running the call", key)
+            return fn(), False
+
+        try:
+            call.result = fn()
+        except BaseException:
+            call.failed = True
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def in_flight(self, key):
+        with self._lock:
+            return key in self._calls
+
+    def waiting(self, key):
+        """Return the number of callers waiting for the flight of ``key``"""
+        with self._lock:
+            call = self._calls.get(key)
+            return call.waiters if call is not None else 0
+
+
+# Flights of JqGridConfigMixin list requests
+list_flights = SingleFlight()
@@ -117,6 +117,12 @@ window.jqGridConfig = window.jqGridConfig || {
     // Default grid options - can be overridden
     defaultGridOptions: {},
 
+    // Storage keeping grid configs between page loads: 'local', 'session' or false (off)
+    configStorage: false,
+
+    // Config version of the deployment; defaults to the jqgrid-config-version meta tag
+    configVersion: null,
+
     // Hooks for extending functionality
     hooks: {
         beforeInitGrid: null,
@@ -126,7 +132,9 @@ window.jqGridConfig = window.jqGridConfig || {
         beforeCreateBulkActions: null,
         afterCreateBulkActions: null,
         beforeSubmitBulkUpdate: null,
-        afterSubmitBulkUpdate: null
+        afterSubmitBulkUpdate: null,
+        // Called with (tableInstance, gridConfig) when revalidation finds a newer config
+        configChanged: null
     }
 };
 
@@ -244,6 +252,96 @@ const utils = {
             console.error('JSON Parse Error:', e);
             return null;
         }
+    },
+
+    /**
+     * Return the payload of a dropdown response ({data: [{id, text}], more}),
+     * with or without an outer `data` envelope
+     * @param {Object} response - Parsed dropdown response
+     * @returns {Object|null} Payload with a `data` array
+     */
+    escapeHtml: function(value) {
+        return String(value === null || value === undefined ? '' : value)
+            .replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;')
+            .replace(/"/g, '&quot;').replace(/'/g, '&#39;');
+    },
+
+    dropdownPayload: function(response) {
+        if (response && response.data && Array.isArray(response.data.data)) {
+            return response.data;
+        }
+        return response && Array.isArray(response.data) ? response : null;
+    }
+};
+
+/**
+ * Disabled option telling that an unpaged option list was cut by the server
+ * @param {Object} payload - Dropdown response payload
+ * @returns {string} Option HTML, empty when the list is complete
+ */
+function truncatedOption(payload) {
+    if (!payload.truncated) {
+        return '';
+    }
+    return `<option value="" disabled>Only the first ${payload.data.length} options are listed</option>`;
+}
+
+/**
+ * Grid configs kept in localStorage/sessionStorage by grid URL and config
+ * version, so pages render from the stored copy and revalidate it with its ETag
+ */
+const configCache = {
+    storage: function() {
+        const kind = window.jqGridConfig.configStorage;
+        try {
+            if (kind === 'local') return window.localStorage;
+            if (kind === 'session') return window.sessionStorage;
+        } catch (e) {
+            // Storage disabled by the browser
+        }
+        return null;
+    },
+
+    version: function() {
+        if (window.jqGridConfig.configVersion) {
+            return String(window.jqGridConfig.configVersion);
+        }
+        const meta = document.querySelector('meta[name="jqgrid-config-version"]');
+        return meta ? meta.getAttribute('content') : null;
+    },
+
+    key: function(gridUrl) {
+        return `django_jqgrid:config:${gridUrl}`;
+    },
+
+    read: function(gridUrl) {
+        const storage = this.storage();
+        const entry = storage ? utils.safeJsonParse(storage.getItem(this.key(gridUrl))) : null;
+        if (!entry || !entry.etag || !entry.config) {
+            return null;
+        }
+        // Without an announced version a stored copy may predate a deployment;
+        // a page announcing another version was deployed after it was stored
+        const version = this.version();
+        return version && entry.version === version ? entry : null;
+    },
+
+    write: function(gridUrl, xhr, gridConfig) {
+        const storage = this.storage();
+        const etag = xhr.getResponseHeader('ETag');
+        if (!storage || !etag) {
+            return;
+        }
+        try {
+            storage.setItem(this.key(gridUrl), JSON.stringify({
+                etag: etag,
+                version: xhr.getResponseHeader('X-JqGrid-Config-Version') || this.version(),
+                config: gridConfig
+            }));
+        } catch (e) {
+            // Quota exceeded: the config is fetched again next time
+            console.warn('Could not store grid configuration:', e);
+        }
     }
 };
 
@@ -291,6 +389,58 @@ window.initializeTableInstance = function(tableId, appName, tableName, options =
     return initializeGridForTable(tableInstance);
 };
 
+/**
+ * Initialize several tables from one request to the config bundle endpoint,
+ * which returns the config and saved filters of every grid
+ * @param {Array} grids - Objects with tableId, appName, tableName and options
+ *                        as passed to initializeTableInstance
+ * @param {Object} options - bundleUrl overrides '/api/django_jqgrid/config-bundle/'
+ */
+window.initializeGridBundle = function(grids, options = {}) {
+    const names = grids.map(function(grid) { return `${grid.appName}.${grid.tableName}`; });
+
+    const initialize = function(bundle) {
+        grids.forEach(function(grid, index) {
+            const entry = bundle && bundle.grids ? bundle.grids[names[index]] : null;
+            const tableOptions = $.extend({}, grid.options);
+            if (entry) {
+                tableOptions.gridConfig = withSavedFilters(entry.config, entry.saved_filters);
+            }
+            // Grids missing from the bundle fetch their own config
+            window.initializeTableInstance(grid.tableId, grid.appName, grid.tableName, tableOptions);
+        });
+    };
+
+    return $.ajax({
+        url: options.bundleUrl || '/api/django_jqgrid/config-bundle/',
+        method: 'GET',
+        dataType: 'json',
+        data: { grids: names.join(',') },
+        success: function(response) {
+            initialize(response && response.grids ? response : response && response.data);
+        },
+        error: function(xhr, status, error) {
+            console.error('Error loading grid config bundle:', error);
+            initialize(null);
+        }
+    });
+};
+
+/**
+ * Add a grid's saved search templates (tmplNames, tmplFilters, tmplIds) to the
+ * search options of its config
+ * @param {Object} gridConfig - Payload of the jqgrid_config action
+ * @param {Object} savedFilters - Saved search templates of the grid
+ * @returns {Object} The grid configuration
+ */
+function withSavedFilters(gridConfig, savedFilters) {
+    const navGrid = gridConfig.method_options && gridConfig.method_options.navGrid;
+    if (navGrid && navGrid.searchOptions && savedFilters) {
+        $.extend(navGrid.searchOptions, savedFilters);
+    }
+    return gridConfig;
+}
+
 /**
  * Initialize jqGrid for a specific table instance
  * @param {Object} tableInstance - Table instance configuration
@@ -301,218 +451,633 @@ function initializeGridForTable(tableInstance) {
     // Store reference to the jQuery grid object
     tableInstance.$grid = $(tableInstance.gridSelector);
 
+    // Config loaded with a bundle or embedded by {% jqgrid ... embed_config=True %}
+    const preloadedConfig = takePreloadedConfig(tableInstance);
+    if (preloadedConfig) {
+        applyGridConfig(tableInstance, preloadedConfig);
+        return $.Deferred().resolve(preloadedConfig).promise();
+    }
+
+    // Render from the stored copy right away and revalidate it in the background
+    const cached = configCache.read(gridUrl);
+    if (cached) {
+        applyGridConfig(tableInstance, cached.config);
+        $.ajax({
+            url: `${gridUrl}jqgrid_config/`,
+            method: 'GET',
+            dataType: 'json',
+            headers: { 'If-None-Match': cached.etag },
+            success: function(response, status, xhr) {
+                if (xhr.status === 304 || !response || !response.data) {
+                    return;
+                }
+                // Used from the next page load on, unless the hook applies it now
+                configCache.write(gridUrl, xhr, response.data);
+                if (typeof window.jqGridConfig.hooks.configChanged === 'function') {
+                    window.jqGridConfig.hooks.configChanged(tableInstance, response.data);
+                }
+            }
+        });
+        return $.Deferred().resolve(cached.config).promise();
+    }
+
     // Fetch grid configuration from the server
     return $.ajax({
         url: `${gridUrl}jqgrid_config/`,
         method: 'GET',
         dataType: 'json',
-        success: function(response) {
+        success: function(response, status, xhr) {
             if (!response || !response.data) {
                 utils.notify('error', 'Invalid grid configuration received from server.', tableInstance);
                 return;
             }
 
-            const gridConfig = response.data;
+            // Stored before applyGridConfig adds instance handlers to it
+            configCache.write(gridUrl, xhr, response.data);
+            applyGridConfig(tableInstance, response.data);
+        },
+        error: function(xhr, status, error) {
+            utils.notify('error', 'Error loading grid configuration: ' + error, tableInstance);
+            console.error('AJAX Error:', xhr.responseText);
+        }
+    });
+}
 
-            // Set grid title if present in config
-            if (gridConfig.jqgrid_options.caption) {
-                $(`${tableInstance.toolbarSelector} .card-title`).text(gridConfig.jqgrid_options.caption);
-            }
+/**
+ * Take the config passed as `options.gridConfig` (see initializeGridBundle) or
+ * embedded for a table as a JSON script block, once: later initializations
+ * (e.g. after deleting a saved filter) fetch it from the server
+ * @param {Object} tableInstance - Table instance configuration
+ * @returns {Object|null} Grid configuration, or null when none was preloaded
+ */
+function takePreloadedConfig(tableInstance) {
+    if (tableInstance.options.gridConfig) {
+        const gridConfig = tableInstance.options.gridConfig;
+        delete tableInstance.options.gridConfig;
+        return gridConfig;
+    }
 
-            // Modify grid configuration for this instance
-            const gridOptions = gridConfig.jqgrid_options;
-            gridOptions.pager = tableInstance.pagerSelector;
+    const element = document.getElementById(`${tableInstance.id}_config`);
+    if (!element) {
+        return null;
+    }
+    element.parentNode.removeChild(element);
 
-            // Add instance-specific event handlers
-            gridOptions.gridComplete = function() {
-                // Custom event handler logic
-                if (typeof tableInstance.options.onGridComplete === 'function') {
-                    tableInstance.options.onGridComplete(tableInstance);
-                }
+    const gridConfig = utils.safeJsonParse(element.textContent);
+    return gridConfig && gridConfig.jqgrid_options ? gridConfig : null;
+}
+
+/**
+ * Build the jqGrid of a table instance from its grid configuration
+ * @param {Object} tableInstance - Table instance configuration
+ * @param {Object} gridConfig - Payload of the jqgrid_config action
+ */
+function applyGridConfig(tableInstance, gridConfig) {
+    // Set grid title if present in config
+    if (gridConfig.jqgrid_options.caption) {
+        $(`${tableInstance.toolbarSelector} .card-title`).text(gridConfig.jqgrid_options.caption);
+    }
+
+    // Modify grid configuration for this instance
+    const gridOptions = gridConfig.jqgrid_options;
+    gridOptions.pager = tableInstance.pagerSelector;
+
+    // Add instance-specific event handlers
+    gridOptions.gridComplete = function() {
+        // Custom event handler logic
+        if (typeof tableInstance.options.onGridComplete === 'function') {
+            tableInstance.options.onGridComplete(tableInstance);
+        }
+    };
+
+    // Handle row selection events - store selected IDs in this instance
+    gridOptions.onSelectRow = function(rowid, status, e) {
+        updateInstanceSelection(tableInstance);
+        if (typeof tableInstance.options.onSelectRow === 'function') {
+            tableInstance.options.onSelectRow(rowid, status, e, tableInstance);
+        }
+    };
+
+    gridOptions.onSelectAll = function(aRowids, status) {
+        updateInstanceSelection(tableInstance);
+        if (typeof tableInstance.options.onSelectAll === 'function') {
+            tableInstance.options.onSelectAll(aRowids, status, tableInstance);
+        }
+    };
+
+    // Coalesce identical data requests and abort superseded ones
+    gridOptions.loadBeforeSend = function(xhr, settings) {
+        return trackGridRequest(tableInstance, xhr, settings);
+    };
+
+    // A superseded request was aborted on purpose: do not report it as an error
+    const loadError = gridOptions.loadError;
+    gridOptions.loadError = function(xhr, status, error) {
+        if (status === 'abort' || (xhr && xhr.statusText === 'abort')) {
+            return;
+        }
+        if (typeof loadError === 'function') {
+            loadError.call(this, xhr, status, error);
+        }
+    };
+
+    // Keyset pagination: remember the cursor returned with each page
+    gridOptions.beforeProcessing = function(data) {
+        const payload = data && data.data && data.data.page !== undefined ? data.data : data;
+        const postData = tableInstance.$grid.jqGrid('getGridParam', 'postData') || {};
+
+        tableInstance.keysetCursor = payload && payload.next_cursor ? {
+            page: Number(payload.page) + 1,
+            cursor: payload.next_cursor,
+            signature: getCursorSignature(postData)
+        } : null;
+
+        // Server-side aggregates: expose userdata where jqGrid reads it for the footer
+        if (payload && payload !== data && payload.userdata) {
+            data.userdata = payload.userdata;
+        }
+
+        // Server-side grouping: keep the group headers, they are rendered on load
+        tableInstance.groupHeaders = null;
+        if (payload && payload.group_by !== undefined) {
+            tableInstance.groupHeaders = {
+                field: payload.group_by,
+                headers: payload.data || [],
+                truncated: payload.truncated
             };
+            payload.data = [];
+        }
+    };
+
+    // Send the cursor only when jqGrid asks for the page right after it
+    // with unchanged sorting and filters (e.g. virtual scrolling)
+    gridOptions.serializeGridData = function(postData) {
+        const data = $.extend({}, postData);
+        const cursor = tableInstance.keysetCursor;
+
+        delete data.cursor;
+        if (cursor && Number(data.page) === cursor.page &&
+            getCursorSignature(data) === cursor.signature) {
+            data.cursor = cursor.cursor;
+        }
+
+        // Column projection: only request the columns that are shown
+        if (gridConfig.column_projection) {
+            const colModel = tableInstance.$grid.jqGrid('getGridParam', 'colModel') || [];
+            data[gridConfig.column_projection.param] = colModel
+                .filter(function(col) {
+                    return !col.hidden && ['cb', 'rn', 'subgrid', 'actions'].indexOf(col.name) === -1;
+                })
+                .map(function(col) { return col.name; })
+                .join(',');
+        }
+
+        // Server-side grouping: ask for the group headers instead of rows
+        delete data[serverGroupingParam(gridConfig, 'group_by_param')];
+        delete data[serverGroupingParam(gridConfig, 'group_value_param')];
+        if (tableInstance.groupBy) {
+            data[serverGroupingParam(gridConfig, 'group_by_param')] = tableInstance.groupBy;
+        }
+        return data;
+    };
 
-            // Handle row selection events - store selected IDs in this instance
-            gridOptions.onSelectRow = function(rowid, status, e) {
-                updateInstanceSelection(tableInstance);
-                if (typeof tableInstance.options.onSelectRow === 'function') {
-                    tableInstance.options.onSelectRow(rowid, status, e, tableInstance);
+    // Process dynamic dropdowns in colModel
+    gridOptions.colModel.forEach(function(item) {
+        // Handle search options with data URLs
+        if (item.searchoptions && item.searchoptions.dataUrl) {
+            item.searchoptions['buildSelect'] = function(data) {
+                try {
+                    const payload = utils.dropdownPayload(utils.safeJsonParse(data));
+                    if (!payload) {
+                        return '<select><option value="">Error loading options</option></select>';
+                    }
+                    
+                    var options = '<select><option value="">Select</option>';
+                    $.each(payload.data, function(index, item) {
+                        selected = item.selected ? 'selected' : '';
+                        options += '<option value="' + item.id + '" ' + selected + '>' + item.text + '</option>';
+                    });
+                    options += truncatedOption(payload);
+                    options += '</select>';
+                    return options;
+                } catch (e) {
+                    console.error('Error building search select:', e);
+                    return '<select><option value="">Error loading options</option></select>';
                 }
             };
+        }
 
-            gridOptions.onSelectAll = function(aRowids, status) {
-                updateInstanceSelection(tableInstance);
-                if (typeof tableInstance.options.onSelectAll === 'function') {
-                    tableInstance.options.onSelectAll(aRowids, status, tableInstance);
+        // Handle edit options with data URLs
+        if (item.editoptions && item.editoptions.dataUrl) {
+            item.editoptions['dataUrl'] = function(data) {
+                // Dynamically build the URL with the current row ID
+                if (data != '_empty') {
+                    return item.editoptions['dataUrlTemp'].replace('<id>', data);
+                } else {
+                    return item.editoptions['dataUrlTemp'].replace('<id>/', '').replace('dropdown_pk', 'dropdown');
                 }
             };
 
-            // Process dynamic dropdowns in colModel
-            gridOptions.colModel.forEach(function(item) {
-                // Handle search options with data URLs
-                if (item.searchoptions && item.searchoptions.dataUrl) {
-                    item.searchoptions['buildSelect'] = function(data) {
-                        try {
-                            data = utils.safeJsonParse(data);
-                            if (!data || !data.data || !data.data.data) {
-                                return '<select><option value="">Error loading options</option></select>';
-                            }
-                            
-                            var options = '<select><option value="">Select</option>';
-                            $.each(data.data.data, function(index, item) {
-                                selected = item.selected ? 'selected' : '';
-                                options += '<option value="' + item.id + '" ' + selected + '>' + item.text + '</option>';
-                            });
-                            options += '</select>';
-                            return options;
-                        } catch (e) {
-                            console.error('Error building search select:', e);
-                            return '<select><option value="">Error loading options</option></select>';
-                        }
-                    };
+            item.editoptions['buildSelect'] = function(data) {
+                try {
+                    const payload = utils.dropdownPayload(utils.safeJsonParse(data));
+                    if (!payload) {
+                        return '<select><option value="">Error loading options</option></select>';
+                    }
+                    
+                    var options = '<select><option value="">Select</option>';
+                    $.each(payload.data, function(index, item) {
+                        selected = item.selected ? 'selected="selected"' : '';
+                        options += '<option value="' + item.id + '" ' + selected + '>' + item.text + '</option>';
+                    });
+                    options += truncatedOption(payload);
+                    options += '</select>';
+                    return options;
+                } catch (e) {
+                    console.error('Error building edit select:', e);
+                    return '<select><option value="">Error loading options</option></select>';
                 }
+            };
+        }
+    });
 
-                // Handle edit options with data URLs
-                if (item.editoptions && item.editoptions.dataUrl) {
-                    item.editoptions['dataUrl'] = function(data) {
-                        // Dynamically build the URL with the current row ID
-                        if (data != '_empty') {
-                            return item.editoptions['dataUrlTemp'].replace('<id>', data);
-                        } else {
-                            return item.editoptions['dataUrlTemp'].replace('<id>/', '').replace('dropdown_pk', 'dropdown');
-                        }
-                    };
+    // Check if custom row renderer is defined for this table
+    let rowRendering = false;
+    
+    // First check for a custom renderer in the jqGridConfig
+    let customRenderer = window.jqGridConfig.rowRenderers[tableInstance.id];
+    
+    if (customRenderer) {
+        rowRendering = true;
+        // Configure grid for custom row rendering
+        gridOptions.colModel = [{
+            "label": tableInstance.id,
+            "name": tableInstance.id,
+            "formatter": customRenderer,
+            "frozen": true,
+            "formatoptions": {
+                "keys": true
+            }
+        }];
+
+        gridOptions.colNames = [tableInstance.id.toUpperCase()];
+        gridOptions.shrinkToFit = true;
+        gridOptions.multiselect = false;
+        gridOptions.colMenu = false;
+        gridOptions.toolbar = false;
+        gridOptions.sortable = false;
+        gridOptions.menubar = false;
+        gridOptions.headertitles = false;
+        gridOptions.rownumbers = false;
+
+        // Special configuration for contact list
+        if (tableInstance.id === 'lead_contacts_jqGrid') {
+            gridOptions.scroll = 1;
+            gridOptions.scrollrows = true;
+            gridOptions.scrollOffset = 0;
+            gridOptions.scrollTimeout = 100;
+        }
+    }
 
-                    item.editoptions['buildSelect'] = function(data) {
-                        try {
-                            data = utils.safeJsonParse(data);
-                            if (!data || !data.data || !data.data.data) {
-                                return '<select><option value="">Error loading options</option></select>';
-                            }
-                            
-                            var options = '<select><option value="">Select</option>';
-                            $.each(data.data.data, function(index, item) {
-                                selected = item.selected ? 'selected="selected"' : '';
-                                options += '<option value="' + item.id + '" ' + selected + '>' + item.text + '</option>';
-                            });
-                            options += '</select>';
-                            return options;
-                        } catch (e) {
-                            console.error('Error building edit select:', e);
-                            return '<select><option value="">Error loading options</option></select>';
-                        }
-                    };
+    // Merge with default grid options (allowing users to set global defaults)
+    const mergedOptions = $.extend(true, {}, window.jqGridConfig.defaultGridOptions, gridOptions);
+
+    // Server-side grouping: grouped by options.groupBy until changed
+    tableInstance.serverGrouping = gridConfig.server_grouping || null;
+    if (tableInstance.groupBy === undefined) {
+        tableInstance.groupBy = null;
+        if (tableInstance.serverGrouping &&
+            tableInstance.serverGrouping.fields.indexOf(tableInstance.options.groupBy) !== -1) {
+            tableInstance.groupBy = tableInstance.options.groupBy;
+        }
+    }
+    tableInstance.$grid.off('jqGridLoadComplete.jqgridGroup').on('jqGridLoadComplete.jqgridGroup', function() {
+        renderGroupHeaders(tableInstance, gridConfig);
+    });
+
+    // Initialize the grid
+    tableInstance.$grid.jqGrid(mergedOptions);
+
+    if (rowRendering) {
+        return;
+    }
+
+    // Apply method options
+    if (gridConfig.method_options) {
+        // Setup navGrid for this instance
+        if (gridConfig.method_options.navGrid) {
+            const navOpts = gridConfig.method_options.navGrid;
+            tableInstance['searchOptions'] = navOpts.searchOptions;
+            tableInstance.$grid.jqGrid('navGrid', tableInstance.pagerSelector,
+                navOpts.options,
+                navOpts.editOptions,
+                navOpts.addOptions,
+                navOpts.delOptions,
+                navOpts.searchOptions,
+                navOpts.viewOptions
+            );
+        }
+
+        // Setup filterToolbar for this instance
+        if (gridConfig.method_options.filterToolbar) {
+            // jqGrid ignores reloads while a request is loading; abort the request
+            // in flight so jqGrid ends it (its error path) and the newer toolbar
+            // search goes through
+            tableInstance.$grid.on('jqGridToolbarBeforeSearch', function() {
+                tableInstance.toolbarSearch = true;
+                if (tableInstance.activeRequest) {
+                    tableInstance.activeRequest.xhr.abort();
                 }
             });
+            tableInstance.$grid.jqGrid('filterToolbar', gridConfig.method_options.filterToolbar.options);
+        }
 
-            // Check if custom row renderer is defined for this table
-            let rowRendering = false;
-            
-            // First check for a custom renderer in the jqGridConfig
-            let customRenderer = window.jqGridConfig.rowRenderers[tableInstance.id];
-            
-            if (customRenderer) {
-                rowRendering = true;
-                // Configure grid for custom row rendering
-                gridOptions.colModel = [{
-                    "label": tableInstance.id,
-                    "name": tableInstance.id,
-                    "formatter": customRenderer,
-                    "frozen": true,
-                    "formatoptions": {
-                        "keys": true
-                    }
-                }];
-
-                gridOptions.colNames = [tableInstance.id.toUpperCase()];
-                gridOptions.shrinkToFit = true;
-                gridOptions.multiselect = false;
-                gridOptions.colMenu = false;
-                gridOptions.toolbar = false;
-                gridOptions.sortable = false;
-                gridOptions.menubar = false;
-                gridOptions.headertitles = false;
-                gridOptions.rownumbers = false;
-
-                // Special configuration for contact list
-                if (tableInstance.id === 'lead_contacts_jqGrid') {
-                    gridOptions.scroll = 1;
-                    gridOptions.scrollrows = true;
-                    gridOptions.scrollOffset = 0;
-                    gridOptions.scrollTimeout = 100;
-                }
-            }
+        // Other method options
+        if (gridConfig.method_options.setGroupHeaders) {
+            tableInstance.$grid.jqGrid('setGroupHeaders', gridConfig.method_options.setGroupHeaders.options);
+        }
 
-            // Merge with default grid options (allowing users to set global defaults)
-            const mergedOptions = $.extend(true, {}, window.jqGridConfig.defaultGridOptions, gridOptions);
+        if (gridConfig.method_options.setFrozenColumns &&
+            gridConfig.method_options.setFrozenColumns.enabled) {
+            tableInstance.$grid.jqGrid('setFrozenColumns');
+        }
+    }
 
-            // Initialize the grid
-            tableInstance.$grid.jqGrid(mergedOptions);
+    // Initialize toolbar with instance-specific settings
+    initializeToolbarForTable(tableInstance, gridConfig);
 
-            if (rowRendering) {
-                return;
-            }
+    // Initialize bulk actions with instance-specific settings
+    if (gridConfig.bulk_action_config) {
+        initializeBulkActionsForTable(tableInstance, gridConfig.bulk_action_config);
+    }
 
-            // Apply method options
-            if (gridConfig.method_options) {
-                // Setup navGrid for this instance
-                if (gridConfig.method_options.navGrid) {
-                    const navOpts = gridConfig.method_options.navGrid;
-                    tableInstance['searchOptions'] = navOpts.searchOptions;
-                    tableInstance.$grid.jqGrid('navGrid', tableInstance.pagerSelector,
-                        navOpts.options,
-                        navOpts.editOptions,
-                        navOpts.addOptions,
-                        navOpts.delOptions,
-                        navOpts.searchOptions,
-                        navOpts.viewOptions
-                    );
-                }
+    // Fetch additional data for this table
+    fetchAdditionalDataForTable(tableInstance);
+    
 
-                // Setup filterToolbar for this instance
-                if (gridConfig.method_options.filterToolbar) {
-                    tableInstance.$grid.jqGrid('filterToolbar', gridConfig.method_options.filterToolbar.options);
-                }
+    // Trigger custom event when grid is initialized
+    if (typeof tableInstance.options.onInitComplete === 'function') {
+        tableInstance.options.onInitComplete(tableInstance);
+    }
 
-                // Other method options
-                if (gridConfig.method_options.setGroupHeaders) {
-                    tableInstance.$grid.jqGrid('setGroupHeaders', gridConfig.method_options.setGroupHeaders.options);
-                }
+    // Allow user to apply hooks after grid initialization
+    if (typeof window.jqGridConfig.hooks.afterInitGrid === 'function') {
+        window.jqGridConfig.hooks.afterInitGrid(tableInstance, gridConfig);
+    }
+}
 
-                if (gridConfig.method_options.setFrozenColumns &&
-                    gridConfig.method_options.setFrozenColumns.enabled) {
-                    tableInstance.$grid.jqGrid('setFrozenColumns');
-                }
-            }
+/**
+ * Identify a data request, ignoring the timestamps (jqGrid's nd, jQuery's _)
+ * that make every request unique
+ * @param {Object} settings - jQuery ajax settings
+ * @returns {string} Request key
+ */
+function getRequestKey(settings) {
+    const data = typeof settings.data === 'string' ? settings.data : '';
+    return `${settings.type} ${settings.url} ${data}`.replace(/([?&])(nd|_)=\d+&?/g, '$1');
+}
+
+/**
+ * Keep one data request per table in flight: a request identical to the one in
+ * flight (or, for toolbar searches, to the rows shown) is dropped, and a
+ * different one aborts the request it supersedes so responses cannot arrive
+ * out of order
+ * @param {Object} tableInstance - Table instance configuration
+ * @param {Object} xhr - jqXHR of the request about to be sent
+ * @param {Object} settings - jQuery ajax settings
+ * @returns {boolean} False to cancel the request
+ */
+function trackGridRequest(tableInstance, xhr, settings) {
+    const key = getRequestKey(settings);
+    const active = tableInstance.activeRequest;
+    const toolbarSearch = tableInstance.toolbarSearch;
+    tableInstance.toolbarSearch = false;
+
+    if (active && active.key === key) {
+        return false;
+    }
+    if (!active && toolbarSearch && tableInstance.loadedRequestKey === key) {
+        return false;
+    }
+    if (active) {
+        // jQuery runs the aborted request's callbacks, and with them jqGrid's
+        // endReq(), synchronously: before jqGrid starts this request
+        active.xhr.abort();
+    }
+
+    tableInstance.activeRequest = { key: key, xhr: xhr };
+    xhr.done(function() {
+        tableInstance.loadedRequestKey = key;
+    }).always(function() {
+        if (tableInstance.activeRequest && tableInstance.activeRequest.xhr === xhr) {
+            tableInstance.activeRequest = null;
+        }
+    });
+    return true;
+}
+
+/**
+ * Build the part of the request that a keyset cursor depends on
+ * @param {Object} postData - Grid request parameters
+ * @returns {string} Signature of sorting, filters and page size
+ */
+function getCursorSignature(postData) {
+    return JSON.stringify([postData.sidx, postData.sord, postData._search, postData.filters, postData.rows]);
+}
+
+/**
+ * Read a request parameter name of the server_grouping config
+ * @param {Object} gridConfig - Grid configuration from server
+ * @param {string} name - group_by_param or group_value_param
+ * @returns {string} Parameter name
+ */
+function serverGroupingParam(gridConfig, name) {
+    const defaults = { group_by_param: 'group_by', group_value_param: 'group_value' };
+    return (gridConfig.server_grouping && gridConfig.server_grouping[name]) || defaults[name];
+}
+
+/**
+ * Group the rows of a table on the server, or show plain rows again
+ * @param {Object} tableInstance - Table instance configuration
+ * @param {string|null} field - One of server_grouping.fields, or null
+ */
+function setGridGrouping(tableInstance, field) {
+    const grouping = tableInstance.serverGrouping;
+    if (field && (!grouping || grouping.fields.indexOf(field) === -1)) {
+        console.warn(`${tableInstance.id}: cannot group by ${field}`);
+        return;
+    }
+    tableInstance.groupBy = field || null;
+    $(`#${tableInstance.id}_groupBy`).val(tableInstance.groupBy || '');
+    tableInstance.$grid.jqGrid('setGridParam', { page: 1 }).trigger('reloadGrid');
+}
 
-            // Initialize toolbar with instance-specific settings
-            initializeToolbarForTable(tableInstance, gridConfig);
+/**
+ * Render the group headers of a grouped response as collapsed rows; each
+ * header cell of a column shows that column's summary value
+ * @param {Object} tableInstance - Table instance configuration
+ * @param {Object} gridConfig - Grid configuration from server
+ */
+function renderGroupHeaders(tableInstance, gridConfig) {
+    const grouped = tableInstance.groupHeaders;
+    if (!grouped) {
+        return;
+    }
 
-            // Initialize bulk actions with instance-specific settings
-            if (gridConfig.bulk_action_config) {
-                initializeBulkActionsForTable(tableInstance, gridConfig.bulk_action_config);
+    const colModel = tableInstance.$grid.jqGrid('getGridParam', 'colModel') || [];
+    const labelIndex = colModel.findIndex(function(col) {
+        return !col.hidden && ['cb', 'rn', 'subgrid', 'actions'].indexOf(col.name) === -1;
+    });
+    const $tbody = $(tableInstance.$grid[0].tBodies[0]);
+
+    tableInstance.groups = grouped.headers.map(function(header, index) {
+        const rowId = `${tableInstance.id}_group_${index}`;
+        const cells = colModel.map(function(col, colIndex) {
+            const style = col.hidden ? ' style="display:none"' : '';
+            if (colIndex === labelIndex) {
+                return `<td${style}><span class="jqgrid-group-toggle fas fa-plus-square mr-1"></span>` +
+                    `<b>${utils.escapeHtml(header.label)}</b> (${header.count})</td>`;
             }
+            const summary = header.summary || {};
+            return `<td${style}>${summary[col.name] !== undefined ? utils.escapeHtml(summary[col.name]) : ''}</td>`;
+        });
+        $tbody.append(`<tr id="${rowId}" class="jqgroup jqgrid-group-header" data-group="${index}" role="row">${cells.join('')}</tr>`);
+        return { header: header, rowId: rowId, expanded: false, loaded: 0, total: null, loading: false };
+    });
 
-            // Fetch additional data for this table
-            fetchAdditionalDataForTable(tableInstance);
-            
+    if (grouped.truncated) {
+        showMessage(tableInstance, 'warning', `Showing the first ${grouped.headers.length} groups only`);
+    }
+
+    $tbody.off('click.jqgridGroup').on('click.jqgridGroup', 'tr.jqgrid-group-header', function() {
+        toggleGroup(tableInstance, gridConfig, tableInstance.groups[Number($(this).data('group'))]);
+    }).on('click.jqgridGroup', 'tr.jqgrid-group-more', function() {
+        loadGroupRows(tableInstance, gridConfig, tableInstance.groups[Number($(this).data('group'))]);
+    });
+}
 
-            // Trigger custom event when grid is initialized
-            if (typeof tableInstance.options.onInitComplete === 'function') {
-                tableInstance.options.onInitComplete(tableInstance);
+/**
+ * Expand a group, loading its first rows, or collapse it
+ * @param {Object} tableInstance - Table instance configuration
+ * @param {Object} gridConfig - Grid configuration from server
+ * @param {Object} group - Group state from renderGroupHeaders
+ */
+function toggleGroup(tableInstance, gridConfig, group) {
+    if (!group) {
+        return;
+    }
+    group.expanded = !group.expanded;
+    $(`#${group.rowId} .jqgrid-group-toggle`)
+        .toggleClass('fa-plus-square', !group.expanded)
+        .toggleClass('fa-minus-square', group.expanded);
+    $(tableInstance.$grid[0].tBodies[0]).find(`tr[data-group-row="${group.rowId}"]`).toggle(group.expanded);
+
+    if (group.expanded && group.total === null) {
+        loadGroupRows(tableInstance, gridConfig, group);
+    }
+}
+
+/**
+ * Load the next page of rows of a group with `group_by` and `group_value`,
+ * keeping the grid's filters and sorting, and insert them under its header
+ * @param {Object} tableInstance - Table instance configuration
+ * @param {Object} gridConfig - Grid configuration from server
+ * @param {Object} group - Group state from renderGroupHeaders
+ */
+function loadGroupRows(tableInstance, gridConfig, group) {
+    if (!group || group.loading) {
+        return;
+    }
+    const $grid = tableInstance.$grid;
+    const rowsPerPage = Number($grid.jqGrid('getGridParam', 'rowNum')) || 25;
+    const serialize = $grid.jqGrid('getGridParam', 'serializeGridData');
+    const params = serialize($.extend({}, $grid.jqGrid('getGridParam', 'postData')));
+    const value = group.header.value;
+
+    params[serverGroupingParam(gridConfig, 'group_value_param')] =
+        value === null ? tableInstance.serverGrouping.null_value : String(value);
+    params.page = Math.floor(group.loaded / rowsPerPage) + 1;
+    params.rows = rowsPerPage;
+    delete params.cursor;
+    delete params.nd;
+
+    group.loading = true;
+    $.ajax({
+        url: $grid.jqGrid('getGridParam', 'url'),
+        method: 'GET',
+        data: params,
+        headers: window.token || {},
+        success: function(response) {
+            const payload = response && response.data && response.data.page !== undefined ? response.data : response;
+            let rows = payload.data || [];
+            if (payload.columns) {
+                rows = rows.map(function(cells) {
+                    const row = {};
+                    payload.columns.forEach(function(name, index) { row[name] = cells[index]; });
+                    return row;
+                });
             }
 
-            // Allow user to apply hooks after grid initialization
-            if (typeof window.jqGridConfig.hooks.afterInitGrid === 'function') {
-                window.jqGridConfig.hooks.afterInitGrid(tableInstance, gridConfig);
+            const keyField = gridConfig.key_field || 'id';
+            const idPrefix = $grid.jqGrid('getGridParam', 'idPrefix') || '';
+            const $tbody = $($grid[0].tBodies[0]);
+            $tbody.find(`tr.jqgrid-group-more[data-group-row="${group.rowId}"]`).remove();
+            const $lastRow = $tbody.find(`tr[data-group-row="${group.rowId}"]:not(.jqgrid-group-more)`).last();
+            let previousId = $lastRow.length ? $lastRow.attr('id') : group.rowId;
+            rows.forEach(function(row) {
+                $grid.jqGrid('addRowData', row[keyField], row, 'after', previousId);
+                previousId = idPrefix + row[keyField];
+                $($grid[0].rows.namedItem(previousId)).attr('data-group-row', group.rowId).toggle(group.expanded);
+            });
+
+            group.loaded += rows.length;
+            group.total = group.header.count;
+            if (group.loaded < group.total && rows.length) {
+                const colspan = ($grid.jqGrid('getGridParam', 'colModel') || []).length;
+                $($grid[0].rows.namedItem(previousId)).after(
+                    `<tr class="jqgrid-group-more" data-group="${$(`#${group.rowId}`).data('group')}" ` +
+                    `data-group-row="${group.rowId}"><td colspan="${colspan}"><a href="javascript:void(0)">` +
+                    `Show more (${group.total - group.loaded})</a></td></tr>`
+                );
             }
         },
-        error: function(xhr, status, error) {
-            utils.notify('error', 'Error loading grid configuration: ' + error, tableInstance);
-            console.error('AJAX Error:', xhr.responseText);
+        error: function(xhr) {
+            const message = xhr.responseJSON && xhr.responseJSON.message;
+            utils.notify('error', message || 'Error loading group rows', tableInstance);
+        },
+        complete: function() {
+            group.loading = false;
         }
     });
 }
 
+/**
+ * Add a "Group by" select to the toolbar of a grid with server_grouping
+ * @param {Object} tableInstance - Table instance configuration
+ * @param {Object} gridConfig - Grid configuration from server
+ */
+function addGroupingSelectToToolbar(tableInstance, gridConfig) {
+    const grouping = gridConfig.server_grouping;
+    if (!grouping || !grouping.fields.length || $(`#${tableInstance.id}_groupBy`).length) {
+        return;
+    }
+
+    const colModel = gridConfig.jqgrid_options.colModel || [];
+    const options = grouping.fields.map(function(field) {
+        const col = colModel.find(function(item) { return item.name === field; });
+        const label = (col && col.label) || field;
+        return `<option value="${utils.escapeHtml(field)}">${utils.escapeHtml(label)}</option>`;
+    });
+    const $select = $(
+        `<select id="${tableInstance.id}_groupBy" class="form-control form-control-sm mr-2" style="width: auto;">` +
+        `<option value="">No grouping</option>${options.join('')}</select>`
+    );
+    $select.val(tableInstance.groupBy || '').on('change', function() {
+        setGridGrouping(tableInstance, this.value);
+    });
+    $(`#${tableInstance.toolbarSettings.toolbarId} .toolbar-left`).append($select);
+}
+
 /**
  * Initialize toolbar for a specific table instance
  * @param {Object} tableInstance - Table instance configuration
@@ -698,6 +1263,9 @@ function initializeToolbarForTable(tableInstance, gridConfig) {
     // Add custom buttons
     addCustomButtonsToToolbar(tableInstance);
 
+    // Add the server-side grouping select
+    addGroupingSelectToToolbar(tableInstance, gridConfig);
+
     // Allow user to apply hooks after toolbar creation
     if (typeof window.jqGridConfig.hooks.afterCreateToolbar === 'function') {
         window.jqGridConfig.hooks.afterCreateToolbar(tableInstance, toolbarId, gridConfig);
@@ -1170,9 +1738,10 @@ function initializeSelect2ForField($select) {
                     params.page = params.page || 1;
 
                     // Process response data
+                    const payload = utils.dropdownPayload(response);
                     let items = [];
-                    if (response && response.data && response.data.data) {
-                        items = response.data.data.map(item => ({
+                    if (payload) {
+                        items = payload.data.map(item => ({
                             id: item.id,
                             text: item.text,
                             selected: item.selected || false
@@ -1182,7 +1751,9 @@ function initializeSelect2ForField($select) {
                     return {
                         results: items,
                         pagination: {
-                            more: (params.page * 30) < (response.data.recordsTotal || 0)
+                            more: payload && payload.more !== undefined
+                                ? payload.more
+                                : (params.page * 30) < ((payload && payload.recordsTotal) || 0)
                         }
                     };
                 },
@@ -1198,6 +1769,32 @@ function initializeSelect2ForField($select) {
     }
 }
 
+/**
+ * Build the selection part of a bulk action request. For the "all" scope the
+ * server re-applies the grid filters, so only rows left unchecked on the
+ * current page are sent, as excluded_ids.
+ * @param {Object} tableInstance - Table instance configuration
+ * @param {Array} ids - Selected row IDs
+ * @param {string} scope - Selection scope ("specific" or "all")
+ * @returns {Object} Request payload without the action
+ */
+function getBulkSelection(tableInstance, ids, scope) {
+    if (scope !== 'all') {
+        return { scope: 'specific', ids: ids };
+    }
+
+    const postData = tableInstance.$grid.jqGrid('getGridParam', 'postData') || {};
+    const pageIds = tableInstance.$grid.jqGrid('getDataIDs') || [];
+    return {
+        scope: 'all',
+        filters: postData.filters,
+        _search: postData._search,
+        excluded_ids: pageIds.filter(id => ids.indexOf(id) === -1),
+        // The user picked "all": an unfiltered grid may act on every row
+        confirm_all: true
+    };
+}
+
 /**
  * Submit the bulk update form
  * @param {Object} tableInstance - Table instance configuration
@@ -1281,12 +1878,9 @@ function submitBulkUpdate(tableInstance) {
     $.ajax({
         url: apiUrl,
         method: 'POST',
-        data: JSON.stringify({
-            ids: ids,
-            filters: tableInstance.$grid.jqGrid('getGridParam', 'postData').filters,
-            scope: scope,
+        data: JSON.stringify(Object.assign(getBulkSelection(tableInstance, ids, scope), {
             action: action
-        }),
+        })),
         contentType: 'application/json',
         headers: window.token || {},
         success: function(response) {
@@ -1365,14 +1959,11 @@ function performBulkDelete(tableInstance) {
     $.ajax({
         url: apiUrl,
         method: 'POST',
-        data: JSON.stringify({
-            ids: selectedIds,
-            filters: tableInstance.$grid.jqGrid('getGridParam', 'postData').filters,
-            scope: scope,
+        data: JSON.stringify(Object.assign(getBulkSelection(tableInstance, selectedIds, scope), {
             action: {
                 _delete: true
             }
-        }),
+        })),
         contentType: 'application/json',
         headers: window.token || {},
         success: function(response) {
@@ -1626,6 +2217,7 @@ window.jqGridManager = {
     // Public API
     initializeTableInstance: initializeTableInstance,
     refreshTable: refreshTable,
+    setGridGrouping: setGridGrouping,
     getFilterQueryString: getFilterQueryString,
     showMessage: showMessage,
     utils: utils,
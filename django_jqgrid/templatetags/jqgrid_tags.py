@@ -1,8 +1,12 @@
 import json
 
 from django import template
+from django.utils.html import format_html
 from django.utils.safestring import mark_safe
 
+from django_jqgrid.cache import get_config_version
+from django_jqgrid.embedding import get_grid_config, render_json_script
+
 register = template.Library()
 
 
@@ -70,11 +74,21 @@ def jqgrid_js():
     return mark_safe('\n'.join(js))
 
 
-@register.inclusion_tag('django_jqgrid/grid_tag.html')
-def jqgrid(grid_id, app_name, model_name, grid_title=None,
+@register.simple_tag
+def jqgrid_config_version():
+    """
+    Announces the grid config version to jqgrid-core.js, which drops configs it
+    stored in the browser under another version. Place it in the page <head>.
+    """
+    return format_html('<meta name="jqgrid-config-version" content="{}">', get_config_version())
+
+
+@register.inclusion_tag('django_jqgrid/grid_tag.html', takes_context=True)
+def jqgrid(context, grid_id, app_name, model_name, grid_title=None,
            custom_formatters=None, custom_buttons=None, custom_bulk_actions=None,
            on_grid_complete=None, on_select_row=None, on_select_all=None,
-           on_init_complete=None, extra_options=None, include_import_export=True):
+           on_init_complete=None, extra_options=None, include_import_export=True,
+           embed_config=False):
     """
     Renders a jqGrid with the specified options.
     
@@ -92,6 +106,8 @@ def jqgrid(grid_id, app_name, model_name, grid_title=None,
         on_init_complete (str, optional): JavaScript function to call when grid initialization completes
         extra_options (str, optional): Additional options to pass to initializeTableInstance
         include_import_export (bool, optional): Whether to include import/export buttons (default: True)
+        embed_config (bool, optional): Embed the grid's jqgrid_config in the page so jqgrid-core.js
+            skips fetching it; requires ``request`` in the template context (default: False)
         
     Returns:
         dict: Context for the template rendering
@@ -100,6 +116,8 @@ def jqgrid(grid_id, app_name, model_name, grid_title=None,
         {% jqgrid "users_grid" "mainapp" "user" "Users" %}
         
         {% jqgrid "users_grid" "mainapp" "user" "Users" include_import_export=False %}
+
+        {% jqgrid "users_grid" "mainapp" "user" "Users" embed_config=True %}
     """
     # Convert dictionary objects to JSON strings if provided
     if custom_formatters:
@@ -114,7 +132,15 @@ def jqgrid(grid_id, app_name, model_name, grid_title=None,
         if isinstance(custom_bulk_actions, dict):
             custom_bulk_actions = json.dumps(custom_bulk_actions)
 
+    embedded_config = None
+    request = context.get('request')
+    if embed_config and request is not None:
+        grid_config = get_grid_config(request, app_name, model_name)
+        if grid_config is not None:
+            embedded_config = render_json_script(grid_config[0], f"{grid_id}_config")
+
     return {
+        'embedded_config': embedded_config,
         'grid_id': grid_id,
         'app_name': app_name,
         'model_name': model_name,
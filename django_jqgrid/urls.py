@@ -2,13 +2,14 @@ from django.urls import path, include
 from django.views.generic import TemplateView
 from rest_framework.routers import DefaultRouter
 
-from django_jqgrid.views import GridFilterViewSet
+from django_jqgrid.views import GridFilterViewSet, JqGridConfigBundleView
 
 router = DefaultRouter()
 router.register(r'grid-filter', GridFilterViewSet)
 
 urlpatterns = [
     path('', include(router.urls)),
+    path('config-bundle/', JqGridConfigBundleView.as_view(), name='jqgrid_config_bundle'),
     # Example page showcasing standalone grid
     path('example/', TemplateView.as_view(template_name='django_jqgrid/example_page.html'), name='jqgrid_example'),
 ]
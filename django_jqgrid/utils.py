@@ -1,14 +1,123 @@
 """Utility functions for django-jqgrid package."""
 
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
 from django.db import models
+import copy
+import hashlib
 import json
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def get_performance_setting(key, default=None):
+    """
+    Read a key from the ``JQGRID_PERFORMANCE`` settings dictionary.
+
+    Args:
+        key: Setting name inside ``JQGRID_PERFORMANCE``
+        default: Value returned when the key is not configured
+
+    Returns:
+        The configured value or ``default``
+    """
+    return getattr(settings, 'JQGRID_PERFORMANCE', {}).get(key, default)
+
+
+class FrozenDict(dict):
+    """
+    Read-only dictionary used for configuration shared between requests.
+
+    It is still a ``dict`` so it serializes like one; ``copy()`` returns a plain,
+    mutable shallow copy for callers that need to derive a new structure.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"'{self.__class__.__name__}' object is read-only")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    __ior__ = _readonly
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+
+class InstanceDefault:
+    """
+    Class attribute whose value every instance gets its own deep copy of.
+
+    The copy is made on first access from an instance, so instances may modify
+    it freely; reading the attribute from the class returns the shared default.
+    """
+
+    def __init__(self, value):
+        self.value = value
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.value
+        value = instance.__dict__[self.name] = copy.deepcopy(self.value)
+        return value
+
+
+def freeze(value):
+    """
+    Recursively convert dictionaries and lists into FrozenDict and tuples.
+
+    Args:
+        value: Configuration value to freeze
+
+    Returns:
+        An immutable copy of ``value``
+    """
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def deep_merge(base, overlay):
+    """
+    Merge ``overlay`` on top of ``base`` without modifying either (copy-on-write).
+
+    Nested dictionaries present in both are merged recursively into new
+    dictionaries; values untouched by the overlay are shared with ``base``.
+
+    Args:
+        base: Base mapping (may be frozen)
+        overlay: Mapping whose values take precedence
+
+    Returns:
+        A new dict with the merged result
+    """
+    merged = dict(base)
+    for key, value in overlay.items():
+        if isinstance(merged.get(key), dict) and isinstance(value, dict):
+            merged[key] = deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def get_queryset_signature(queryset):
+    """
+    Return a hash of the SQL and parameters of a filtered queryset.
+
+    Ordering is left out, so the signature identifies the filtered row set.
+    Used to key caches of counts and aggregates per filter combination.
+    """
+    sql, params = queryset.order_by().query.sql_with_params()
+    signature = f"{queryset.db}|{sql}|{params!r}"
+    return hashlib.md5(signature.encode('utf-8')).hexdigest()
+
+
 def get_content_type_cached(app_label, model_name, cache_timeout=3600):
     """
     Get ContentType with caching to reduce database queries.
@@ -1,12 +1,16 @@
 from django.contrib.contenttypes.models import ContentType
-from django.core.cache import cache
 from django.db import models
+from django.utils.http import parse_etags
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
+from django_jqgrid.embedding import get_grid_bundle
 from django_jqgrid.models import GridFilter
+from django_jqgrid.saved_filters import get_saved_filters
 from django_jqgrid.serializers import GridFilterSerializer
+from django_jqgrid.utils import get_content_type_cached
 
 
 class GridFilterViewSet(viewsets.ModelViewSet):
@@ -45,14 +49,12 @@ class GridFilterViewSet(viewsets.ModelViewSet):
 
         try:
             # Get content type for this app/model with caching
-            cache_key = f"content_type_{app_name}_{model_name}"
-            content_type = cache.get(cache_key)
-            if not content_type:
-                content_type = ContentType.objects.get(app_label=app_name, model=model_name)
-                cache.set(cache_key, content_type, 3600)  # Cache for 1 hour
-
-            # Get filters for this content type
-            filters = self.get_queryset().filter(table=content_type)
+            content_type = get_content_type_cached(app_name, model_name)
+            if content_type is None:
+                raise ContentType.DoesNotExist
+
+            # User and global filters of this content type in one query
+            filters = get_saved_filters(content_type, request.user, key=None).select_related('table', 'created_by')
             serializer = self.get_serializer(filters, many=True)
 
             return Response({
@@ -76,3 +78,43 @@ class GridFilterViewSet(viewsets.ModelViewSet):
                 {"error": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+class JqGridConfigBundleView(APIView):
+    """
+    API endpoint returning the configs and saved filters of several grids, so
+    pages showing many grids initialize them from one request.
+
+    GET ``?grids=app.model,app.other_model``
+    """
+    max_grids = 20
+
+    def get_grids(self, request):
+        names = [name.strip() for name in request.query_params.get('grids', '').split(',') if name.strip()]
+        grids = []
+        for name in dict.fromkeys(names):
+            app_name, _, model_name = name.partition('.')
+            if not app_name or not model_name:
+                raise ValueError(f"Invalid grid '{name}', expected <app_name>.<model_name>")
+            grids.append((app_name, model_name.lower()))
+        if not grids:
+            raise ValueError("The grids parameter is required")
+        if len(grids) > self.max_grids:
+            raise ValueError(f"At most {self.max_grids} grids can be bundled")
+        return grids
+
+    def get(self, request):
+        try:
+            grids = self.get_grids(request)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        bundle, etag = get_grid_bundle(request, grids)
+        if etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(bundle)
+
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, no-cache'
+        return response
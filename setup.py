@@ -87,6 +87,7 @@ setup(
         'production': [
             'redis>=3.5.0',  # For caching
             'celery>=5.1.0',  # For background tasks
+            'orjson>=3.6.0',  # Fast JSON rendering
         ],
         'import-export': [
             'openpyxl>=3.0.0',  # Excel import/export
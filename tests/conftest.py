@@ -0,0 +1,43 @@
+"""Fixtures shared by the bulk action and cache invalidation tests."""
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from rest_framework import viewsets
+from rest_framework.test import APIRequestFactory
+
+from django_jqgrid.mixins import JqGridBulkActionMixin
+from django_jqgrid.models import GridFilter
+from django_jqgrid.serializers import GridFilterSerializer
+
+
+class BulkViewSet(JqGridBulkActionMixin, viewsets.ModelViewSet):
+    queryset = GridFilter.objects.all()
+    serializer_class = GridFilterSerializer
+
+
+@pytest.fixture
+def bulk_viewset():
+    return BulkViewSet
+
+
+@pytest.fixture
+def make_filters(db):
+    """Create ``count`` saved filters and return their primary keys."""
+    def make(count):
+        table = ContentType.objects.get_for_model(GridFilter)
+        return [
+            GridFilter.objects.create(name=f"filter {i}", table=table).pk
+            for i in range(count)
+        ]
+    return make
+
+
+@pytest.fixture
+def post_bulk():
+    """POST ``payload`` to the bulk_action endpoint of ``viewset_class``."""
+    factory = APIRequestFactory()
+
+    def post(viewset_class, payload):
+        request = factory.post('/bulk_action/', payload, format='json')
+        return viewset_class.as_view({'post': 'bulk_action'})(request)
+    return post
@@ -0,0 +1,155 @@
+/**
+ * Server-side grouping in jqgrid-core.js: expanding a group loads its rows
+ * page by page under the group header ("Show more").
+ *
+ * Runs with `node --test tests/js/` against a minimal table stand-in for
+ * jQuery and jqGrid, covering the calls loadGroupRows() makes.
+ */
+const assert = require('node:assert');
+const fs = require('node:fs');
+const path = require('node:path');
+const test = require('node:test');
+const vm = require('node:vm');
+
+const CORE = path.join(__dirname, '../../django_jqgrid/static/django_jqgrid/js/jqgrid-core.js');
+
+class Row {
+    constructor(id, classes = [], attrs = {}) {
+        this.id = id;
+        this.classes = new Set(classes);
+        this.attrs = attrs;
+        this.visible = true;
+    }
+}
+
+const SELECTOR = /^tr((?:\.[\w-]+)*)((?:\[[\w-]+="[^"]*"\])*)(?::not\(\.([\w-]+)\))?$/;
+
+function matches(row, selector) {
+    const [, classes, attrs, excluded] = SELECTOR.exec(selector);
+    return classes.split('.').filter(Boolean).every(name => row.classes.has(name)) &&
+        [...attrs.matchAll(/\[([\w-]+)="([^"]*)"\]/g)].every(([, name, value]) => row.attrs[name] === value) &&
+        !(excluded && row.classes.has(excluded));
+}
+
+function parseRow(html) {
+    const attrs = {};
+    for (const [, name, value] of html.matchAll(/([\w-]+)="([^"]*)"/g)) {
+        attrs[name] = value;
+    }
+    const row = new Row(attrs.id || null, (attrs.class || '').split(' ').filter(Boolean), attrs);
+    delete row.attrs.class;
+    return row;
+}
+
+function createGrid(params) {
+    const rows = [];
+    rows.namedItem = id => rows.find(row => row.id === id) || null;
+    const tbody = { rows: rows };
+    const requests = [];
+    const responses = [];
+
+    function wrap(list) {
+        return {
+            length: list.length,
+            last: () => wrap(list.slice(-1)),
+            find: selector => wrap(rows.filter(row => matches(row, selector))),
+            remove: () => list.forEach(row => rows.splice(rows.indexOf(row), 1)),
+            attr: (name, value) => {
+                if (value === undefined) {
+                    return list.length ? (name === 'id' ? list[0].id : list[0].attrs[name]) : undefined;
+                }
+                list.forEach(row => { row.attrs[name] = String(value); });
+                return wrap(list);
+            },
+            data: name => list.length ? list[0].attrs[`data-${name}`] : undefined,
+            toggle: show => {
+                list.forEach(row => { row.visible = show; });
+                return wrap(list);
+            },
+            after: html => {
+                list.forEach(row => rows.splice(rows.indexOf(row) + 1, 0, parseRow(html)));
+                return wrap(list);
+            }
+        };
+    }
+
+    function $(target) {
+        if (target === tbody) {
+            return wrap([]);
+        }
+        if (typeof target === 'string' && target[0] === '#') {
+            return wrap(rows.filter(row => row.id === target.slice(1)));
+        }
+        if (target instanceof Row) {
+            return wrap([target]);
+        }
+        return { ready: () => {}, length: 0 };
+    }
+    $.extend = Object.assign;
+    $.ajax = function(options) {
+        requests.push(options.data);
+        options.success(responses.shift());
+        options.complete();
+    };
+
+    const $grid = {
+        0: { tBodies: [tbody], rows: rows },
+        jqGrid: function(method, ...args) {
+            if (method === 'getGridParam') {
+                return params[args[0]];
+            }
+            if (method === 'addRowData') {
+                const [id, , position, anchor] = args;
+                const index = rows.findIndex(row => row.id === anchor);
+                if (position !== 'after' || index === -1) {
+                    return false;
+                }
+                rows.splice(index + 1, 0, new Row((params.idPrefix || '') + id, ['jqgrow']));
+                return true;
+            }
+            throw new Error(`Unexpected jqGrid call ${method}`);
+        }
+    };
+    return { $, $grid, rows, requests, responses };
+}
+
+function loadCore($) {
+    const context = { $, jQuery: $, console, document: {}, setTimeout, clearTimeout };
+    context.window = context;
+    vm.createContext(context);
+    vm.runInContext(fs.readFileSync(CORE, 'utf8'), context);
+    return context;
+}
+
+test('expanding a group loads every page under its header', () => {
+    const grid = createGrid({
+        rowNum: 2, idPrefix: 'g_', url: '/api/shop/order/', colModel: [{ name: 'id' }, { name: 'status' }],
+        postData: { page: 3, rows: 2, nd: 1 }, serializeGridData: data => data
+    });
+    const core = loadCore(grid.$);
+    grid.rows.push(new Row('orders_group_0', ['jqgroup', 'jqgrid-group-header'], { 'data-group': '0' }));
+    grid.rows.push(new Row('orders_group_1', ['jqgroup', 'jqgrid-group-header'], { 'data-group': '1' }));
+
+    const tableInstance = { id: 'orders', $grid: grid.$grid, serverGrouping: { null_value: '__null__' } };
+    const gridConfig = { key_field: 'id', server_grouping: { group_value_param: 'group_value' } };
+    const group = {
+        header: { value: 'open', count: 5 }, rowId: 'orders_group_0',
+        expanded: true, loaded: 0, total: null, loading: false
+    };
+    const page = ids => ({ data: { page: 1, data: ids.map(id => ({ id: id, status: 'open' })) } });
+    grid.responses.push(page([1, 2]), page([3, 4]), page([5]));
+
+    core.loadGroupRows(tableInstance, gridConfig, group);
+    assert.deepStrictEqual(grid.rows.map(row => row.id),
+        ['orders_group_0', 'g_1', 'g_2', null, 'orders_group_1']);
+
+    core.loadGroupRows(tableInstance, gridConfig, group);
+    core.loadGroupRows(tableInstance, gridConfig, group);
+
+    assert.deepStrictEqual(grid.requests.map(data => [data.page, data.group_value, data.nd]),
+        [[1, 'open', undefined], [2, 'open', undefined], [3, 'open', undefined]]);
+    assert.deepStrictEqual(grid.rows.map(row => row.id),
+        ['orders_group_0', 'g_1', 'g_2', 'g_3', 'g_4', 'g_5', 'orders_group_1']);
+    assert.ok(grid.rows.slice(1, 6).every(row => row.attrs['data-group-row'] === 'orders_group_0'));
+    assert.strictEqual(group.loaded, 5);
+});
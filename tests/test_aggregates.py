@@ -0,0 +1,87 @@
+"""Tests for server-side footer aggregates in JqGridPagination."""
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from django_jqgrid.aggregates import normalize_aggregation_fields
+from django_jqgrid.pagination import JqGridPagination
+
+User = get_user_model()
+
+
+class AggregateView:
+    aggregation_fields = {'id': ['max', 'sum'], 'is_staff': 'count'}
+
+
+class StaleView:
+    # `items_count` is neither a field nor an annotation of the queryset
+    aggregation_fields = {'items_count': 'count', 'id': 'max'}
+
+
+def paginate(queryset, view=AggregateView()):
+    paginator = JqGridPagination()
+    request = Request(APIRequestFactory().get('/?page=1&rows=2'))
+    paginator.paginate_queryset(queryset, request, view)
+    return paginator.get_paginated_response([]).data
+
+
+@pytest.fixture
+def users(db):
+    cache.clear()
+    return [User.objects.create(username=f"user{i}", is_staff=i % 2 == 0) for i in range(5)]
+
+
+def test_userdata_aggregates_full_filtered_queryset(users):
+    ids = [user.pk for user in users]
+
+    data = paginate(User.objects.filter(is_staff=True).order_by('id'))
+
+    staff_ids = ids[0::2]
+    assert data['userdata']['id_max'] == max(staff_ids)
+    assert data['userdata']['id_sum'] == sum(staff_ids)
+    assert data['userdata']['is_staff_count'] == 3
+    # The first declared function is exposed under the column name for the footer
+    assert data['userdata']['id'] == max(staff_ids)
+
+
+def test_aggregates_are_cached_per_filter_signature(users, django_assert_num_queries):
+    paginate(User.objects.order_by('id'))
+
+    # COUNT and page rows only; aggregates come from the cache
+    with django_assert_num_queries(2):
+        data = paginate(User.objects.order_by('-id'))
+    assert data['userdata']['is_staff_count'] == 5
+
+    # A different filter is a different signature
+    with django_assert_num_queries(3):
+        data = paginate(User.objects.filter(is_staff=False).order_by('id'))
+    assert data['userdata']['is_staff_count'] == 2
+
+
+def test_no_aggregation_fields_means_empty_userdata(users):
+    assert paginate(User.objects.order_by('id'), view=None)['userdata'] == {}
+
+
+def test_unknown_field_names_are_skipped(users):
+    data = paginate(User.objects.order_by('id'), view=StaleView())
+
+    assert data['userdata'] == {'id_max': max(user.pk for user in users), 'id': max(user.pk for user in users)}
+
+
+def test_aggregates_are_merged_into_existing_userdata(users):
+    paginator = JqGridPagination()
+    paginator.userdata = {'note': 'totals'}
+    request = Request(APIRequestFactory().get('/?page=1&rows=2'))
+
+    paginator.paginate_queryset(User.objects.order_by('id'), request, AggregateView())
+
+    assert paginator.userdata['note'] == 'totals'
+    assert paginator.userdata['is_staff_count'] == 5
+
+
+def test_unknown_aggregate_function():
+    with pytest.raises(ValueError):
+        normalize_aggregation_fields({'id': 'median'})
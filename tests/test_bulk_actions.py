@@ -0,0 +1,172 @@
+"""Tests for the bulk update strategies of JqGridBulkActionMixin."""
+
+from django.db.models.signals import post_save
+
+from django_jqgrid.models import GridFilter
+
+
+def test_auto_strategy_issues_single_update(bulk_viewset, make_filters, post_bulk, django_assert_num_queries):
+    ids = make_filters(3)
+    before = GridFilter.objects.get(pk=ids[0]).updated_at
+
+    # SAVEPOINT, UPDATE, RELEASE SAVEPOINT
+    with django_assert_num_queries(3):
+        response = post_bulk(bulk_viewset, {'ids': ids, 'action': {'is_global': True}})
+
+    assert response.status_code == 200
+    assert response.data['results'] == {'updated': 3}
+    assert GridFilter.objects.filter(is_global=True).count() == 3
+    assert GridFilter.objects.get(pk=ids[0]).updated_at > before
+
+
+def test_auto_strategy_saves_rows_with_receivers(bulk_viewset, make_filters, post_bulk):
+    ids = make_filters(3)
+    saved = []
+
+    def receiver(sender, instance, **kwargs):
+        saved.append(instance.pk)
+
+    post_save.connect(receiver, sender=GridFilter)
+    try:
+        assert bulk_viewset().get_bulk_update_strategy(GridFilter) == 'save'
+        response = post_bulk(bulk_viewset, {'ids': ids, 'action': {'key': 'custom'}})
+    finally:
+        post_save.disconnect(receiver, sender=GridFilter)
+
+    assert response.data['results'] == {'updated': 3}
+    assert sorted(saved) == sorted(ids)
+
+
+def test_bulk_update_strategy_is_opt_in(bulk_viewset, make_filters, post_bulk):
+    ids = make_filters(5)
+    saved = []
+
+    def receiver(sender, instance, **kwargs):
+        saved.append(instance.pk)
+
+    class BatchedViewSet(bulk_viewset):
+        bulk_update_strategy = 'bulk_update'
+        bulk_update_batch_size = 2
+
+    post_save.connect(receiver, sender=GridFilter)
+    try:
+        response = post_bulk(BatchedViewSet, {'ids': ids, 'action': {'name': 'renamed'}})
+    finally:
+        post_save.disconnect(receiver, sender=GridFilter)
+
+    assert response.data['results'] == {'updated': 5}
+    assert saved == []
+    assert GridFilter.objects.filter(name='renamed').count() == 5
+
+
+def test_empty_instance_lists_update_nothing(db, bulk_viewset):
+    assert bulk_viewset().process_bulk_update([], {'name': 'renamed'}) == {'updated': 0}
+
+
+def test_missing_rows_return_not_found(db, bulk_viewset, post_bulk):
+    response = post_bulk(bulk_viewset, {'ids': [999], 'action': {'is_global': True}})
+    assert response.status_code == 404
+
+    response = post_bulk(bulk_viewset, {'ids': [999], 'action': {'_delete': True}})
+    assert response.status_code == 404
+
+
+def test_delete_reports_deleted_rows(bulk_viewset, make_filters, post_bulk):
+    ids = make_filters(2)
+
+    response = post_bulk(bulk_viewset, {'ids': ids, 'action': {'_delete': True}})
+
+    assert response.status_code == 200
+    assert response.data['message'] == 'Deleted 2 records.'
+    assert not GridFilter.objects.exists()
+
+
+def test_all_scope_reapplies_grid_filters(bulk_viewset, make_filters, post_bulk):
+    ids = make_filters(4)
+    GridFilter.objects.filter(pk=ids[0]).update(name='other')
+    filters = {'groupOp': 'AND', 'rules': [{'field': 'name', 'op': 'bw', 'data': 'filter'}]}
+
+    class FilteredViewSet(bulk_viewset):
+        allowed_filters = ['name']
+
+    response = post_bulk(FilteredViewSet, {
+        'scope': 'all', 'filters': filters, '_search': True,
+        'excluded_ids': [ids[1]], 'action': {'is_global': True},
+    })
+
+    assert response.status_code == 200
+    assert response.data['results'] == {'updated': 2}
+    assert sorted(GridFilter.objects.filter(is_global=True).values_list('pk', flat=True)) == ids[2:]
+
+
+def test_all_scope_rejects_invalid_filters(bulk_viewset, make_filters, post_bulk):
+    make_filters(1)
+
+    response = post_bulk(bulk_viewset, {'scope': 'all', 'filters': '{not json', 'action': {'_delete': True}})
+
+    assert response.status_code == 400
+    assert GridFilter.objects.count() == 1
+
+
+def test_all_scope_rejects_skipped_filter_rules(bulk_viewset, make_filters, post_bulk):
+    make_filters(3)
+    rules = [
+        {'field': 'nonexistent', 'op': 'eq', 'data': 'x'},
+        {'field': 'key', 'op': 'eq', 'data': 'saved'},
+        {'field': 'name', 'op': 'zz', 'data': 'x'},
+    ]
+
+    class FilteredViewSet(bulk_viewset):
+        allowed_filters = ['name']
+
+    for rule in rules:
+        response = post_bulk(FilteredViewSet, {
+            'scope': 'all', 'filters': {'groupOp': 'AND', 'rules': [rule]}, '_search': True,
+            'action': {'_delete': True},
+        })
+        assert response.status_code == 400
+
+    assert GridFilter.objects.count() == 3
+
+
+def test_all_scope_without_filters_needs_confirmation(bulk_viewset, make_filters, post_bulk):
+    make_filters(3)
+
+    for selection in [{'_search': False, 'filters': '{"rules": [{"field": "name"}]}'}, {'filters': ''},
+                      {'filters': {'groupOp': 'AND', 'rules': []}}]:
+        response = post_bulk(bulk_viewset, {'scope': 'all', 'action': {'_delete': True}, **selection})
+        assert response.status_code == 400
+    assert GridFilter.objects.count() == 3
+
+    response = post_bulk(bulk_viewset, {'scope': 'all', 'confirm_all': True, 'action': {'_delete': True}})
+
+    assert response.status_code == 200
+    assert not GridFilter.objects.exists()
+
+
+def test_id_selections_are_chunked(bulk_viewset, make_filters, post_bulk, django_assert_num_queries):
+    ids = make_filters(5)
+
+    class ChunkedViewSet(bulk_viewset):
+        bulk_id_chunk_size = 2
+
+    # SAVEPOINT, three UPDATEs, RELEASE SAVEPOINT
+    with django_assert_num_queries(5):
+        response = post_bulk(ChunkedViewSet, {'ids': ids, 'action': {'is_global': True}})
+
+    assert response.data['results'] == {'updated': 5}
+    assert GridFilter.objects.filter(is_global=True).count() == 5
+
+
+def test_all_scope_caps_excluded_ids(bulk_viewset, make_filters, post_bulk):
+    ids = make_filters(3)
+
+    class CappedViewSet(bulk_viewset):
+        bulk_max_excluded_ids = 1
+
+    response = post_bulk(CappedViewSet, {
+        'scope': 'all', 'confirm_all': True, 'excluded_ids': ids[:2], 'action': {'_delete': True},
+    })
+
+    assert response.status_code == 400
+    assert GridFilter.objects.count() == 3
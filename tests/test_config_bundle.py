@@ -0,0 +1,96 @@
+"""Tests for the multi-grid config bundle endpoint."""
+
+import threading
+
+import pytest
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.urls import include, path
+from rest_framework import routers, viewsets
+from rest_framework.test import APIClient
+
+from django_jqgrid.cache import invalidate_config_cache
+from django_jqgrid.mixins import JqGridConfigMixin
+from django_jqgrid.models import GridFilter
+from django_jqgrid.serializers import GridFilterSerializer, UserSerializer
+
+
+class GridFilterViewSet(JqGridConfigMixin, viewsets.ModelViewSet):
+    queryset = GridFilter.objects.all()
+    serializer_class = GridFilterSerializer
+    jqgrid_config_cache = True
+
+
+class UserViewSet(JqGridConfigMixin, viewsets.ModelViewSet):
+    queryset = User.objects.all()
+    serializer_class = UserSerializer
+    jqgrid_config_cache = True
+
+
+router = routers.SimpleRouter()
+router.register('django_jqgrid/gridfilter', GridFilterViewSet)
+router.register('auth/user', UserViewSet)
+
+urlpatterns = [
+    path('api/django_jqgrid/', include('django_jqgrid.urls')),
+    path('api/', include(router.urls)),
+]
+
+pytestmark = pytest.mark.urls(__name__)
+
+
+@pytest.fixture
+def client(db):
+    cache.clear()
+    invalidate_config_cache()
+    yield APIClient()
+    invalidate_config_cache()
+
+
+def get_bundle(client, grids, **headers):
+    return client.get('/api/django_jqgrid/config-bundle/', {'grids': grids}, **headers)
+
+
+def test_bundle_returns_configs_and_saved_filters(client):
+    table = ContentType.objects.get_for_model(User)
+    GridFilter.objects.create(name='staff', value='{"rules": []}', table=table, is_global=True)
+
+    response = get_bundle(client, 'django_jqgrid.gridfilter,auth.user,auth.missing')
+
+    assert response.status_code == 200
+    grids = response.data['grids']
+    assert list(grids) == ['django_jqgrid.gridfilter', 'auth.user']
+    assert grids['auth.user']['config'] == UserViewSet().get_jqgrid_config()[0]
+    assert grids['auth.user']['saved_filters']['tmplNames'] == ['staff']
+    assert grids['django_jqgrid.gridfilter']['saved_filters']['tmplNames'] == []
+    assert response.data['missing'] == ['auth.missing']
+
+
+def test_bundle_is_revalidated_with_its_etag(client):
+    first = get_bundle(client, 'auth.user')
+
+    assert get_bundle(client, 'auth.user', HTTP_IF_NONE_MATCH=first['ETag']).status_code == 304
+
+    GridFilter.objects.create(name='new', table=ContentType.objects.get_for_model(User), is_global=True)
+    assert get_bundle(client, 'auth.user', HTTP_IF_NONE_MATCH=first['ETag']).status_code == 200
+
+
+@pytest.mark.parametrize('grids', ['', 'auth', ','.join(f"app.model{i}" for i in range(21))])
+def test_invalid_grid_lists_are_rejected(client, grids):
+    assert get_bundle(client, grids).status_code == 400
+
+
+def test_bundle_configs_are_built_in_the_request_thread(client, monkeypatch):
+    threads = []
+    build = UserViewSet.get_jqgrid_config
+
+    def record(view):
+        threads.append(threading.current_thread())
+        return build(view)
+
+    monkeypatch.setattr(UserViewSet, 'get_jqgrid_config', record)
+    monkeypatch.setattr(GridFilterViewSet, 'get_jqgrid_config', record)
+    get_bundle(client, 'django_jqgrid.gridfilter,auth.user')
+
+    assert threads == [threading.current_thread()] * 2
@@ -0,0 +1,103 @@
+"""Tests for the compiled jqgrid_config cache."""
+
+import pytest
+from rest_framework import viewsets
+from rest_framework.test import APIRequestFactory
+
+from django_jqgrid.cache import get_config_version, invalidate_config_cache
+from django_jqgrid.mixins import JqGridConfigMixin
+from django_jqgrid.models import GridFilter
+from django_jqgrid.serializers import GridFilterSerializer
+from django_jqgrid.templatetags.jqgrid_tags import jqgrid_config_version
+
+
+class GridFilterConfigViewSet(JqGridConfigMixin, viewsets.ModelViewSet):
+    queryset = GridFilter.objects.all()
+    serializer_class = GridFilterSerializer
+    jqgrid_config_cache = True
+    builds = 0
+
+    def build_jqgrid_config(self):
+        type(self).builds += 1
+        return super().build_jqgrid_config()
+
+
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    invalidate_config_cache()
+    GridFilterConfigViewSet.builds = 0
+    yield
+    invalidate_config_cache()
+
+
+def get_config(**headers):
+    view = GridFilterConfigViewSet.as_view({'get': 'jqgrid_config'})
+    request = APIRequestFactory().get('/api/django_jqgrid/gridfilter/jqgrid_config/', **headers)
+    return view(request)
+
+
+def test_config_is_compiled_once():
+    first = get_config()
+    second = get_config()
+
+    assert first.status_code == 200
+    assert second.data == first.data
+    assert GridFilterConfigViewSet.builds == 1
+    assert first['ETag'] == second['ETag']
+
+
+def test_if_none_match_returns_not_modified():
+    etag = get_config()['ETag']
+
+    response = get_config(HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+    assert response['ETag'] == etag
+
+
+def test_config_version_is_announced(settings):
+    settings.JQGRID_PERFORMANCE = {'CONFIG_VERSION': 'deploy-42'}
+
+    response = get_config()
+
+    assert response['X-JqGrid-Config-Version'] == get_config_version()
+    assert get_config_version().endswith(':deploy-42')
+    assert get_config_version() in jqgrid_config_version()
+
+
+def test_invalidation_recompiles_config():
+    get_config()
+    invalidate_config_cache(GridFilterConfigViewSet)
+    get_config()
+
+    assert GridFilterConfigViewSet.builds == 2
+
+
+def test_cache_can_be_disabled(settings):
+    settings.JQGRID_PERFORMANCE = {'ENABLE_CACHING': False}
+
+    get_config()
+    get_config()
+
+    assert GridFilterConfigViewSet.builds == 2
+
+
+def test_cache_is_opt_in(monkeypatch):
+    monkeypatch.setattr(GridFilterConfigViewSet, 'jqgrid_config_cache', JqGridConfigMixin.jqgrid_config_cache)
+
+    get_config()
+    get_config()
+
+    assert GridFilterConfigViewSet.builds == 2
+
+
+def test_shared_backend_serves_other_processes(settings):
+    settings.JQGRID_PERFORMANCE = {'CONFIG_CACHE_BACKEND': 'default'}
+    get_config()
+
+    # Simulate another worker process with an empty local store
+    from django_jqgrid import cache as config_cache
+    config_cache._local_configs.clear()
+    get_config()
+
+    assert GridFilterConfigViewSet.builds == 1
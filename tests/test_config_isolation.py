@@ -0,0 +1,77 @@
+"""Tests that building a grid config never mutates shared class state."""
+
+import copy
+import pickle
+
+import pytest
+from rest_framework import viewsets
+
+from django_jqgrid.mixins import JqGridConfigMixin
+from django_jqgrid.models import GridFilter
+from django_jqgrid.serializers import GridFilterSerializer
+from django_jqgrid.utils import FrozenDict, deep_merge, freeze
+
+
+class IsolatedViewSet(JqGridConfigMixin, viewsets.ModelViewSet):
+    queryset = GridFilter.objects.all()
+    serializer_class = GridFilterSerializer
+    jqgrid_config_cache = False
+    visible_columns = ['name', 'key', 'is_global']
+    bulk_updateable_fields = []
+    import_config = {'formats': ['csv']}
+    method_options_override = {'navGrid': {'options': {'add': True}}}
+
+
+def test_class_defaults_are_not_mutated():
+    defaults = copy.deepcopy(dict(JqGridConfigMixin.DEFAULT_METHOD_OPTIONS))
+
+    IsolatedViewSet().build_jqgrid_config()
+    IsolatedViewSet().build_jqgrid_config()
+
+    assert JqGridConfigMixin.DEFAULT_METHOD_OPTIONS == defaults
+    assert IsolatedViewSet.visible_columns == ['name', 'key', 'is_global']
+    assert IsolatedViewSet.bulk_updateable_fields == []
+    assert IsolatedViewSet.additional_data == {}
+
+
+def test_instances_can_modify_their_defaults():
+    view = IsolatedViewSet()
+    view.additional_data['toolbar'] = {'position': 'top'}
+    view.DEFAULT_GRID_OPTIONS['scrollrows'] = True
+
+    config = view.build_jqgrid_config()
+
+    assert config['toolbar'] == {'position': 'top'}
+    assert config['jqgrid_options']['scrollrows'] is True
+    assert 'toolbar' not in IsolatedViewSet.additional_data
+    assert 'scrollrows' not in JqGridConfigMixin.DEFAULT_GRID_OPTIONS
+    assert isinstance(JqGridConfigMixin.DEFAULT_GRID_OPTIONS['rowList'], list)
+
+
+def test_overrides_are_applied_per_request():
+    config = IsolatedViewSet().build_jqgrid_config()
+
+    nav_options = config['method_options']['navGrid']['options']
+    assert nav_options['add'] is True
+    assert nav_options['edit'] is False
+    assert config['import_config'] == {'formats': ('csv',)}
+
+
+def test_config_output_is_frozen_and_picklable():
+    config = IsolatedViewSet().build_jqgrid_config()
+
+    with pytest.raises(TypeError):
+        config['jqgrid_options']['caption'] = 'Changed'
+
+    restored = pickle.loads(pickle.dumps(config))
+    assert isinstance(restored, FrozenDict)
+    assert restored == config
+
+
+def test_deep_merge_is_copy_on_write():
+    base = freeze({'a': {'b': 1, 'c': 2}, 'd': [1]})
+
+    merged = deep_merge(base, {'a': {'b': 3}})
+
+    assert merged == {'a': {'b': 3, 'c': 2}, 'd': (1,)}
+    assert base['a']['b'] == 1
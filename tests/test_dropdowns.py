@@ -0,0 +1,82 @@
+"""Tests for JqGridDropdownMixin option lists."""
+
+import pytest
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from rest_framework import serializers, viewsets
+from rest_framework.test import APIRequestFactory
+
+from django_jqgrid.mixins import JqGridDropdownMixin
+
+
+class GroupSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Group
+        fields = ['id', 'name']
+
+
+class GroupViewSet(JqGridDropdownMixin, viewsets.ModelViewSet):
+    queryset = Group.objects.all()
+    serializer_class = GroupSerializer
+    dropdown_page_size = 2
+
+
+factory = APIRequestFactory()
+
+
+def dropdown(headers=None, pk=None, **params):
+    request = factory.get('/', params, **(headers or {}))
+    if pk is not None:
+        return GroupViewSet.as_view({'get': 'dropdown_pk'})(request, pk=pk)
+    return GroupViewSet.as_view({'get': 'dropdown'})(request)
+
+
+@pytest.fixture
+def groups(db):
+    cache.clear()
+    return [Group.objects.create(name=name) for name in ['sales', 'support', 'admins', 'staff', 'audit']]
+
+
+def test_search_and_paging(groups):
+    data = dropdown(search='s').data
+    assert [item['text'] for item in data['data']] == ['admins', 'sales']
+    assert data['more'] is True
+
+    data = dropdown(search='s', page=2).data
+    assert [item['text'] for item in data['data']] == ['staff', 'support']
+    assert data['more'] is False
+
+    assert len(dropdown(all='true').data['data']) == 5
+
+
+def test_pages_are_cached_until_the_model_changes(groups, django_assert_num_queries):
+    first = dropdown()
+    with django_assert_num_queries(0):
+        again = dropdown(headers={'HTTP_IF_NONE_MATCH': first['ETag']})
+    assert again.status_code == 304
+
+    Group.objects.filter(name='admins').get().delete()
+    changed = dropdown(headers={'HTTP_IF_NONE_MATCH': first['ETag']})
+    assert changed.status_code == 200
+    assert [item['text'] for item in changed.data['data']] == ['audit', 'sales']
+
+
+def test_selected_value_is_included(groups):
+    support = groups[1]
+
+    data = dropdown(pk=support.pk).data
+
+    assert data['data'][0] == {'id': support.pk, 'text': 'support', 'selected': True}
+    assert len(data['data']) == 3
+
+
+def test_unpaged_lists_report_truncation(groups, monkeypatch):
+    assert dropdown(all='true').data['truncated'] is False
+    assert 'truncated' not in dropdown().data
+
+    cache.clear()
+    monkeypatch.setattr(GroupViewSet, 'dropdown_max_results', 3)
+    data = dropdown(all='true').data
+
+    assert len(data['data']) == 3
+    assert data['truncated'] is True
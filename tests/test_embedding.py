@@ -0,0 +1,71 @@
+"""Tests for embedding grid configs with the {% jqgrid %} template tag."""
+
+import json
+
+import pytest
+from django.urls import include, path
+from rest_framework import permissions, routers, viewsets
+from rest_framework.test import APIRequestFactory
+
+from django_jqgrid.cache import invalidate_config_cache
+from django_jqgrid.embedding import render_json_script
+from django_jqgrid.mixins import JqGridConfigMixin
+from django_jqgrid.models import GridFilter
+from django_jqgrid.serializers import GridFilterSerializer
+from django_jqgrid.templatetags.jqgrid_tags import jqgrid
+
+
+class GridFilterViewSet(JqGridConfigMixin, viewsets.ModelViewSet):
+    queryset = GridFilter.objects.all()
+    serializer_class = GridFilterSerializer
+    jqgrid_config_cache = True
+
+
+class PrivateGridFilterViewSet(GridFilterViewSet):
+    permission_classes = [permissions.IsAuthenticated]
+
+
+router = routers.SimpleRouter()
+router.register('django_jqgrid/gridfilter', GridFilterViewSet)
+router.register('django_jqgrid/private', PrivateGridFilterViewSet, basename='private')
+
+urlpatterns = [path('api/', include(router.urls))]
+
+pytestmark = pytest.mark.urls(__name__)
+
+
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    invalidate_config_cache()
+    yield
+    invalidate_config_cache()
+
+
+def render_tag(model_name, **kwargs):
+    request = APIRequestFactory().get('/dashboard/')
+    return jqgrid({'request': request}, 'grid', 'django_jqgrid', model_name, **kwargs)
+
+
+def test_config_is_embedded_as_json_script():
+    context = render_tag('gridfilter', embed_config=True)
+
+    script = str(context['embedded_config'])
+    assert script.startswith('<script id="grid_config" type="application/json">')
+    config = json.loads(script[script.index('>') + 1:-len('</script>')])
+    assert config == json.loads(json.dumps(GridFilterViewSet().get_jqgrid_config()[0]))
+
+
+def test_config_is_only_embedded_on_request():
+    assert render_tag('gridfilter')['embedded_config'] is None
+    assert render_tag('missing', embed_config=True)['embedded_config'] is None
+
+
+def test_config_is_not_embedded_without_permission():
+    assert render_tag('private', embed_config=True)['embedded_config'] is None
+
+
+def test_json_script_cannot_close_the_script_block():
+    script = str(render_json_script({'caption': '</script><b>&'}, 'grid_config'))
+
+    assert script.count('</script>') == 1
+    assert '\\u003C/script\\u003E\\u003Cb\\u003E\\u0026' in script
@@ -0,0 +1,120 @@
+"""Tests for the streaming JqGridExportMixin."""
+
+import csv
+import datetime
+import io
+import json
+from decimal import Decimal
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.http import StreamingHttpResponse
+from rest_framework import viewsets
+from rest_framework.test import APIRequestFactory
+
+from django_jqgrid.export import ExportColumn, XLSXExportWriter
+from django_jqgrid.mixins import JqGridConfigMixin, JqGridExportMixin
+from django_jqgrid.models import GridFilter
+from django_jqgrid.serializers import GridFilterSerializer
+
+
+class ExportViewSet(JqGridConfigMixin, JqGridExportMixin, viewsets.ModelViewSet):
+    queryset = GridFilter.objects.all()
+    serializer_class = GridFilterSerializer
+    jqgrid_config_cache = False
+    visible_columns = ['name', 'key', 'is_global', 'table_details']
+    allowed_filters = ['name', 'is_global']
+    export_chunk_size = 2
+
+
+factory = APIRequestFactory()
+
+
+@pytest.fixture
+def filters(db):
+    table = ContentType.objects.get_for_model(GridFilter)
+    return [
+        GridFilter.objects.create(name=name, key='tmplFilters', table=table, is_global=is_global)
+        for name, is_global in [('beta', True), ('alpha', False), ('gamma', True)]
+    ]
+
+
+def export(params):
+    request = factory.get('/export_data/', params)
+    response = ExportViewSet.as_view({'get': 'export_data'})(request)
+    assert isinstance(response, StreamingHttpResponse)
+    return response, b''.join(response.streaming_content).decode()
+
+
+def test_csv_export_streams_colmodel_columns(filters):
+    response, content = export({'ext': 'csv', 'sidx': 'name', 'sord': 'asc'})
+
+    rows = list(csv.reader(io.StringIO(content)))
+    # The actions column and the nested serializer field are not exported
+    assert sorted(rows[0]) == ['ID', 'Is Global', 'Key', 'Name']
+    name = rows[0].index('Name')
+    assert [row[name] for row in rows[1:]] == ['alpha', 'beta', 'gamma']
+    assert response['Content-Disposition'] == 'attachment; filename="gridfilter.csv"'
+
+
+def test_json_export_honors_filters_and_columns(filters):
+    grid_filters = json.dumps({
+        'groupOp': 'AND',
+        'rules': [{'field': 'is_global', 'op': 'eq', 'data': 'true'}],
+    })
+    _, content = export({
+        'ext': 'json', '_search': 'true', 'filters': grid_filters,
+        'columns': 'name', 'sidx': 'name', 'sord': 'desc',
+    })
+
+    assert json.loads(content) == [{'name': 'gamma'}, {'name': 'beta'}]
+
+
+def test_export_reads_rows_with_values_list(filters, django_assert_num_queries):
+    request = factory.get('/export_data/', {'ext': 'json'})
+    response = ExportViewSet.as_view({'get': 'export_data'})(request)
+
+    # Rows are only fetched while the response is consumed
+    with django_assert_num_queries(1):
+        assert len(json.loads(b''.join(response.streaming_content))) == 3
+
+
+def test_unsupported_format(filters):
+    request = factory.get('/export_data/', {'ext': 'pdf'})
+    response = ExportViewSet.as_view({'get': 'export_data'})(request)
+
+    assert response.status_code == 400
+
+
+def test_xlsx_export_keeps_native_types(filters):
+    openpyxl = pytest.importorskip('openpyxl')
+
+    class TypedExportViewSet(ExportViewSet):
+        visible_columns = ['name', 'is_global', 'created_at']
+
+    request = factory.get('/export_data/', {'ext': 'xlsx', 'sidx': 'name'})
+    response = TypedExportViewSet.as_view({'get': 'export_data'})(request)
+    workbook = openpyxl.load_workbook(io.BytesIO(b''.join(response.streaming_content)))
+
+    rows = list(workbook.active.values)
+    header = rows[0]
+    first = dict(zip(header, rows[1]))
+    assert first['Name'] == 'alpha'
+    assert first['Is Global'] is False
+    assert isinstance(first['Created At'], datetime.datetime)
+
+
+def test_xlsx_decimal_columns_use_colmodel_decimal_places():
+    pytest.importorskip('openpyxl')
+    from openpyxl import Workbook
+
+    writer = XLSXExportWriter()
+    sheet = Workbook(write_only=True).create_sheet()
+    column = ExportColumn('price', 'Price', 'price', models.DecimalField(max_digits=8, decimal_places=2),
+                          {'formatoptions': {'decimalPlaces': 3}})
+
+    cell = writer.get_converter(sheet, column)(Decimal('1.5'))
+
+    assert cell.value == Decimal('1.5')
+    assert cell.number_format == '0.000'
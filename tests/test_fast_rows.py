@@ -0,0 +1,124 @@
+"""Tests for the values()-based fast row path of JqGridConfigMixin.list()."""
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from rest_framework import serializers, viewsets
+from rest_framework.test import APIRequestFactory
+
+from django_jqgrid import mixins
+from django_jqgrid.fastrows import build_fast_renderer
+from django_jqgrid.filters import LRUCache
+from django_jqgrid.mixins import JqGridConfigMixin
+from django_jqgrid.models import GridFilter
+from django_jqgrid.pagination import JqGridKeysetPagination, JqGridPagination
+from django_jqgrid.serializers import GridFilterSerializer
+
+User = get_user_model()
+
+
+class FlatFilterSerializer(serializers.ModelSerializer):
+    key = serializers.ChoiceField(choices=[('tmplFilters', 'Template'), ('saved', 'Saved')])
+    price = serializers.DecimalField(source='id', max_digits=8, decimal_places=2, read_only=True)
+    table_model = serializers.CharField(source='table.model', read_only=True)
+    owner = serializers.SlugRelatedField(source='created_by', slug_field='username', read_only=True)
+    owner_email = serializers.EmailField(source='created_by.email', read_only=True)
+    updated_on = serializers.DateTimeField(source='updated_at', format='%Y-%m-%d', read_only=True)
+
+    class Meta:
+        model = GridFilter
+        fields = [
+            'id', 'name', 'key', 'value', 'table', 'table_model', 'created_by', 'owner',
+            'owner_email', 'is_global', 'price', 'created_at', 'updated_on'
+        ]
+
+
+class FastFilterViewSet(JqGridConfigMixin, viewsets.ModelViewSet):
+    queryset = GridFilter.objects.order_by('id')
+    serializer_class = FlatFilterSerializer
+    pagination_class = JqGridPagination
+    jqgrid_fast_rows = True
+    jqgrid_config_cache = False
+
+
+factory = APIRequestFactory()
+
+
+@pytest.fixture
+def filters(db):
+    cache.clear()
+    owner = User.objects.create(username='owner', email='owner@example.com')
+    table = ContentType.objects.get_for_model(GridFilter)
+    return [
+        GridFilter.objects.create(name='mine', key='saved', table=table, created_by=owner,
+                                  value={'rules': [1, 2]}),
+        GridFilter.objects.create(name='global', table=table, is_global=True),
+    ]
+
+
+def test_fast_rows_match_serializer_output(filters):
+    request = factory.get('/', {'rows': 10})
+    response = FastFilterViewSet.as_view({'get': 'list'})(request)
+
+    expected = FlatFilterSerializer(GridFilter.objects.order_by('id'), many=True).data
+    assert response.data['data'] == [dict(row) for row in expected]
+    # The serializer omits fields read through a missing related row
+    assert 'owner_email' not in response.data['data'][1]
+
+
+def test_fast_rows_do_not_build_model_instances(filters, django_assert_num_queries):
+    request = factory.get('/', {'rows': 10, 'columns': 'name,owner'})
+    # COUNT and one values() query
+    with django_assert_num_queries(2):
+        response = FastFilterViewSet.as_view({'get': 'list'})(request)
+
+    assert response.data['data'] == [
+        {'id': filters[0].pk, 'name': 'mine', 'owner': 'owner'},
+        {'id': filters[1].pk, 'name': 'global', 'owner': None},
+    ]
+
+
+def test_nested_serializers_fall_back_to_the_serializer(filters):
+    class NestedViewSet(FastFilterViewSet):
+        serializer_class = GridFilterSerializer
+
+    renderer = build_fast_renderer(GridFilter, GridFilterSerializer())
+    assert [note.split(':')[0] for note in renderer.unsupported] == ['table_details', 'created_by_details']
+
+    request = factory.get('/', {'rows': 10})
+    response = NestedViewSet.as_view({'get': 'list'})(request)
+    assert response.data['data'][0]['created_by_details']['username'] == 'owner'
+
+
+def test_renderers_are_kept_in_a_bounded_cache(filters, monkeypatch):
+    monkeypatch.setattr(mixins, 'fast_renderers', LRUCache(maxsize=2))
+    view = FastFilterViewSet.as_view({'get': 'list'})
+
+    for columns in ['name', 'key', 'name,key']:
+        view(factory.get('/', {'columns': columns}))
+
+    assert len(mixins.fast_renderers) == 2
+
+
+class KeysetFilterViewSet(FastFilterViewSet):
+    pagination_class = JqGridKeysetPagination
+
+
+def test_fast_rows_carry_the_keyset_cursor_fields(filters):
+    table = ContentType.objects.get_for_model(GridFilter)
+    for name, key in [('third', 'saved'), ('fourth', 'tmplFilters')]:
+        GridFilter.objects.create(name=name, key=key, table=table)
+    view = KeysetFilterViewSet.as_view({'get': 'list'})
+
+    names = []
+    query = {'rows': 1, 'sidx': 'key', 'columns': 'name'}
+    while True:
+        data = view(factory.get('/', query)).data
+        assert all(set(row) == {'id', 'name'} for row in data['data'])
+        names.extend(row['name'] for row in data['data'])
+        if not data['next_cursor']:
+            break
+        query['cursor'] = data['next_cursor']
+
+    assert names == list(GridFilter.objects.order_by('key', 'id').values_list('name', flat=True))
@@ -0,0 +1,75 @@
+"""Tests for JqGridFilterBackend compiled filter plans."""
+
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from django_jqgrid.filters import JqGridFilterBackend
+
+User = get_user_model()
+
+
+class UserView:
+    allowed_filters = ['username', 'id', 'is_staff']
+    filter_mappings = {}
+
+
+def run_filter(filters, backend_class=JqGridFilterBackend):
+    request = Request(APIRequestFactory().get('/', {'_search': 'true', 'filters': json.dumps(filters)}))
+    queryset = backend_class().filter_queryset(request, User.objects.order_by('id'), UserView())
+    return list(queryset.values_list('username', flat=True))
+
+
+@pytest.fixture
+def users(db):
+    JqGridFilterBackend.clear_caches()
+    return [
+        User.objects.create(username='alice', is_staff=True),
+        User.objects.create(username='bob'),
+        User.objects.create(username='carol'),
+    ]
+
+
+def test_rules_and_nested_groups(users):
+    filters = {
+        'groupOp': 'OR',
+        'rules': [{'field': 'username', 'op': 'eq', 'data': 'bob'}],
+        'groups': [{'groupOp': 'AND', 'rules': [{'field': 'is_staff', 'op': 'eq', 'data': 'true'}]}],
+    }
+
+    assert run_filter(filters) == ['alice', 'bob']
+
+
+def test_values_are_cast_and_negated(users):
+    ids = f"{users[0].pk},{users[1].pk}"
+    filters = {'groupOp': 'AND', 'rules': [{'field': 'id', 'op': 'ni', 'data': ids}]}
+
+    assert run_filter(filters) == ['carol']
+
+
+def test_disallowed_fields_are_ignored(users):
+    filters = {'groupOp': 'AND', 'rules': [{'field': 'password', 'op': 'cn', 'data': 'x'}]}
+
+    assert run_filter(filters) == ['alice', 'bob', 'carol']
+
+
+def test_filter_translation_is_memoized(users):
+    filters = {'groupOp': 'AND', 'rules': [{'field': 'username', 'op': 'bw', 'data': 'c'}]}
+
+    assert run_filter(filters) == ['carol']
+    cached = len(JqGridFilterBackend.get_query_cache())
+    assert run_filter(filters) == ['carol']
+    assert len(JqGridFilterBackend.get_query_cache()) == cached == 1
+
+
+def test_custom_cast_value_is_honoured(users):
+    class UpperCaseBackend(JqGridFilterBackend):
+        def cast_value(self, field, value):
+            return super().cast_value(field, value).lower()
+
+    filters = {'groupOp': 'AND', 'rules': [{'field': 'username', 'op': 'eq', 'data': 'BOB'}]}
+
+    assert run_filter(filters, UpperCaseBackend) == ['bob']
@@ -0,0 +1,92 @@
+"""Tests for server-side grouping in JqGridConfigMixin.list()."""
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from rest_framework import viewsets
+from rest_framework.test import APIRequestFactory
+
+from django_jqgrid.mixins import JqGridConfigMixin
+from django_jqgrid.models import GridFilter
+from django_jqgrid.pagination import JqGridPagination
+from django_jqgrid.serializers import GridFilterSerializer
+
+
+class GroupedViewSet(JqGridConfigMixin, viewsets.ModelViewSet):
+    queryset = GridFilter.objects.order_by('id')
+    serializer_class = GridFilterSerializer
+    pagination_class = JqGridPagination
+    groupable_fields = ['key', 'is_global', 'table']
+    aggregation_fields = {'id': ['count', 'max']}
+
+
+factory = APIRequestFactory()
+
+
+def list_rows(**params):
+    request = factory.get('/', params)
+    return GroupedViewSet.as_view({'get': 'list'})(request)
+
+
+@pytest.fixture
+def filters(db):
+    cache.clear()
+    table = ContentType.objects.get_for_model(GridFilter)
+    return [
+        GridFilter.objects.create(name=f"filter {i}", key=key, table=table, is_global=i == 0)
+        for i, key in enumerate(['a', 'b', 'b', 'c', 'c', 'c'])
+    ]
+
+
+def test_group_headers_come_from_one_grouped_query(filters, django_assert_num_queries):
+    # Grouped headers and the overall footer aggregate
+    with django_assert_num_queries(2):
+        response = list_rows(group_by='key', sord='desc')
+
+    headers = response.data['data']
+    assert [(header['value'], header['count']) for header in headers] == [('c', 3), ('b', 2), ('a', 1)]
+    assert headers[0]['summary']['id_max'] == filters[-1].pk
+    assert response.data['userdata']['id_count'] == 6
+    assert response.data['records'] == 3
+
+
+def test_foreign_key_groups_have_labels(filters):
+    response = list_rows(group_by='table')
+
+    header = response.data['data'][0]
+    assert header['count'] == 6
+    assert header['label'] == str(ContentType.objects.get_for_model(GridFilter))
+
+
+def test_group_rows_are_loaded_per_group(filters):
+    response = list_rows(group_by='is_global', group_value='true')
+
+    assert response.data['records'] == 1
+    assert response.data['data'][0]['name'] == 'filter 0'
+
+    response = list_rows(group_by='key', group_value='c', rows=2)
+    assert response.data['records'] == 3
+    assert len(response.data['data']) == 2
+
+
+def test_group_by_requires_groupable_field(filters):
+    response = list_rows(group_by='name')
+
+    assert response.status_code == 400
+
+
+def test_plain_list_is_unchanged(filters):
+    response = list_rows()
+
+    assert response.data['records'] == 6
+
+
+def test_config_announces_server_grouping():
+    config, _ = GroupedViewSet().get_jqgrid_config()
+
+    assert config['server_grouping'] == {
+        'fields': ('key', 'is_global', 'table'),
+        'group_by_param': 'group_by',
+        'group_value_param': 'group_value',
+        'null_value': '__null__',
+    }
@@ -0,0 +1,98 @@
+"""Tests for the batched JqGridImportMixin."""
+
+import json
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.files.uploadedfile import SimpleUploadedFile
+from rest_framework import viewsets
+from rest_framework.test import APIRequestFactory
+
+from django_jqgrid.mixins import JqGridImportMixin
+from django_jqgrid.models import GridFilter
+from django_jqgrid.serializers import GridFilterSerializer
+
+
+class ImportViewSet(JqGridImportMixin, viewsets.ModelViewSet):
+    queryset = GridFilter.objects.all()
+    serializer_class = GridFilterSerializer
+    import_lookup_fields = {'table': 'model'}
+    import_batch_size = 4
+
+
+factory = APIRequestFactory()
+
+
+def post_import(content, name='filters.csv', **data):
+    upload = SimpleUploadedFile(name, content.encode('utf-8'), content_type='text/csv')
+    payload = {'import_file': upload}
+    payload.update({key: json.dumps(value) for key, value in data.items()})
+    request = factory.post('/import_data/', payload, format='multipart')
+    return ImportViewSet.as_view({'post': 'import_data'})(request)
+
+
+def test_import_batches_rows_and_resolves_foreign_keys(db, django_assert_max_num_queries):
+    lines = ['Title,Table'] + [f'filter {i},gridfilter' for i in range(10)]
+
+    # Per batch of 4 rows: one foreign key lookup and one INSERT (plus savepoints)
+    with django_assert_max_num_queries(12):
+        response = post_import(
+            '\n'.join(lines),
+            mapped_columns={'name': 'Title', 'table': 'Table'},
+            default_values={'key': 'imported'},
+        )
+
+    assert response.status_code == 200
+    assert response.data['imported_count'] == 10
+    assert response.data['errors'] == []
+    table = ContentType.objects.get_for_model(GridFilter)
+    assert GridFilter.objects.filter(table=table, key='imported').count() == 10
+
+
+def test_invalid_rows_are_reported_without_aborting(db):
+    content = '\n'.join([
+        'name,table',
+        'good,gridfilter',
+        ',gridfilter',
+        'bad table,missing',
+        'also good,gridfilter',
+    ])
+
+    response = post_import(content)
+
+    assert response.data['imported_count'] == 2
+    assert response.data['error_count'] == 2
+    assert [error['row'] for error in response.data['errors']] == [3, 4]
+    assert 'name' in response.data['errors'][0]['errors']
+    assert 'table' in response.data['errors'][1]['errors']
+    assert sorted(GridFilter.objects.values_list('name', flat=True)) == ['also good', 'good']
+
+
+def test_unsupported_file_type(db):
+    response = post_import('name\nx', name='filters.txt')
+
+    assert response.status_code == 400
+    assert response.data['message'] == 'Unsupported import format: txt'
+
+
+class PkImportViewSet(ImportViewSet):
+    import_lookup_fields = {}
+
+    def get_serializer(self, *args, **kwargs):
+        self.serializer_calls.append(kwargs)
+        return super().get_serializer(*args, **kwargs)
+
+
+def test_batch_is_validated_with_one_serializer(db):
+    table = ContentType.objects.get_for_model(GridFilter)
+    view = PkImportViewSet(request=None, format_kwarg=None, serializer_calls=[])
+    # XLSX cells hold numbers as floats
+    batch = [
+        (2, {'name': 'xlsx', 'table': float(table.pk)}),
+        (3, {'name': '', 'table': table.pk}),
+    ]
+
+    instances, errors = view.validate_import_batch(GridFilter, batch)
+
+    assert [kwargs['many'] for kwargs in view.serializer_calls] == [True]
+    assert [(row, instance.table) for row, instance in instances] == [(2, table)]
+    assert [error['row'] for error in errors] == [3]
@@ -0,0 +1,85 @@
+"""Tests for the per-model cache generations of django_jqgrid.invalidation."""
+
+import pytest
+from django.contrib.auth.models import Group, Permission, User
+from django.core.cache import cache
+from django.db.models.signals import post_save, pre_save
+
+from django_jqgrid.aggregates import compute_aggregates
+from django_jqgrid.invalidation import (
+    get_generation, get_queryset_generation, has_other_listeners, is_registered, register_model,
+)
+from django_jqgrid.models import GridFilter
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
+def test_save_and_delete_bump_the_generation(db):
+    register_model(Group)
+    before = get_generation(Group)
+
+    group = Group.objects.create(name='sales')
+    created = get_generation(Group)
+    group.delete()
+
+    assert before != created != get_generation(Group)
+
+
+def test_aggregates_are_recomputed_after_a_save(db, django_assert_num_queries):
+    User.objects.create(username='first')
+    fields = {'id': 'count'}
+
+    assert compute_aggregates(User.objects.all(), fields)['id'] == 1
+    with django_assert_num_queries(0):
+        compute_aggregates(User.objects.all(), fields)
+
+    User.objects.create(username='second')
+    assert compute_aggregates(User.objects.all(), fields)['id'] == 2
+
+
+def test_joined_and_m2m_models_are_tracked(db):
+    register_model(Group)
+    group = Group.objects.create(name='sales')
+    queryset = User.objects.filter(groups__name='sales')
+    before = get_queryset_generation(queryset)
+
+    user = User.objects.create(username='member')
+    user.groups.add(group)
+    after_add = get_queryset_generation(queryset)
+    group.permissions.add(Permission.objects.first())
+
+    assert is_registered(User)
+    assert before != after_add
+    assert get_generation(Permission) != '0'
+
+
+def test_bulk_actions_bump_the_generation(bulk_viewset, make_filters, post_bulk):
+    ids = make_filters(2)
+    register_model(GridFilter)
+    before = get_generation(GridFilter)
+
+    response = post_bulk(bulk_viewset, {'ids': ids, 'action': {'is_global': True}})
+
+    assert response.status_code == 200
+    assert get_generation(GridFilter) != before
+
+
+def test_other_listeners_ignore_the_invalidation_handlers(db):
+    register_model(Group)
+
+    def receiver(sender, **kwargs):
+        pass
+
+    assert not has_other_listeners(post_save, Group)
+    assert not has_other_listeners(pre_save, Group)
+
+    for sender in (Group, None):
+        post_save.connect(receiver, sender=sender)
+        try:
+            assert has_other_listeners(post_save, Group)
+        finally:
+            post_save.disconnect(receiver, sender=sender)
+    assert not has_other_listeners(post_save, Group)
@@ -0,0 +1,88 @@
+"""Tests for background import/export jobs."""
+
+import csv
+import io
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.core.files.uploadedfile import SimpleUploadedFile
+from rest_framework import viewsets
+from rest_framework.test import APIRequestFactory
+
+from django_jqgrid import jobs
+from django_jqgrid.mixins import JqGridConfigMixin, JqGridExportMixin, JqGridImportMixin
+from django_jqgrid.models import GridFilter
+from django_jqgrid.serializers import GridFilterSerializer
+
+
+class JobViewSet(JqGridConfigMixin, JqGridExportMixin, JqGridImportMixin, viewsets.ModelViewSet):
+    queryset = GridFilter.objects.all()
+    serializer_class = GridFilterSerializer
+    jqgrid_config_cache = False
+    visible_columns = ['name', 'key']
+    import_lookup_fields = {'table': 'model'}
+
+
+factory = APIRequestFactory()
+
+
+@pytest.fixture(autouse=True)
+def local_runner(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.JQGRID_PERFORMANCE = {'JOB_RUNNER': 'django_jqgrid.jobs.LocalJobRunner'}
+
+
+def job_status(job_id, **params):
+    request = factory.get(f'/api/filters/jobs/{job_id}/', params)
+    return JobViewSet.as_view({'get': 'job_status'})(request, job_id=job_id)
+
+
+def test_export_job_stores_result_file(db):
+    table = ContentType.objects.get_for_model(GridFilter)
+    for name in ['b', 'a']:
+        GridFilter.objects.create(name=name, table=table)
+
+    request = factory.get('/api/filters/export_data/', {'ext': 'csv', 'sidx': 'name', 'async': 'true'})
+    response = JobViewSet.as_view({'get': 'export_data'})(request)
+
+    assert response.status_code == 202
+    job_id = response.data['job_id']
+    assert response.data['status_url'].endswith(f'/api/filters/jobs/{job_id}/')
+
+    status = job_status(job_id)
+    assert status.data['state'] == jobs.DONE
+    assert status.data['processed'] == 2
+    assert 'download_url' in status.data
+
+    download = job_status(job_id, download='1')
+    rows = list(csv.reader(io.StringIO(b''.join(download.streaming_content).decode())))
+    assert [row[rows[0].index('Name')] for row in rows[1:]] == ['a', 'b']
+
+
+def test_import_job_reports_progress_and_errors(db):
+    upload = SimpleUploadedFile('filters.csv', b'name,table\nok,gridfilter\nbad,missing\n')
+    request = factory.post('/api/filters/import_data/', {'import_file': upload, 'async': 'true'},
+                           format='multipart')
+    response = JobViewSet.as_view({'post': 'import_data'})(request)
+
+    assert response.status_code == 202
+    status = job_status(response.data['job_id'])
+    assert status.data['state'] == jobs.DONE
+    assert status.data['processed'] == 2
+    assert status.data['error_count'] == 1
+    assert status.data['result']['imported_count'] == 1
+    assert GridFilter.objects.get().name == 'ok'
+
+
+def test_failed_job_is_recorded(db):
+    job = jobs.create_job('export', JobViewSet)
+    jobs.enqueue_job(job, 'django_jqgrid.jobs.run_export_job', {
+        'view_path': job['view'], 'query_string': '', 'ext': 'missing',
+    })
+
+    status = job_status(job['id'])
+    assert status.data['state'] == jobs.FAILED
+
+
+def test_unknown_job(db):
+    assert job_status('0' * 32).status_code == 404
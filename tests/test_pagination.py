@@ -0,0 +1,190 @@
+"""Tests for JqGridPagination count strategies and row formats."""
+
+import base64
+import datetime
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.utils import timezone
+from rest_framework import viewsets
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from django_jqgrid.mixins import JqGridConfigMixin
+from django_jqgrid.models import GridFilter
+from django_jqgrid.pagination import CappedCount, EstimatedCount, JqGridKeysetPagination, JqGridPagination
+from django_jqgrid.serializers import GridFilterSerializer
+
+User = get_user_model()
+
+
+class DummyView:
+    def __init__(self, strategy=None):
+        self.jqgrid_count_strategy = strategy
+
+
+class CellsViewSet(JqGridConfigMixin, viewsets.ModelViewSet):
+    queryset = GridFilter.objects.order_by('id')
+    serializer_class = GridFilterSerializer
+    pagination_class = JqGridPagination
+    visible_columns = ['name', 'is_global']
+    jqgrid_row_format = 'cells'
+
+
+def paginate(view, query='?page=1&rows=2'):
+    paginator = JqGridPagination()
+    request = Request(APIRequestFactory().get('/' + query))
+    rows = paginator.paginate_queryset(User.objects.order_by('id'), request, view)
+    return paginator, paginator.get_paginated_response([row.pk for row in rows]).data
+
+
+@pytest.fixture
+def users(db):
+    return [User.objects.create(username=f"user{i}") for i in range(5)]
+
+
+def test_exact_count_is_default(users):
+    _, data = paginate(DummyView())
+
+    assert data['records'] == 5
+    assert data['total_pages'] == 3
+
+
+def test_capped_count_reports_plus(users):
+    _, data = paginate(DummyView(CappedCount(cap=3)))
+
+    assert data['records'] == '3+'
+    assert len(data['data']) == 2
+
+
+def test_capped_count_serves_pages_past_the_cap(users):
+    _, data = paginate(DummyView(CappedCount(cap=2)), '?page=3&rows=2')
+
+    assert data['records'] == '2+'
+    assert data['page'] == 3
+    assert data['total_pages'] == 3
+    assert len(data['data']) == 1
+
+    with pytest.raises(NotFound):
+        paginate(DummyView(CappedCount(cap=2)), '?page=4&rows=2')
+
+
+def test_capped_count_below_cap_is_exact(users):
+    _, data = paginate(DummyView(CappedCount(cap=10)))
+
+    assert data['records'] == 5
+
+
+def test_cached_count_reuses_value_until_the_model_changes(users):
+    _, first = paginate(DummyView('cached'))
+    # bulk_create() sends no signals, so the cached count is served
+    User.objects.bulk_create([User(username='bulk')])
+    _, second = paginate(DummyView('cached'))
+    User.objects.create(username='late')
+    _, third = paginate(DummyView('cached'))
+
+    assert first['records'] == second['records'] == 5
+    assert third['records'] == 7
+
+
+def test_estimate_falls_back_to_exact_off_postgresql(users):
+    _, data = paginate(DummyView(EstimatedCount(threshold=0)))
+
+    assert data['records'] == 5
+
+
+def test_unknown_strategy_name_is_rejected():
+    with pytest.raises(ValueError):
+        JqGridPagination().get_count_strategy(DummyView('bogus'))
+
+
+class KeysetView:
+    key_field = 'id'
+    jqgrid_count_strategy = None
+
+
+def keyset_page(query):
+    paginator = JqGridKeysetPagination()
+    request = Request(APIRequestFactory().get('/' + query))
+    rows = paginator.paginate_queryset(User.objects.all(), request, KeysetView())
+    return paginator.get_paginated_response([row.username for row in rows]).data
+
+
+def test_keyset_pagination_walks_cursor_in_sort_order(db):
+    for name in ['b', 'a', 'd', 'c', 'a2']:
+        User.objects.create(username=name)
+
+    seen = []
+    data = keyset_page('?rows=2&sidx=username&sord=desc')
+    seen.extend(data['data'])
+    while data['next_cursor']:
+        data = keyset_page(f"?rows=2&sidx=username&sord=desc&cursor={data['next_cursor']}")
+        seen.extend(data['data'])
+
+    assert seen == ['d', 'c', 'b', 'a2', 'a']
+    assert data['page'] == 3
+    assert data['total_pages'] == 3
+    assert data['records'] == 5
+
+
+def test_keyset_pagination_without_cursor_uses_offset(db):
+    for name in ['a', 'b', 'c']:
+        User.objects.create(username=name)
+
+    data = keyset_page('?rows=2&page=2&sidx=username')
+
+    assert data['data'] == ['c']
+    assert data['next_cursor'] is None
+
+
+@pytest.mark.parametrize('sord, expected', [
+    ('asc', ['b', 'd', 'a', 'c', 'e']),
+    ('desc', ['a', 'c', 'e', 'd', 'b']),
+])
+def test_keyset_pagination_keeps_rows_with_null_sort_keys(db, sord, expected):
+    now = timezone.now()
+    for name, days in [('a', None), ('b', 1), ('c', None), ('d', 2), ('e', None)]:
+        User.objects.create(username=name, last_login=now + datetime.timedelta(days=days) if days else None)
+
+    seen = []
+    data = keyset_page(f'?rows=2&sidx=last_login&sord={sord}')
+    seen.extend(data['data'])
+    while data['next_cursor']:
+        data = keyset_page(f"?rows=2&sidx=last_login&sord={sord}&cursor={data['next_cursor']}")
+        seen.extend(data['data'])
+
+    assert seen == expected
+
+
+@pytest.mark.parametrize('payload', [
+    [1, 2], 5, {'p': 2}, {'v': 3, 'p': 2}, {'v': {'0': 1}, 'p': 2}, {'v': [[1], 2], 'p': 2},
+    {'v': ['a', 1], 'p': 'x'}, {'v': ['a', 1], 'p': 0},
+])
+def test_keyset_pagination_rejects_malformed_cursors(db, payload):
+    cursor = base64.urlsafe_b64encode(json.dumps(payload).encode('utf-8')).decode('ascii')
+
+    with pytest.raises(NotFound):
+        keyset_page(f'?rows=2&sidx=username&cursor={cursor}')
+
+
+def test_cells_row_format_sends_arrays_in_colmodel_order(db):
+    table = ContentType.objects.get_for_model(GridFilter)
+    row = GridFilter.objects.create(name='compact', table=table, is_global=True)
+
+    response = CellsViewSet.as_view({'get': 'list'})(APIRequestFactory().get('/'))
+
+    assert response.data['columns'] == ['actions', 'name', 'id', 'is_global']
+    assert response.data['data'] == [[None, 'compact', row.pk, True]]
+
+
+def test_cells_row_format_switches_json_reader(db):
+    view = CellsViewSet()
+    config, _ = view.get_jqgrid_config()
+
+    reader = config['jqgrid_options']['jsonReader']
+    assert reader['repeatitems'] is True
+    assert reader['cell'] == ''
+    assert reader['id'] == '2'
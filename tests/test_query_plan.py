@@ -0,0 +1,124 @@
+"""Tests for select_related/prefetch_related planning from the grid serializer."""
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import serializers, viewsets
+from rest_framework.test import APIRequestFactory
+
+from django_jqgrid import mixins
+from django_jqgrid.filters import LRUCache
+from django_jqgrid.mixins import JqGridConfigMixin
+from django_jqgrid.models import GridFilter
+from django_jqgrid.pagination import JqGridPagination
+from django_jqgrid.queryplan import build_query_plan
+from django_jqgrid.serializers import GridFilterSerializer
+
+User = get_user_model()
+
+
+class GroupSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Group
+        fields = ['id', 'name']
+
+
+class UserWithGroupsSerializer(serializers.ModelSerializer):
+    groups = GroupSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = User
+        fields = ['id', 'username', 'groups', 'user_permissions']
+
+
+class FilterViewSet(JqGridConfigMixin, viewsets.ModelViewSet):
+    queryset = GridFilter.objects.order_by('id')
+    serializer_class = GridFilterSerializer
+    pagination_class = JqGridPagination
+
+
+class UnplannedViewSet(FilterViewSet):
+    jqgrid_query_plan = False
+
+
+factory = APIRequestFactory()
+
+
+def test_nested_foreign_keys_are_select_related():
+    plan = build_query_plan(GridFilter, GridFilterSerializer())
+
+    assert plan.select_related == {'table', 'created_by'}
+    assert not plan.prefetches
+
+
+def test_many_relations_are_prefetched_with_needed_columns():
+    plan = build_query_plan(User, UserWithGroupsSerializer())
+
+    assert plan.prefetches['groups'].only == {'id', 'name'}
+    assert plan.prefetches['user_permissions'].only == {'id'}
+    assert 'groups' in plan.report()
+
+
+def test_list_page_renders_without_per_row_queries(db, settings, django_assert_num_queries):
+    settings.DEBUG = True
+    user = User.objects.create(username='owner')
+    table = ContentType.objects.get_for_model(GridFilter)
+    for i in range(5):
+        GridFilter.objects.create(name=f"filter {i}", table=table, created_by=user)
+
+    request = factory.get('/', {'rows': 5})
+    # COUNT and one page query joining table and created_by
+    with django_assert_num_queries(2):
+        response = FilterViewSet.as_view({'get': 'list'})(request)
+        response.render()
+
+    assert response.data['data'][0]['created_by_details']['username'] == 'owner'
+    assert response['X-JqGrid-Query-Plan'] == 'select_related(created_by, table)'
+
+
+def test_plan_can_be_disabled(db, settings):
+    settings.DEBUG = True
+
+    request = factory.get('/')
+    response = UnplannedViewSet.as_view({'get': 'list'})(request)
+
+    assert 'X-JqGrid-Query-Plan' not in response
+
+
+def test_columns_parameter_projects_serializer_and_query(db):
+    table = ContentType.objects.get_for_model(GridFilter)
+    GridFilter.objects.create(name='wide', table=table, value={'rules': ['x'] * 100})
+
+    request = factory.get('/', {'columns': 'name,created_by_details'})
+    view = FilterViewSet.as_view({'get': 'list'})
+
+    with CaptureQueriesContext(connection) as queries:
+        response = view(request)
+
+    assert list(response.data['data'][0]) == ['id', 'name', 'created_by_details']
+    page_sql = queries.captured_queries[-1]['sql']
+    assert '"value"' not in page_sql
+    assert '"created_by_id"' in page_sql
+
+
+def test_columns_are_projected_without_the_query_plan(db):
+    table = ContentType.objects.get_for_model(GridFilter)
+    GridFilter.objects.create(name='wide', table=table, value={'rules': ['x'] * 100})
+
+    with CaptureQueriesContext(connection) as queries:
+        response = UnplannedViewSet.as_view({'get': 'list'})(factory.get('/', {'columns': 'name'}))
+
+    assert list(response.data['data'][0]) == ['id', 'name']
+    assert '"value"' not in queries.captured_queries[-1]['sql']
+
+
+def test_plans_are_kept_in_a_bounded_cache(db, monkeypatch):
+    monkeypatch.setattr(mixins, 'query_plans', LRUCache(maxsize=2))
+    view = FilterViewSet.as_view({'get': 'list'})
+
+    for columns in ['name', 'key', 'name,key']:
+        view(factory.get('/', {'columns': columns}))
+
+    assert len(mixins.query_plans) == 2
@@ -0,0 +1,58 @@
+"""Tests for JqGridJSONRenderer and its automatic registration."""
+
+import datetime
+import decimal
+import json
+import uuid
+
+import pytest
+from django.utils.translation import gettext_lazy
+from rest_framework import viewsets
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.renderers import JSONRenderer
+
+from django_jqgrid.mixins import JqGridConfigMixin
+from django_jqgrid.models import GridFilter
+from django_jqgrid.pagination import JqGridPagination
+from django_jqgrid.renderers import JqGridJSONRenderer, get_json_backend
+from django_jqgrid.serializers import GridFilterSerializer
+
+DATA = {
+    'price': decimal.Decimal('9.50'),
+    'created': datetime.datetime(2024, 5, 1, 12, 30, tzinfo=datetime.timezone.utc),
+    'day': datetime.date(2024, 5, 1),
+    'token': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+    'label': gettext_lazy('Name'),
+    'rows': ({'id': 1, 'note': 'line\u2028break'},),
+}
+
+
+@pytest.mark.parametrize('backend', ['orjson', 'ujson'])
+def test_fast_backends_match_drf_output(settings, backend):
+    pytest.importorskip(backend)
+    settings.JQGRID_PERFORMANCE = {'JSON_BACKEND': backend}
+
+    rendered = JqGridJSONRenderer().render(DATA)
+
+    assert get_json_backend() == backend
+    assert json.loads(rendered) == json.loads(JSONRenderer().render(DATA))
+    assert b'\\u2028' in rendered
+
+
+def test_stdlib_backend_is_drf_renderer(settings):
+    settings.JQGRID_PERFORMANCE = {'JSON_BACKEND': 'json'}
+
+    assert JqGridJSONRenderer().render(DATA) == JSONRenderer().render(DATA)
+
+
+def test_renderer_is_registered_for_jqgrid_pagination():
+    class GridViewSet(JqGridConfigMixin, viewsets.ModelViewSet):
+        queryset = GridFilter.objects.all()
+        serializer_class = GridFilterSerializer
+        pagination_class = JqGridPagination
+
+    class PlainViewSet(GridViewSet):
+        pagination_class = PageNumberPagination
+
+    assert isinstance(GridViewSet().get_renderers()[0], JqGridJSONRenderer)
+    assert type(PlainViewSet().get_renderers()[0]) is JSONRenderer
@@ -0,0 +1,56 @@
+"""Tests for saved search filter (tmplFilters) loading."""
+
+import pytest
+from django.contrib.auth.models import AnonymousUser, User
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from django_jqgrid.models import GridFilter
+from django_jqgrid.saved_filters import get_template_filters
+from django_jqgrid.views import GridFilterViewSet
+
+
+@pytest.fixture
+def table(db):
+    cache.clear()
+    return ContentType.objects.get_for_model(User)
+
+
+@pytest.fixture
+def owner(table):
+    owner = User.objects.create(username='owner')
+    other = User.objects.create(username='other')
+    GridFilter.objects.create(name='shared', value='{"rules": []}', table=table, is_global=True, created_by=other)
+    GridFilter.objects.create(name='private', value='{"groupOp": "AND"}', table=table, created_by=owner)
+    GridFilter.objects.create(name='hidden', table=table, created_by=other)
+    return owner
+
+
+def test_user_filters_come_before_global_ones_in_one_query(owner, table, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        templates = get_template_filters(table, owner)
+
+    assert templates['tmplNames'] == ['private', 'shared']
+    assert templates['tmplFilters'] == ['{"groupOp": "AND"}', '{"rules": []}']
+    assert get_template_filters(table, AnonymousUser())['tmplNames'] == ['shared']
+
+
+def test_templates_are_cached_until_a_filter_changes(owner, table, django_assert_num_queries):
+    get_template_filters(table, owner)
+    with django_assert_num_queries(0):
+        get_template_filters(table, owner)
+
+    GridFilter.objects.get(name='private').delete()
+
+    assert get_template_filters(table, owner)['tmplNames'] == ['shared']
+
+
+def test_by_table_lists_visible_filters(owner):
+    request = APIRequestFactory().get('/', {'app_name': 'auth', 'model': 'user'})
+    force_authenticate(request, user=owner)
+
+    response = GridFilterViewSet.as_view({'get': 'by_table'})(request)
+
+    assert response.status_code == 200
+    assert [item['name'] for item in response.data['data']['filters']] == ['private', 'shared']
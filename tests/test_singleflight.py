@@ -0,0 +1,121 @@
+"""Tests for single-flight execution of identical grid requests."""
+
+import threading
+import time
+
+from rest_framework import viewsets
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from django_jqgrid.mixins import JqGridConfigMixin
+from django_jqgrid.models import GridFilter
+from django_jqgrid.pagination import JqGridPagination
+from django_jqgrid.serializers import GridFilterSerializer
+from django_jqgrid.singleflight import SingleFlight
+
+
+def run_concurrently(flight, key, fn, callers):
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do(key, fn, timeout=5)))
+        for _ in range(callers)
+    ]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        release.wait(5)
+        return {'records': 3}
+
+    threads, results = run_concurrently(flight, 'grid', compute, callers=4)
+    # Give the followers time to find the flight of the first caller
+    time.sleep(0.2)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert sorted(shared for _, shared in results) == [False, True, True, True]
+    assert all(result == {'records': 3} for result, _ in results)
+    assert not flight.in_flight('grid')
+
+
+def test_waiters_run_the_call_when_the_leader_fails():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+
+    def failing():
+        started.set()
+        release.wait(5)
+        raise RuntimeError('database went away')
+
+    errors = []
+
+    def lead():
+        try:
+            flight.do('grid', failing)
+        except RuntimeError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=lead)
+    leader.start()
+    started.wait(5)
+    follower = []
+    waiter = threading.Thread(target=lambda: follower.append(flight.do('grid', lambda: 'own result', timeout=5)))
+    waiter.start()
+    # Only fail the leader once the follower has joined its flight
+    deadline = time.monotonic() + 5
+    while not (flight.in_flight('grid') and flight.waiting('grid')) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert flight.waiting('grid') == 1
+    release.set()
+    leader.join()
+    waiter.join()
+
+    assert errors
+    assert follower == [('own result', False)]
+
+
+class FlightViewSet(JqGridConfigMixin, viewsets.ModelViewSet):
+    queryset = GridFilter.objects.all()
+    serializer_class = GridFilterSerializer
+    pagination_class = JqGridPagination
+    jqgrid_single_flight = True
+
+
+def test_single_flight_key_covers_viewset_user_and_path(db):
+    factory = APIRequestFactory()
+    request = Request(factory.get('/api/filters/', {'page': 2, 'rows': 10}))
+    view = FlightViewSet(request=request)
+
+    key = view.get_single_flight_key(request)
+
+    assert key == (
+        'tests.test_singleflight.FlightViewSet', 'anon', '/api/filters/', (('page', ('2',)), ('rows', ('10',)))
+    )
+    assert FlightViewSet.as_view({'get': 'list'})(factory.get('/api/filters/')).status_code == 200
+
+    FlightViewSet.jqgrid_single_flight = False
+    try:
+        assert view.get_single_flight_key(request) is None
+    finally:
+        FlightViewSet.jqgrid_single_flight = True
+
+
+def test_single_flight_key_ignores_cache_busters(db):
+    factory = APIRequestFactory()
+    view = FlightViewSet()
+    first = Request(factory.get('/api/filters/?rows=10&page=2&nd=1700000000001'))
+    second = Request(factory.get('/api/filters/?page=2&rows=10&nd=1700000000002&_=17'))
+    other = Request(factory.get('/api/filters/?page=3&rows=10&nd=1700000000003'))
+
+    assert view.get_single_flight_key(first) == view.get_single_flight_key(second)
+    assert view.get_single_flight_key(first) != view.get_single_flight_key(other)